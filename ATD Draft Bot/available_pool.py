@@ -0,0 +1,150 @@
+# available_pool.py
+# The undrafted part of a player pool, maintained in place as picks are made.
+#
+# DraftManager used to rebuild `available_players` by filtering the whole pool
+# against `drafted` on every access, and ai_drafter._pick_windowed re-sorted
+# it by ADP on every pick. AvailablePool keeps the pool fixed and marks
+# drafted players dead instead:
+#   - remove() is O(1) (a flag and a counter, no list shifting)
+#   - iteration is in pool order, skipping drafted players — the same order
+#     the old filtered list had, so the AI draws its jitter identically
+#   - the ADP order is sorted once per pool; adp_indices() walks it lazily,
+#     so the AI's candidate window stops early without sorting anything
+#   - as_list() / indexing use a compact list cached until the next removal
+#   - digest fingerprints the available players and is kept up to date by
+#     remove(), so logging it per pick costs O(1) instead of a sort and a hash
+#     of the whole pool
+#   - key identifies the pool and ADP by content, so a worker process that
+#     already holds the pool only needs the alive flags (alive_flags() /
+#     with_alive()) for each pick
+#
+# Anything that takes `available: list[str]` can be given an AvailablePool.
+
+import hashlib
+import json
+from collections.abc import Iterator
+from itertools import compress
+
+_UNKNOWN_ADP = 9999.0
+_DIGEST_MASK = (1 << 64) - 1
+
+
+def _name_hash(player: str) -> int:
+    return int.from_bytes(hashlib.blake2b(player.encode(), digest_size=8).digest(), "big")
+
+
+class AvailablePool:
+    __slots__ = ("players", "adp", "_slots", "_alive", "_count", "_adp_order", "_list", "_key",
+                 "_hashes", "_digest")
+
+    def __init__(self, players: list[str], adp: dict[str, float],
+                 drafted: set[str] | frozenset = frozenset()):
+        self.players = players                 # full pool, pool order (not copied)
+        self.adp     = adp                     # ADP the order below was built from
+        self._slots: dict[str, list[int]] = {} # name → pool indices (duplicates share a name)
+        for i, p in enumerate(players):
+            self._slots.setdefault(p, []).append(i)
+        self._alive = bytearray(b"\x01") * len(players)
+        self._count = len(players)
+        self._list: list[str] | None = None
+        self._key:  str | None = None
+        self._hashes: list[int] | None = None  # per pool index, built on the first digest
+        self._digest: int | None = None
+        # Stable sort: ADP ties keep pool order, exactly like sorting the list
+        self._adp_order = sorted(range(len(players)),
+                                 key=lambda i: adp.get(players[i], _UNKNOWN_ADP))
+        for p in drafted:
+            self.remove(p)
+
+    def copy(self) -> "AvailablePool":
+        """
+        Independent availability on the same pool: removals on the copy don't
+        affect this one. Only the alive flags are copied (the pool, name slots
+        and ADP order are shared, read-only).
+        """
+        other = AvailablePool.__new__(AvailablePool)
+        other.players, other.adp = self.players, self.adp
+        other._slots, other._adp_order = self._slots, self._adp_order
+        other._alive = bytearray(self._alive)
+        other._count = self._count
+        other._list = self._list
+        other._key = self._key
+        other._hashes, other._digest = self._hashes, self._digest
+        return other
+
+    def with_alive(self, alive: bytes) -> "AvailablePool":
+        """A copy whose availability is `alive` (as returned by alive_flags() on the same pool)."""
+        other = self.copy()
+        other._alive = bytearray(alive)
+        other._count = other._alive.count(1)
+        other._list = None
+        other._digest = None
+        return other
+
+    def alive_flags(self) -> bytes:
+        """One byte per pool slot, 1 if the player is still available."""
+        return bytes(self._alive)
+
+    @property
+    def digest(self) -> str:
+        """
+        Order-independent fingerprint of the available players (16 hex chars):
+        the sum of per-name hashes, so remove() updates it in O(1).
+        """
+        if self._digest is None:
+            if self._hashes is None:
+                self._hashes = [_name_hash(p) for p in self.players]
+            self._digest = sum(compress(self._hashes, self._alive)) & _DIGEST_MASK
+        return f"{self._digest:016x}"
+
+    @property
+    def key(self) -> str:
+        """
+        Content hash of the pool and its ADP, not of availability: the same
+        for every copy, and for the same pool rebuilt in another process.
+        """
+        if self._key is None:
+            h = hashlib.sha1("\n".join(self.players).encode())
+            h.update(json.dumps(sorted(self.adp.items())).encode())
+            self._key = h.hexdigest()[:16]
+        return self._key
+
+    def remove(self, player: str) -> None:
+        """Mark a drafted player unavailable. Unknown or already-removed names are ignored."""
+        for i in self._slots.get(player, ()):
+            if self._alive[i]:
+                self._alive[i] = 0
+                self._count -= 1
+                self._list = None
+                if self._digest is not None:
+                    self._digest = (self._digest - self._hashes[i]) & _DIGEST_MASK
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, player: object) -> bool:
+        return any(self._alive[i] for i in self._slots.get(player, ()))
+
+    def __iter__(self) -> Iterator[str]:
+        return compress(self.players, self._alive)
+
+    def indices(self) -> list[int]:
+        """Pool indices of available players, in pool order."""
+        return list(compress(range(len(self._alive)), self._alive))
+
+    def adp_indices(self) -> Iterator[int]:
+        """Pool indices of available players in raw-ADP order (ties in pool order)."""
+        order = self._adp_order
+        return compress(order, map(self._alive.__getitem__, order))
+
+    def as_list(self) -> list[str]:
+        """Compact list of available players in pool order (cached until the next removal)."""
+        if self._list is None:
+            self._list = list(self)
+        return self._list
+
+    def __getitem__(self, key):
+        return self.as_list()[key]
+
+    def __repr__(self) -> str:
+        return f"AvailablePool({self._count}/{len(self.players)} available)"
@@ -0,0 +1,287 @@
+# benchmark.py
+# Pick-latency benchmark for the AI drafter.
+#
+# Times ai_drafter.pick(), the per-player _effective_adp() call and the global
+# overdue override across pool sizes, team counts and rounds, and measures
+# allocations per pick with tracemalloc. Results can be saved as a baseline and
+# later runs compared against it — any config whose p50 or p99 pick time grows
+# past the threshold fails the run (exit code 1).
+#
+# Draft state is synthetic but realistic: the pool is every known player plus
+# filler names, and for round R the first R-1 rounds are assumed to have gone
+# in straight ADP order, so each sampled pick sees the pool and roster a real
+# team would at that point.
+#
+# Usage:
+#   python benchmark.py                                  # full grid, print table
+#   python benchmark.py --save-baseline bench_baseline.json
+#   python benchmark.py --compare bench_baseline.json --threshold 0.25
+#   python benchmark.py --pools 450 --teams 30 --rounds 1 5 10 --samples 50
+#   python benchmark.py --check-window         # windowed pick (list and AvailablePool) == full scan
+#
+# Timings are machine-specific — save and compare baselines on the same host.
+
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+
+import ai_drafter
+from available_pool import AvailablePool
+from draft_manager import build_snake_order
+from player_data import PLAYER_TIERS, PLAYER_POSITIONS, get_tier
+from team_profile import TeamProfile
+
+DEFAULT_POOLS  = [100, 450, 1000, 2000]
+DEFAULT_TEAMS  = [8, 12, 30, 40]
+DEFAULT_ROUNDS = list(range(1, 11))
+
+
+# ── Synthetic draft state ────────────────────────────────────────────────────
+
+def make_pool(size: int, seed: int = 0) -> tuple[list[str], dict[str, float]]:
+    """Known players first (ADP roughly by tier), then filler names to reach `size`."""
+    rng = random.Random(seed)
+    names = list(dict.fromkeys([*PLAYER_TIERS, *PLAYER_POSITIONS]))
+    names.sort(key=lambda n: get_tier(n) + rng.random())
+    names = names[:size]
+    names += [f"Filler Player {i:04d}" for i in range(size - len(names))]
+    adp = {n: round(i + 1 + rng.uniform(-8, 8), 1) for i, n in enumerate(names)
+           if rng.random() < 0.95}
+    pool = sorted(names, key=lambda n: adp.get(n, ai_drafter._UNKNOWN_ADP))
+    return pool, adp
+
+
+def draft_states(pool: list[str], adp: dict[str, float], num_teams: int,
+                 round_num: int, samples: int):
+    """
+    Yield (team_picks, profile, available, overall_pick) for `samples` picks in
+    `round_num`, assuming earlier rounds went in ADP order.
+    """
+    order = build_snake_order(num_teams)
+    start = (round_num - 1) * num_teams
+    rosters: list[list[str]] = [[] for _ in range(num_teams)]
+    for i, team_idx in enumerate(order[:start]):
+        if i < len(pool):
+            rosters[team_idx].append(pool[i])
+    profiles = [TeamProfile.from_picks(r, adp) for r in rosters]
+    available = pool[start:]
+
+    for k in range(samples):
+        slot = k % num_teams
+        team_idx = order[start + slot]
+        yield rosters[team_idx], profiles[team_idx], available[slot:], start + slot + 1
+
+
+# ── Measurement ──────────────────────────────────────────────────────────────
+
+def _percentile(xs: list[float], q: float) -> float:
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(round(q / 100 * (len(xs) - 1))))]
+
+
+def _best_of(repeat: int, fn) -> float:
+    """Fastest of `repeat` calls in ns — filters scheduler noise out of each sample."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter_ns()
+        fn()
+        dt = time.perf_counter_ns() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def bench_config(pool_size: int, num_teams: int, round_num: int,
+                 samples: int, seed: int = 0, repeat: int = 3) -> dict | None:
+    pool, adp = make_pool(pool_size, seed)
+    if (round_num - 1) * num_teams + 1 > len(pool):
+        return None   # pool runs out before this round
+
+    pick_ms, eff_us, overdue_ms, peak_kib, alloc_kib = [], [], [], [], []
+    random.seed(seed)
+
+    for team_picks, profile, available, overall in draft_states(pool, adp, num_teams, round_num, samples):
+        if not available:
+            continue
+        pick_ms.append(_best_of(repeat, lambda: ai_drafter.pick(
+            team_picks, available, adp, len(pool), overall, num_teams, profile)) / 1e6)
+
+        eff: dict[str, float] = {}
+        eff_us.append(_best_of(repeat, lambda: eff.update(
+            (p, ai_drafter._effective_adp(p, profile, adp)) for p in available)) / 1e3 / len(available))
+
+        overdue_ms.append(_best_of(repeat, lambda: ai_drafter._apply_overdue_override(
+            eff, available, adp, profile.slots, profile.round_num, overall, num_teams)) / 1e6)
+
+        # Allocations in a separate call — tracemalloc slows everything down
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        ai_drafter.pick(team_picks, available, adp, len(pool), overall, num_teams, profile)
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kib.append((peak - before) / 1024)
+        alloc_kib.append((after - before) / 1024)
+
+    if not pick_ms:
+        return None
+    return {
+        "pool":  pool_size,
+        "teams": num_teams,
+        "round": round_num,
+        "n":     len(pick_ms),
+        "pick_p50_ms":    _percentile(pick_ms, 50),
+        "pick_p99_ms":    _percentile(pick_ms, 99),
+        "eff_adp_p50_us": _percentile(eff_us, 50),
+        "overdue_p50_ms": _percentile(overdue_ms, 50),
+        "overdue_p99_ms": _percentile(overdue_ms, 99),
+        "peak_kib":       statistics.mean(peak_kib),
+        "retained_kib":   statistics.mean(alloc_kib),
+    }
+
+
+def check_window(pool_size: int, num_teams: int, round_num: int,
+                 samples: int, seed: int = 0) -> tuple[list[str], int, int]:
+    """
+    Verify the candidate window against a full scan for every sampled pick:
+    the pull-budget floor holds for every player, and both paths choose the
+    same player and (when a trace asks for it) top 5 from the same random state.
+    Returns (problems, players scored by the window, players in the pool).
+    """
+    pool, adp = make_pool(pool_size, seed)
+    if (round_num - 1) * num_teams + 1 > len(pool):
+        return [], 0, 0
+    problems: list[str] = []
+    scored = total = 0
+    rng = random.Random(seed)
+
+    for team_picks, profile, available, overall in draft_states(pool, adp, num_teams, round_num, samples):
+        if not available:
+            continue
+        tag = f"{pool_size}/{num_teams}/R{round_num} pick {overall}"
+        full = ai_drafter.score_available(team_picks, available, adp, overall, num_teams, profile)
+        budget = ai_drafter._pull_budget(profile, overall)
+        for p, e in full.items():
+            if e < adp.get(p, ai_drafter._UNKNOWN_ADP) - budget:
+                problems.append(f"{tag}: {p} eff={e:.1f} below floor (budget {budget:.1f})")
+
+        jitter = ai_drafter._jitter(profile.round_num)
+        state = rng.getstate()
+        random.setstate(state)
+        best_full = min(available, key=lambda p: full[p] + random.uniform(-jitter, jitter))
+        top_full = sorted(available, key=lambda p: full[p])[:5]
+        random.setstate(state)
+        best_win, top_win, _ = ai_drafter._pick_windowed(profile, available, adp, overall, num_teams, jitter, 5)
+        random.setstate(state)
+        live = AvailablePool(pool, adp, set(pool) - set(available))
+        best_ap, top_ap, _ = ai_drafter._pick_windowed(profile, live, adp, overall, num_teams, jitter, 5)
+        random.setstate(state)
+        best_fast, _, eff = ai_drafter._pick_windowed(profile, live, adp, overall, num_teams, jitter)
+        rng.random()
+        if best_win != best_full or top_win != top_full:
+            problems.append(f"{tag}: full chose {best_full}, window chose {best_win}")
+        if best_ap != best_full or top_ap != top_full:
+            problems.append(f"{tag}: full chose {best_full}, AvailablePool window chose {best_ap}")
+        if best_fast != best_full:
+            problems.append(f"{tag}: full chose {best_full}, untraced window chose {best_fast}")
+        scored += len(eff)
+        total += len(available)
+
+    return problems, scored, total
+
+
+def _key(r: dict) -> str:
+    return f"{r['pool']}/{r['teams']}/{r['round']}"
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """Configs whose p50 or p99 pick time regressed by more than `threshold` (fraction)."""
+    base = {_key(r): r for r in baseline}
+    regressions = []
+    for r in results:
+        b = base.get(_key(r))
+        if not b:
+            continue
+        for metric in ("pick_p50_ms", "pick_p99_ms"):
+            if b[metric] > 0 and r[metric] > b[metric] * (1 + threshold):
+                regressions.append(
+                    f"{_key(r):>12}  {metric}: {b[metric]:.2f} → {r[metric]:.2f} ms "
+                    f"(+{(r[metric] / b[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ai_drafter pick latency.")
+    parser.add_argument("--pools", type=int, nargs="+", default=DEFAULT_POOLS)
+    parser.add_argument("--teams", type=int, nargs="+", default=DEFAULT_TEAMS)
+    parser.add_argument("--rounds", type=int, nargs="+", default=DEFAULT_ROUNDS)
+    parser.add_argument("--samples", type=int, default=20, help="picks timed per config")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per sample; the fastest counts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to check against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown vs baseline (0.25 = +25%%)")
+    parser.add_argument("--check-window", action="store_true",
+                        help="verify the candidate window against a full scan instead of timing")
+    args = parser.parse_args()
+
+    if args.check_window:
+        failed = False
+        for pool_size in args.pools:
+            for num_teams in args.teams:
+                problems, scored, total = [], 0, 0
+                for round_num in args.rounds:
+                    p, s, t = check_window(pool_size, num_teams, round_num, args.samples, args.seed)
+                    problems += p
+                    scored += s
+                    total += t
+                if not total:
+                    continue
+                status = "OK" if not problems else f"{len(problems)} mismatches"
+                print(f"{pool_size:>5} pool {num_teams:>3} teams: {status} "
+                      f"(scored {scored / total:.0%} of the pool)")
+                for line in problems[:10]:
+                    print("   ", line)
+                failed |= bool(problems)
+        raise SystemExit(1 if failed else 0)
+
+    print(f"{'pool':>5} {'teams':>5} {'rd':>3} | {'pick p50':>9} {'p99':>8} | "
+          f"{'eff µs':>7} | {'ovd p50':>8} {'p99':>7} | {'peak KiB':>9}")
+    results = []
+    for pool_size in args.pools:
+        for num_teams in args.teams:
+            for round_num in args.rounds:
+                r = bench_config(pool_size, num_teams, round_num, args.samples, args.seed, args.repeat)
+                if r is None:
+                    continue
+                results.append(r)
+                print(f"{r['pool']:>5} {r['teams']:>5} {r['round']:>3} | "
+                      f"{r['pick_p50_ms']:>7.2f}ms {r['pick_p99_ms']:>6.2f}ms | "
+                      f"{r['eff_adp_p50_us']:>7.2f} | "
+                      f"{r['overdue_p50_ms']:>6.2f}ms {r['overdue_p99_ms']:>5.2f}ms | "
+                      f"{r['peak_kib']:>9.1f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"results": results}, f, indent=1)
+        print(f"\n[Bench] Baseline saved → {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n[Bench] {len(regressions)} regression(s) over +{args.threshold:.0%}:")
+            for line in regressions:
+                print("   ", line)
+            raise SystemExit(1)
+        print(f"\n[Bench] No regressions over +{args.threshold:.0%} vs {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,25 @@
 import asyncio
-import difflib
+import random
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import discord
 from discord.ext import commands
 
-from config import DISCORD_TOKEN, DRAFT_CHANNEL_ID, ROUNDS, PICK_TIMEOUT_SECONDS
+from config import (
+    DISCORD_TOKEN, DRAFT_CHANNEL_ID, ROUNDS, PICK_TIMEOUT_SECONDS, WEIGHTS_POLL_SECONDS, AI_TRACE_PICKS,
+    OUTLOOK_TIME_BUDGET, OUTLOOK_MAX_SIMS, OUTLOOK_PLAYERS,
+)
 from draft_manager import DraftManager, DraftState
+from pick_trace import TraceBuffer, format_trace
 from player_data import get_pool_category
 import ai_drafter
+import outlook
 from feedback import db as fdb
 from feedback import proposer as fproposer
 from feedback.analyzer import REASON_LABELS
+from scheduler import SCHEDULER, PRIORITY_LIVE, PRIORITY_SIM
 
 # Candidate emoji names to try for each NBA team (checked in order, case-insensitive).
 # Add more variants here if you upload emojis under different names.
@@ -67,6 +74,13 @@ bot = commands.Bot(command_prefix='!', intents=intents)
 _drafts: dict[int, DraftManager] = {}
 _draft_tasks: dict[int, asyncio.Task] = {}
 
+# Finished drafts are persisted (Sheets tab + feedback DB) on these threads so
+# the OAuth/Sheets round-trips never stall other drafts on the event loop.
+_result_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="result-writer")
+_report_tasks: set[asyncio.Task] = set()   # strong refs until each report is sent
+_weights_watcher = None   # ai_drafter.watch_weights(), started in on_ready
+_last_traces: dict[int, TraceBuffer] = {}   # channel → pick traces of its last finished draft
+
 
 # ── Channel guard ─────────────────────────────────────────────────────────────
 
@@ -101,14 +115,78 @@ def _save_draft_to_db(dm: DraftManager, started_by: str | None = None) -> int |
     """Persist all team rosters to the feedback DB. Returns draft_id or None on error."""
     try:
         teams = {team.name: list(team.picks) for team in dm.teams}
-        return fdb.save_draft(num_teams=len(dm.teams), teams=teams, started_by=started_by)
+        return fdb.save_draft(num_teams=len(dm.teams), teams=teams, started_by=started_by,
+                              events=dm.events, pool=(dm.player_pool, dm.player_adp),
+                              weights_version=dm.weights_version)
     except Exception as exc:
         print(f"[Feedback] Failed to save draft: {exc}")
         return None
 
 
+def _remember_weights(w) -> None:
+    """Store the values behind w.version so drafts stamped with it can be traced."""
+    try:
+        fdb.save_weight_set(w.version, w.to_dict())
+    except Exception as exc:
+        print(f"[Feedback] Failed to store weight set {w.version}: {exc}")
+
+
+def _persist_results(dm: DraftManager) -> tuple[str | None, str | None, int | None]:
+    """
+    Worker-thread body: write the results tab, then save rosters for review.
+    Returns (tab, error, draft_id); the DB save runs even if the sheet write fails.
+    """
+    tab = error = None
+    try:
+        tab = dm.write_results()
+    except Exception as e:
+        error = str(e)
+    draft_id = _save_draft_to_db(dm, started_by=dm.started_by)
+    return tab, error, draft_id
+
+
+async def _report_results(channel: discord.TextChannel, job: asyncio.Future) -> None:
+    """Post the outcome of a background _persist_results job when it finishes."""
+    tab, error, draft_id = await job
+    if tab:
+        await channel.send(f"📋 Results saved to tab **`{tab}`**.")
+    else:
+        await channel.send(f"❌ Failed to write results: {error}")
+    if draft_id:
+        await channel.send(
+            f"📊 Draft #{draft_id} saved for review. "
+            f"Run `!draftreview` when ready to evaluate teams."
+        )
+
+
+async def _finish_draft(channel: discord.TextChannel, dm: DraftManager, label: str) -> None:
+    """Shared end of _run_draft / _run_draft_sim: queue persistence, show rosters, free the slot."""
+    dm.state = DraftState.COMPLETE
+    await channel.send(f"✅ **{label} complete!** Writing results to Google Sheets…")
+
+    job = asyncio.get_running_loop().run_in_executor(_result_writer, _persist_results, dm)
+    task = asyncio.create_task(_report_results(channel, job))
+    _report_tasks.add(task)
+    task.add_done_callback(_report_tasks.discard)
+
+    # Show final rosters
+    for team in dm.teams:
+        embed = discord.Embed(title=f"{team.emoji} {team.name}", color=0x2ecc71)
+        owner_tag = "🤖 AI" if team.is_ai else f"<@{team.owner_id}>"
+        embed.set_author(name=owner_tag)
+        for i, p in enumerate(team.picks, 1):
+            embed.add_field(name=f"Pick {i}", value=p, inline=True)
+        await channel.send(embed=embed)
+
+    # Clean up — free the slot so a new draft can start in this thread
+    _remove_draft(channel.id)
+
+
 def _remove_draft(channel_id: int) -> None:
-    _drafts.pop(channel_id, None)
+    dm = _drafts.pop(channel_id, None)
+    if dm is not None and len(dm.traces):
+        _last_traces[channel_id] = dm.traces   # !whypick still works after the draft
+    SCHEDULER.forget(channel_id)
     task = _draft_tasks.pop(channel_id, None)
     if task and not task.done():
         task.cancel()
@@ -116,19 +194,6 @@ def _remove_draft(channel_id: int) -> None:
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
-def _resolve_player(text: str, pool: list[str], cutoff: float = 0.6) -> str | None:
-    """
-    Fuzzy-match `text` against `pool`.
-    Returns the best match or None if confidence is below `cutoff`.
-    """
-    text = text.strip()
-    for name in pool:
-        if name.lower() == text.lower():
-            return name
-    matches = difflib.get_close_matches(text, pool, n=1, cutoff=cutoff)
-    return matches[0] if matches else None
-
-
 def _parse_pick_message(content: str) -> str | None:
     """
     Extract player name from a pick message of the form:
@@ -197,14 +262,21 @@ async def _run_draft(channel: discord.TextChannel, dm: DraftManager):
         # ── AI pick ──────────────────────────────────────────────────────
         if team.is_ai:
             await asyncio.sleep(2)   # brief pause for realism
-            player = ai_drafter.pick(
+            seed, w = random.getrandbits(32), ai_drafter.W
+            trace = [] if dm.traces.enabled else None
+            player = await SCHEDULER.pick(
+                channel.id, PRIORITY_LIVE,
                 team.picks, available,
                 player_adp=dm.player_adp,
                 pool_size=len(dm.player_pool),
                 overall_pick=dm.pick_number,
                 num_teams=dm.total_teams,
+                profile=team.profile,
+                seed=seed,
+                weights=w,
+                trace=trace,
             )
-            dm.record_pick(player)
+            dm.record_pick(player, source="ai", seed=seed, weights_version=w.version, trace=trace)
             print(f"[Draft:{channel.id}] Pick #{pick_num:>3} | AI   | {team.name:<28} | {player}")
             await _announce_pick(channel, pick_num, team, player)
             continue
@@ -247,13 +319,13 @@ async def _run_draft(channel: discord.TextChannel, dm: DraftManager):
             # near-exact) match in the available pool is never incorrectly
             # flagged as a different already-drafted player with a similar name
             # (e.g. "Gus Johnson" being fuzzy-matched to "Marques Johnson").
-            player = _resolve_player(raw_name, available)
+            player = dm.resolve_available(raw_name)
             if player:
                 # Valid pick — exit loop
                 break
 
             # Not in the available pool — check if it's already drafted
-            already = _resolve_player(raw_name, list(dm.drafted), cutoff=0.75)
+            already = dm.resolve_drafted(raw_name)
             if already:
                 await channel.send(
                     f"❌ **{already}** has already been drafted. Please choose another player."
@@ -265,46 +337,19 @@ async def _run_draft(channel: discord.TextChannel, dm: DraftManager):
             )
 
         if player:
-            dm.record_pick(player)
+            dm.record_pick(player, source="human")
             print(f"[Draft:{channel.id}] Pick #{pick_num:>3} | Human | {team.name:<28} | {player}")
             await _announce_pick(channel, pick_num, team, player)
         else:
-            player = ai_drafter.pick(team.picks, available, player_adp=dm.player_adp, pool_size=len(dm.player_pool), overall_pick=dm.pick_number, num_teams=dm.total_teams)
-            dm.record_pick(player)
+            seed, w = random.getrandbits(32), ai_drafter.W
+            trace = [] if dm.traces.enabled else None
+            player = await SCHEDULER.pick(channel.id, PRIORITY_LIVE, team.picks, available, player_adp=dm.player_adp, pool_size=len(dm.player_pool), overall_pick=dm.pick_number, num_teams=dm.total_teams, profile=team.profile, seed=seed, weights=w, trace=trace)
+            dm.record_pick(player, source="auto", seed=seed, weights_version=w.version, trace=trace)
             print(f"[Draft:{channel.id}] Pick #{pick_num:>3} | Auto  | {team.name:<28} | {player} (timeout)")
             await _announce_pick(channel, pick_num, team, player, auto=True)
 
     # ── Draft complete ────────────────────────────────────────────────────
-    dm.state = DraftState.COMPLETE
-    await channel.send("✅ **Draft complete!** Writing results to Google Sheets…")
-
-    try:
-        tab = dm.write_results()
-        await channel.send(f"📋 Results saved to tab **`{tab}`**.")
-    except Exception as e:
-        await channel.send(f"❌ Failed to write results: {e}")
-
-    draft_id = _save_draft_to_db(dm, started_by=dm.started_by)
-    if draft_id:
-        await channel.send(
-            f"📊 Draft #{draft_id} saved for review. "
-            f"Run `!draftreview` when ready to evaluate teams."
-        )
-
-    # Show final rosters
-    for team in dm.teams:
-        embed = discord.Embed(
-            title=f"{team.emoji} {team.name}",
-            color=0x2ecc71,
-        )
-        owner_tag = "🤖 AI" if team.is_ai else f"<@{team.owner_id}>"
-        embed.set_author(name=owner_tag)
-        for i, p in enumerate(team.picks, 1):
-            embed.add_field(name=f"Pick {i}", value=p, inline=True)
-        await channel.send(embed=embed)
-
-    # Clean up — free the slot so a new draft can start in this thread
-    _remove_draft(channel.id)
+    await _finish_draft(channel, dm, "Draft")
 
 
 async def _run_draft_sim(channel: discord.TextChannel, dm: DraftManager):
@@ -325,42 +370,25 @@ async def _run_draft_sim(channel: discord.TextChannel, dm: DraftManager):
             )
 
         available = dm.available_players
-        player = ai_drafter.pick(
+        seed, w = random.getrandbits(32), ai_drafter.W
+        trace = [] if dm.traces.enabled else None
+        player = await SCHEDULER.pick(
+            channel.id, PRIORITY_SIM,
             team.picks, available,
             player_adp=dm.player_adp,
             pool_size=len(dm.player_pool),
             overall_pick=dm.pick_number,
             num_teams=dm.total_teams,
+            profile=team.profile,
+            seed=seed,
+            weights=w,
+            trace=trace,
         )
-        dm.record_pick(player)
+        dm.record_pick(player, source="ai", seed=seed, weights_version=w.version, trace=trace)
         print(f"[Sim:{channel.id}] Pick #{pick_num:>3} | {team.name:<28} | {player}")
         await _announce_pick(channel, pick_num, team, player)
 
-    dm.state = DraftState.COMPLETE
-    await channel.send("✅ **Sim complete!** Writing results to Google Sheets…")
-
-    try:
-        tab = dm.write_results()
-        await channel.send(f"📋 Results saved to tab **`{tab}`**.")
-    except Exception as e:
-        await channel.send(f"❌ Failed to write results: {e}")
-
-    draft_id = _save_draft_to_db(dm, started_by=dm.started_by)
-    if draft_id:
-        await channel.send(
-            f"📊 Draft #{draft_id} saved for review. "
-            f"Run `!draftreview` when ready to evaluate teams."
-        )
-
-    for team in dm.teams:
-        embed = discord.Embed(title=f"{team.emoji} {team.name}", color=0x2ecc71)
-        owner_tag = "🤖 AI" if team.is_ai else f"<@{team.owner_id}>"
-        embed.set_author(name=owner_tag)
-        for i, p in enumerate(team.picks, 1):
-            embed.add_field(name=f"Pick {i}", value=p, inline=True)
-        await channel.send(embed=embed)
-
-    _remove_draft(channel.id)
+    await _finish_draft(channel, dm, "Sim")
 
 
 # ── Commands ─────────────────────────────────────────────────────────────────
@@ -516,9 +544,10 @@ async def draft_cmd(ctx: commands.Context):
                         _remove_draft(ctx.channel.id)
                         return
 
-    await ctx.send("⏳ Loading player pool from Google Sheets…")
+    await ctx.send("⏳ Loading player pool…")
     try:
-        count = dm.load_player_pool()
+        # Cached snapshot returns immediately; a first-ever load downloads the tab
+        count = await asyncio.to_thread(dm.load_player_pool)
         if count == 0:
             await ctx.send("❌ Player pool is empty — check the spreadsheet tab name.")
             _remove_draft(ctx.channel.id)
@@ -630,10 +659,16 @@ async def draft_skip(ctx: commands.Context):
         await asyncio.sleep(0)   # yield so the cancelled task can clean up
 
     await ctx.send("⏩ **Skipping to end** — simming all remaining picks with AI…")
+    if not SCHEDULER.sim_slot_free():
+        await ctx.send(
+            f"⏳ {SCHEDULER.sims_running} sims already running — "
+            f"this one starts when a slot frees up."
+        )
 
     async def _run_sim_safe():
         try:
-            await _run_draft_sim(ctx.channel, dm)
+            async with SCHEDULER.sim_slot():
+                await _run_draft_sim(ctx.channel, dm)
         except asyncio.CancelledError:
             pass
         except Exception as exc:
@@ -679,16 +714,133 @@ async def draft_status(ctx: commands.Context):
     embed.add_field(name="On the Clock", value=f"{team.emoji} **{team.name}**", inline=True)
     embed.add_field(name="Type", value="🤖 AI pick" if team.is_ai else f"👤 <@{team.owner_id}>", inline=True)
     embed.add_field(name="Players Left", value=f"**{remaining}** available", inline=True)
+
+    lat = SCHEDULER.draft_summary(ctx.channel.id)
+    if lat:
+        embed.add_field(
+            name="AI Pick Latency",
+            value=f"last **{lat['last_ms']:.0f}ms** · p50 {lat['p50_ms']:.0f}ms · "
+                  f"max {lat['max_ms']:.0f}ms\ncompute {lat['compute_ms']:.0f}ms avg "
+                  f"over {lat['picks']} picks",
+            inline=False,
+        )
+    embed.add_field(
+        name="Scheduler",
+        value=f"**{SCHEDULER.queue_depth}** queued · {SCHEDULER.busy}/{SCHEDULER.workers} workers busy · "
+              f"sims {SCHEDULER.sims_running}/{SCHEDULER.max_sims} running, {SCHEDULER.sims_waiting} waiting",
+        inline=False,
+    )
     embed.add_field(name="\u200b", value=started_label, inline=False)
     await ctx.send(embed=embed)
 
 
+@bot.command(name='whypick')
+async def whypick_cmd(ctx: commands.Context, pick_number: int = None):
+    """Explain an AI pick from this channel's current or last draft."""
+    if not _is_draft_channel(ctx.channel):
+        return
+    if AI_TRACE_PICKS <= 0:
+        await ctx.send("Pick tracing is off. Set `AI_TRACE_PICKS` (e.g. `300`) and restart the bot to enable `!whypick`.")
+        return
+    dm = _drafts.get(ctx.channel.id)
+    traces = dm.traces if dm is not None and len(dm.traces) else _last_traces.get(ctx.channel.id)
+    if not traces:
+        await ctx.send("No traced AI picks in this channel yet.")
+        return
+    picks = traces.picks()
+    if pick_number is None:
+        await ctx.send(f"Usage: `!whypick <pick number>` — traced AI picks: #{picks[0]}–#{picks[-1]}.")
+        return
+    trace = traces.get(pick_number)
+    if trace is None:
+        await ctx.send(f"No trace for pick #{pick_number} — it was a human pick or is older than the "
+                       f"last {traces.size} traced AI picks (#{picks[0]}–#{picks[-1]} available).")
+        return
+    await ctx.send(format_trace(trace)[:2000])
+
+
+_outlook_running: set[int] = set()   # channels with an !outlook being computed
+
+
+@bot.command(name='outlook')
+async def outlook_cmd(ctx: commands.Context, *, players: str = None):
+    """Estimate which players will still be available at your next pick."""
+    if not _is_draft_channel(ctx.channel):
+        return
+    dm = _drafts.get(ctx.channel.id)
+    if dm is None or dm.state != DraftState.ACTIVE:
+        await ctx.send("No active draft in this channel.")
+        return
+    owned = [i for i, t in enumerate(dm.teams) if t.owner_id == ctx.author.id]
+    if not owned:
+        await ctx.send("You don't have a team in this draft.")
+        return
+    jobs = [j for j in (outlook.snapshot(dm, i) for i in owned) if j is not None]
+    if not jobs:
+        await ctx.send("You're on the clock now — or have no picks left.")
+        return
+    job = min(jobs, key=lambda j: j.next_pick)   # multi-team: the soonest of your next turns
+    team = dm.teams[job.team_slot]
+
+    if players:
+        names, unknown = [], []
+        for text in filter(None, (p.strip() for p in players.split(","))):
+            name = dm.resolve_available(text)
+            if name is None:
+                unknown.append(text)
+            elif name not in names:
+                names.append(name)
+        if unknown:
+            await ctx.send(f"Not in the available pool: {', '.join(unknown)}")
+        if not names:
+            return
+    else:
+        # Everyone who could plausibly fall to you: the picks ahead plus the list length
+        names = outlook.top_available(job, len(job.window) + OUTLOOK_PLAYERS)
+
+    if ctx.channel.id in _outlook_running:
+        await ctx.send("An outlook is already being computed in this channel — try again in a moment.")
+        return
+    _outlook_running.add(ctx.channel.id)
+    try:
+        result = await SCHEDULER.run(PRIORITY_SIM, outlook.run, job, names,
+                                     OUTLOOK_TIME_BUDGET, OUTLOOK_MAX_SIMS, SCHEDULER.engine)
+    except Exception as exc:
+        print(f"[Outlook:{ctx.channel.id}] Failed: {exc}")
+        await ctx.send("Couldn't compute an outlook right now.")
+        return
+    finally:
+        _outlook_running.discard(ctx.channel.id)
+
+    shown = names if players else [p for p in names if result.survival[p] >= 0.01][:OUTLOOK_PLAYERS]
+    lines = []
+    for p in shown:
+        share = result.survival[p]
+        dot = "🟢" if share >= 0.7 else "🟡" if share >= 0.3 else "🔴"
+        adp = dm.player_adp.get(p)
+        lines.append(f"{dot} **{p}** — {share:.0%}" + (f" · ADP {adp:.1f}" if adp is not None else ""))
+    if not lines:
+        lines.append("Nobody in range is likely to last — expect to take whoever is left.")
+
+    embed = discord.Embed(
+        title=f"🔮 Outlook — {team.emoji} {team.name}",
+        description=f"Your next pick is **#{result.next_pick}**, "
+                    f"{result.picks_before} pick{'s' if result.picks_before != 1 else ''} away.\n\n"
+                    + "\n".join(lines),
+        color=0x9b59b6,
+    )
+    embed.set_footer(text=f"Chance each player is still available · {result.sims} simulations"
+                          + ("" if result.complete else " (time limit — partial)")
+                          + " · every other team, human or AI, is simulated as the AI")
+    await ctx.send(embed=embed)
+
+
 @bot.command(name='drafthistory')
 async def draft_history(ctx: commands.Context):
     """Show the last 10 completed drafts."""
     if not _is_draft_channel(ctx.channel):
         return
-    rows = fdb.get_draft_history(limit=10)
+    rows = await asyncio.to_thread(fdb.get_draft_history, limit=10)
     if not rows:
         await ctx.send("No drafts recorded yet.")
         return
@@ -862,6 +1014,18 @@ async def draft_help(ctx: commands.Context):
         inline=False,
     )
 
+    e.add_field(
+        name="🔎 `!whypick <n>`",
+        value="Explain AI pick number **n** in this channel's current or last draft — the top candidates and which rules moved each one. Needs pick tracing (`AI_TRACE_PICKS`) switched on.",
+        inline=False,
+    )
+
+    e.add_field(
+        name="🔮 `!outlook` / `!outlook <player>, <player>`",
+        value="Simulate the picks before your next turn and show how likely each top player is to still be there. Name players (comma-separated) to check just them.",
+        inline=False,
+    )
+
     e.add_field(
         name="📜 `!drafthistory`",
         value="Shows the last 10 completed drafts — date, number of teams, who started it, and whether it's been reviewed.",
@@ -1024,7 +1188,7 @@ class _RejectReasonsView(discord.ui.View):
             await interaction.response.send_message("Not your review session.", ephemeral=True)
             return
         reasons = list(self._selected) or ["no_reason_given"]
-        fdb.record_verdict(self._team_draft_id, "rejected", reasons, str(interaction.user))
+        await asyncio.to_thread(fdb.record_verdict, self._team_draft_id, "rejected", reasons, str(interaction.user))
         await interaction.response.edit_message(
             content=f"❌ Rejected. Reasons: {', '.join(REASON_LABELS.get(r, r) for r in reasons)}",
             view=None,
@@ -1046,7 +1210,7 @@ class _TeamReviewView(discord.ui.View):
         if interaction.user.id != self._reviewer_id:
             await interaction.response.send_message("Not your review session.", ephemeral=True)
             return
-        fdb.record_verdict(self._team_draft_id, "approved", [], str(interaction.user))
+        await asyncio.to_thread(fdb.record_verdict, self._team_draft_id, "approved", [], str(interaction.user))
         await interaction.response.edit_message(content="✅ Approved!", view=None)
         await _advance_review(interaction.channel, _active_reviews.get(interaction.channel.id))
 
@@ -1073,17 +1237,17 @@ async def _advance_review(channel, session: dict | None):
     draft_id    = session["draft_id"]
     reviewer_id = session["reviewer_id"]
 
-    team = fdb.get_unreviewed_team(draft_id)
+    team = await asyncio.to_thread(fdb.get_unreviewed_team, draft_id)
     if team is None:
         # All teams reviewed — run analysis
         _active_reviews.pop(channel.id, None)
-        fdb.set_draft_status(draft_id, "reviewed")
-        summary = fdb.get_review_summary(draft_id)
+        await asyncio.to_thread(fdb.set_draft_status, draft_id, "reviewed")
+        summary = await asyncio.to_thread(fdb.get_review_summary, draft_id)
         await channel.send(fproposer.format_summary_message(draft_id, summary))
 
-        proposals = fproposer.build_proposals(draft_id)
+        proposals = await asyncio.to_thread(fproposer.build_proposals, draft_id)
         if proposals:
-            proposal_id = fdb.save_proposal(draft_id, proposals)
+            proposal_id = await asyncio.to_thread(fdb.save_proposal, draft_id, proposals)
             await channel.send(fproposer.format_proposals_message(proposals, proposal_id))
         else:
             await channel.send("✅ No weight changes needed from this draft — signals within normal range.")
@@ -1104,12 +1268,12 @@ async def draftreview_cmd(ctx: commands.Context, draft_id: int = 0):
     Usage: !draftreview [draft_id]
     """
     if draft_id == 0:
-        draft_id = fdb.get_latest_draft_id()
+        draft_id = await asyncio.to_thread(fdb.get_latest_draft_id)
         if draft_id is None:
             await ctx.send("No drafts saved yet. Run a draft first.")
             return
 
-    status = fdb.get_draft_status(draft_id)
+    status = await asyncio.to_thread(fdb.get_draft_status, draft_id)
     if status is None:
         await ctx.send(f"Draft #{draft_id} not found.")
         return
@@ -1123,13 +1287,13 @@ async def draftreview_cmd(ctx: commands.Context, draft_id: int = 0):
         await ctx.send("A review session for a different draft is already active in this channel.")
         return
 
-    teams = fdb.get_draft_teams(draft_id)
+    teams = await asyncio.to_thread(fdb.get_draft_teams, draft_id)
     total      = len(teams)
     unreviewed = sum(1 for t in teams if t["verdict"] is None)
     resuming   = existing is not None
 
     _active_reviews[ctx.channel.id] = {"draft_id": draft_id, "reviewer_id": ctx.author.id}
-    fdb.set_draft_status(draft_id, "reviewing")
+    await asyncio.to_thread(fdb.set_draft_status, draft_id, "reviewing")
 
     prefix = "▶️ **Resuming**" if resuming else "📋 **Reviewing**"
     await ctx.send(
@@ -1145,14 +1309,16 @@ async def confirmweights_cmd(ctx: commands.Context):
     if not _has_weight_role(ctx.author):
         await ctx.send("❌ You need the **ATD Bot Developer** or **ATD Bot Tester** role to change weights.")
         return
-    pending = fdb.get_pending_proposal()
+    pending = await asyncio.to_thread(fdb.get_pending_proposal)
     if not pending:
         await ctx.send("No pending weight proposals. Run `!draftreview` first.")
         return
 
-    applied = fproposer.apply_proposals(
-        pending["id"], pending["proposals"], draft_id=pending["draft_id"]
+    applied = await asyncio.to_thread(
+        fproposer.apply_proposals,
+        pending["id"], pending["proposals"], draft_id=pending["draft_id"],
     )
+    await asyncio.to_thread(_remember_weights, ai_drafter.W)
     if applied:
         await ctx.send(
             f"✅ **{len(applied)} weight(s) updated:**\n" + "\n".join(applied)
@@ -1170,16 +1336,18 @@ async def skipweights_cmd(ctx: commands.Context, *indices: int):
     if not _has_weight_role(ctx.author):
         await ctx.send("❌ You need the **ATD Bot Developer** or **ATD Bot Tester** role to change weights.")
         return
-    pending = fdb.get_pending_proposal()
+    pending = await asyncio.to_thread(fdb.get_pending_proposal)
     if not pending:
         await ctx.send("No pending weight proposals.")
         return
 
-    applied = fproposer.apply_proposals(
+    applied = await asyncio.to_thread(
+        fproposer.apply_proposals,
         pending["id"], pending["proposals"],
         skip_indices=list(indices),
         draft_id=pending["draft_id"],
     )
+    await asyncio.to_thread(_remember_weights, ai_drafter.W)
     skipped = len(pending["proposals"]) - len(applied)
     await ctx.send(
         f"✅ Applied {len(applied)} change(s), skipped {skipped}.\n" +
@@ -1197,7 +1365,7 @@ async def setweight_cmd(ctx: commands.Context, index: int, value: float):
     if not _has_weight_role(ctx.author):
         await ctx.send("❌ You need the **ATD Bot Developer** or **ATD Bot Tester** role to change weights.")
         return
-    pending = fdb.get_pending_proposal()
+    pending = await asyncio.to_thread(fdb.get_pending_proposal)
     if not pending:
         await ctx.send("No pending weight proposals.")
         return
@@ -1210,14 +1378,7 @@ async def setweight_cmd(ctx: commands.Context, index: int, value: float):
         (value - proposals[index - 1]["old_value"]) / proposals[index - 1]["old_value"] * 100, 1
     )
     # Re-save the updated proposals list
-    import json
-    with __import__("sqlite3").connect(__import__("os").path.join(
-        __import__("os").path.dirname(__file__), "draft_feedback.db"
-    )) as con:
-        con.execute(
-            "UPDATE weight_proposals SET proposals = ? WHERE id = ?",
-            (json.dumps(proposals), pending["id"]),
-        )
+    await asyncio.to_thread(fdb.update_proposal, pending["id"], proposals)
     p = proposals[index - 1]
     await ctx.send(
         f"Updated proposal #{index}: `{p['key']}` → **{value}**\n"
@@ -1231,11 +1392,11 @@ async def cancelweights_cmd(ctx: commands.Context):
     if not _has_weight_role(ctx.author):
         await ctx.send("❌ You need the **ATD Bot Developer** or **ATD Bot Tester** role to change weights.")
         return
-    pending = fdb.get_pending_proposal()
+    pending = await asyncio.to_thread(fdb.get_pending_proposal)
     if not pending:
         await ctx.send("No pending weight proposals.")
         return
-    fdb.cancel_proposal(pending["id"])
+    await asyncio.to_thread(fdb.cancel_proposal, pending["id"])
     await ctx.send("🗑️ Weight proposals cancelled.")
 
 
@@ -1246,7 +1407,8 @@ async def currentweights_cmd(ctx: commands.Context):
     lines = [f"`{k}`: **{v}**" for k, v in w.items()]
     # Split into two columns for readability
     half = len(lines) // 2
-    embed = discord.Embed(title="⚙️ Current AI Draft Weights", color=0x95a5a6)
+    embed = discord.Embed(title="⚙️ Current AI Draft Weights", color=0x95a5a6,
+                          description=f"Version `{w.version}`")
     embed.add_field(name="Penalties & Bonuses (1)", value="\n".join(lines[:half]), inline=True)
     embed.add_field(name="Penalties & Bonuses (2)", value="\n".join(lines[half:]), inline=True)
     await ctx.send(embed=embed)
@@ -1255,7 +1417,7 @@ async def currentweights_cmd(ctx: commands.Context):
 @bot.command(name='weighthistory')
 async def weighthistory_cmd(ctx: commands.Context):
     """Show the last 15 weight changes."""
-    history = fdb.get_weight_history(limit=15)
+    history = await asyncio.to_thread(fdb.get_weight_history, limit=15)
     if not history:
         await ctx.send("No weight changes recorded yet.")
         return
@@ -1269,7 +1431,13 @@ async def weighthistory_cmd(ctx: commands.Context):
 
 @bot.event
 async def on_ready():
-    fdb.init_db()
+    global _weights_watcher
+    await asyncio.to_thread(fdb.init_db)
+    await asyncio.to_thread(_remember_weights, ai_drafter.W)
+    # on_ready fires again after reconnects — start the watcher once
+    if _weights_watcher is None and WEIGHTS_POLL_SECONDS > 0:
+        _weights_watcher = ai_drafter.watch_weights(WEIGHTS_POLL_SECONDS, on_reload=_remember_weights)
+        print(f"[Weights] Watching weights.json every {WEIGHTS_POLL_SECONDS:g}s (version {ai_drafter.W.version})")
     print(f"✅ ATD Draft Bot ready — logged in as {bot.user}")
 
 
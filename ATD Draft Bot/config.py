@@ -15,5 +15,37 @@ OUTPUT_SPREADSHEET_ID  = os.getenv('OUTPUT_SPREADSHEET_ID')
 
 SERVICE_ACCOUNT_FILE   = 'service_account.json'
 
+# Local player-pool snapshots (see pool_cache.py). POOL_OFFLINE=1 never contacts
+# the sheet and drafts from the cached snapshot only.
+POOL_CACHE_FILE        = os.getenv('POOL_CACHE_FILE', 'pool_cache.json')
+POOL_OFFLINE           = os.getenv('POOL_OFFLINE', '0') == '1'
+
+# AI scoring engine: 'scalar' (ai_drafter) or 'vector' (vector_drafter, needs numpy)
+AI_ENGINE              = os.getenv('AI_ENGINE', 'scalar')
+
+# Scalar engine: score only the ADP window that can still win the pick ('1'),
+# or every available player ('0'). Both choose the same player.
+AI_CANDIDATE_WINDOW    = os.getenv('AI_CANDIDATE_WINDOW', '1') == '1'
+
+# Pick scheduler (see scheduler.py): worker processes for AI picks, and how many
+# !draftskip sims may run at once (the rest wait for a slot).
+PICK_WORKERS           = int(os.getenv('PICK_WORKERS', str(min(4, os.cpu_count() or 1))))
+MAX_CONCURRENT_SIMS    = int(os.getenv('MAX_CONCURRENT_SIMS', '2'))
+
+# How often the bot checks weights.json for edits and hot-reloads it (seconds,
+# 0 = never; !confirmweights still reloads immediately).
+WEIGHTS_POLL_SECONDS   = float(os.getenv('WEIGHTS_POLL_SECONDS', '5'))
+
+# Pick explanations for !whypick (see pick_trace.py): how many recent AI picks
+# per draft keep a per-rule breakdown (0 = off), and how many candidates each.
+AI_TRACE_PICKS         = int(os.getenv('AI_TRACE_PICKS', '0'))
+AI_TRACE_TOP_K         = int(os.getenv('AI_TRACE_TOP_K', '5'))
+
+# !outlook (see outlook.py): time budget per request (seconds), the most
+# simulations to run within it, and how many top available players to report.
+OUTLOOK_TIME_BUDGET    = float(os.getenv('OUTLOOK_TIME_BUDGET', '2'))
+OUTLOOK_MAX_SIMS       = int(os.getenv('OUTLOOK_MAX_SIMS', '200'))
+OUTLOOK_PLAYERS        = int(os.getenv('OUTLOOK_PLAYERS', '15'))
+
 ROUNDS = 10
 PICK_TIMEOUT_SECONDS = 120    # 30 seconds
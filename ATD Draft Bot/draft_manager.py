@@ -2,21 +2,29 @@
 # Manages all state for a single ATD draft session.
 # Handles snake order, pick recording, and writing results to Google Sheets.
 
+import csv
+import hashlib
+import json
 import random
 import re
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
 import gspread
-import gspread.utils
 from oauth2client.service_account import ServiceAccountCredentials
 
 from config import (
     POOL_SPREADSHEET_ID, POOL_TAB_NAME,
-    OUTPUT_SPREADSHEET_ID, SERVICE_ACCOUNT_FILE, ROUNDS,
+    OUTPUT_SPREADSHEET_ID, SERVICE_ACCOUNT_FILE, ROUNDS, POOL_OFFLINE,
 )
+from pool_cache import POOL_CACHE, PoolSnapshot
+from available_pool import AvailablePool
+from name_index import NameIndex
+from pick_trace import PickTrace, TraceBuffer
+from team_profile import TeamProfile
 
 # ── Google Sheets scope ──────────────────────────────────────────────────────
 _SCOPE = [
@@ -25,6 +33,42 @@ _SCOPE = [
     'https://www.googleapis.com/auth/drive',
 ]
 
+_gc: gspread.Client | None = None
+
+
+def _client() -> gspread.Client:
+    """One authorized gspread client per process, reused across drafts."""
+    global _gc
+    if _gc is None:
+        creds = ServiceAccountCredentials.from_json_keyfile_name(SERVICE_ACCOUNT_FILE, _SCOPE)
+        _gc   = gspread.authorize(creds)
+    return _gc
+
+
+def _sheet_revision(ss) -> str | None:
+    """Drive modifiedTime of the spreadsheet, or None if it can't be read."""
+    try:
+        if hasattr(ss, "get_lastUpdateTime"):   # gspread 6
+            return ss.get_lastUpdateTime()
+        return ss.lastUpdateTime                # gspread 5
+    except Exception as e:
+        print(f"[Pool] Could not read sheet revision: {e}")
+        return None
+
+
+def fetch_pool_snapshot(known_revision: str | None = None) -> PoolSnapshot | None:
+    """
+    Download the pool tab. Returns None without downloading the worksheet if
+    the sheet's revision still matches `known_revision`.
+    """
+    ss  = _client().open_by_key(POOL_SPREADSHEET_ID)
+    rev = _sheet_revision(ss)
+    if rev is not None and rev == known_revision:
+        return None
+    rows = ss.worksheet(POOL_TAB_NAME).get_all_values()   # full grid — small enough to fetch at once
+    names, adp = parse_pool_rows(rows)
+    return PoolSnapshot(players=names, adp=adp, revision=rev, fetched_at=time.time())
+
 # ── Sheet layout (mirrors ATD Team Sheet Bot) ────────────────────────────────
 # Each team section occupies 11 rows:
 #   +0  Team Name header
@@ -88,6 +132,127 @@ NBA_TEAMS = [
 ]
 
 
+# Snake draft order (rounds 1-10)
+#
+# Standard snake alternates F/B every round (R1→, R2←, R3→ …).
+# The "flip" at R3 and R6 means those rounds go ← again instead of →,
+# shifting the back-to-back to the top pick on R4 and R7.
+#
+# Direction by round (1-indexed):
+#   R1 →  R2 ←  R3 ← (flip)  R4 →  R5 ←  R6 ← (flip)  R7 →  R8 ←  R9 →  R10 ←
+#
+# As a bool list (True = reversed 30→1, False = forward 1→30):
+_REVERSED = [False, True, True, False, True, True, False, True, False, True]
+
+
+def pool_hash(players) -> str:
+    """Order-independent fingerprint of a set of player names (16 hex chars)."""
+    return hashlib.sha1("\n".join(sorted(players)).encode()).hexdigest()[:16]
+
+
+def build_snake_order(total_teams: int, rounds: int = ROUNDS) -> list[int]:
+    """Flat list of team indices, one entry per pick, for the whole draft."""
+    order: list[int] = []
+    for r in range(rounds):
+        seq = list(range(total_teams))
+        # Extend the last direction if ROUNDS > 10
+        rev = _REVERSED[r] if r < len(_REVERSED) else (r % 2 == 1)
+        if rev:
+            seq.reverse()
+        order.extend(seq)
+    return order
+
+
+_POOL_SKIP = {'player', 'player name', 'name', 'players', 'adp', ''}
+
+
+def parse_pool_rows(rows: list[list[str]]) -> tuple[list[str], dict[str, float]]:
+    """
+    Pull player names (col B) and ADP (col C) out of a pool-tab grid.
+    Header rows, blanks and pure-number cells are skipped; players without a
+    numeric ADP are kept with no ADP entry (ai_drafter falls back for them).
+    """
+    names: list[str]        = []
+    adp:   dict[str, float] = {}
+
+    for row in rows:
+        # col B = index 1 (player name), col C = index 2 (ADP)
+        player_val = row[1].strip() if len(row) > 1 else ''
+        adp_val    = row[2].strip() if len(row) > 2 else ''
+
+        if not player_val or player_val.lower() in _POOL_SKIP:
+            continue
+        if re.match(r'^\d+$', player_val):
+            continue   # skip pure numbers
+
+        names.append(player_val)
+
+        # Parse ADP if present and numeric
+        try:
+            adp[player_val] = float(adp_val)
+        except ValueError:
+            pass   # no ADP for this row — fallback handled in ai_drafter
+
+    return names, adp
+
+
+# Sheet row (1-based) for each (starter/bench, position) slot
+_ROW_MAP = {
+    ('starter', 'PG'): 2,  ('bench', 'PG'): 7,
+    ('starter', 'SG'): 3,  ('bench', 'SG'): 8,
+    ('starter', 'SF'): 4,  ('bench', 'SF'): 9,
+    ('starter', 'PF'): 5,  ('bench', 'PF'): 10,
+    ('starter', 'C'):  6,  ('bench', 'C'):  11,
+}
+
+
+def _team_rows(picks: list[str]) -> dict[int, str]:
+    """
+    Place a roster into the 10 sheet slots (5 starters + 5 bench, by position).
+    Returns {sheet row: player}.
+    """
+    from player_data import get_positions
+    slots: dict[tuple[str, str], str] = {}  # (starter/bench, pos) -> player
+    unplaced: list[str] = []
+
+    for player in picks:
+        positions = get_positions(player)
+        if not positions:
+            positions = POSITION_ORDER   # fallback: try all positions
+        placed = False
+        # Prefer an open starter slot across all positions before any bench slot.
+        # e.g. Havlicek (SG/SF) with SG starter taken → goes to SF starter, not SG bench.
+        for pos in positions:
+            key = ('starter', pos)
+            if key not in slots:
+                slots[key] = player
+                placed = True
+                break
+        if not placed:
+            for pos in positions:
+                key = ('bench', pos)
+                if key not in slots:
+                    slots[key] = player
+                    placed = True
+                    break
+        if not placed:
+            unplaced.append(player)
+
+    # Spillover: place any remaining players in the first open slot
+    for player in unplaced:
+        for slot_type in ('starter', 'bench'):
+            for pos in POSITION_ORDER:
+                key = (slot_type, pos)
+                if key not in slots:
+                    slots[key] = player
+                    break
+            else:
+                continue
+            break
+
+    return {_ROW_MAP[key]: player for key, player in slots.items()}
+
+
 class DraftState(Enum):
     IDLE          = "idle"
     SETUP_TEAMS   = "setup_teams"
@@ -103,6 +268,7 @@ class TeamSlot:
     emoji:    str                    # unicode fallback emoji
     owner_id: Optional[int] = None   # Discord user ID; None = AI
     picks:    list[str] = field(default_factory=list)
+    profile:  TeamProfile = field(default_factory=TeamProfile)   # running roster summary for the AI
 
     @property
     def is_ai(self) -> bool:
@@ -125,6 +291,17 @@ class DraftManager:
         self.player_pool: list[str]       = []   # all available players
         self.player_adp:  dict[str, float] = {}   # player → ADP (lower = better)
         self.drafted:     set[str]         = set()
+        self._pool_lock   = threading.Lock()   # guards pool swaps vs. the first pick
+        # Name lookup for human picks — built on first use for the current pool
+        # list, then kept current by record_pick()
+        self._names_for:  list[str] | None = None
+        self._available_names = NameIndex()
+        self._drafted_names   = NameIndex()
+        self._available:  AvailablePool | None = None   # see available_players
+        # One entry per recorded pick, for replay (see replay.py):
+        #   {overall_pick, team_slot, player, source, seed, weights_version, available_hash}
+        self.events: list[dict] = []
+        self.traces = TraceBuffer()   # recent AI pick explanations (!whypick), if enabled
 
     # ── Properties ──────────────────────────────────────────────────────────
     @property
@@ -144,8 +321,15 @@ class DraftManager:
         return self.current_pick // self.total_teams + 1
 
     @property
-    def available_players(self) -> list[str]:
-        return [p for p in self.player_pool if p not in self.drafted]
+    def available_players(self) -> AvailablePool:
+        """
+        Undrafted players in pool order. A live AvailablePool, updated in place
+        by record_pick() — use .as_list() for a list snapshot.
+        """
+        av = self._available
+        if av is None or av.players is not self.player_pool or av.adp is not self.player_adp:
+            av = self._available = AvailablePool(self.player_pool, self.player_adp, self.drafted)
+        return av
 
     # ── Setup helpers ────────────────────────────────────────────────────────
     def setup(self, total_teams: int, human_ids: list[int],
@@ -179,77 +363,160 @@ class DraftManager:
             for i in range(total_teams)
         ]
 
-        # Build snake draft order (rounds 1-10)
-        #
-        # Standard snake alternates F/B every round (R1→, R2←, R3→ …).
-        # The "flip" at R3 and R6 means those rounds go ← again instead of →,
-        # shifting the back-to-back to the top pick on R4 and R7.
-        #
-        # Direction by round (1-indexed):
-        #   R1 →  R2 ←  R3 ← (flip)  R4 →  R5 ←  R6 ← (flip)  R7 →  R8 ←  R9 →  R10 ←
-        #
-        # As a bool list (True = reversed 30→1, False = forward 1→30):
-        _REVERSED = [False, True, True, False, True, True, False, True, False, True]
-
-        self.pick_order = []
-        for r in range(ROUNDS):
-            seq = list(range(total_teams))
-            # Extend the last direction if ROUNDS > 10
-            rev = _REVERSED[r] if r < len(_REVERSED) else (r % 2 == 1)
-            if rev:
-                seq.reverse()
-            self.pick_order.extend(seq)
+        self.pick_order = build_snake_order(total_teams)
 
         self.current_pick = 0
+        self.events = []
+        self.traces = TraceBuffer()
         self.state = DraftState.ACTIVE
 
-    def load_player_pool(self) -> int:
+    def load_player_pool(self, offline: bool = POOL_OFFLINE, refresh: bool = True) -> int:
         """
-        Read player names (col B) and ADP (col C) from the pool tab.
+        Load player names (col B) and ADP (col C) for the pool tab.
+
+        Uses the local snapshot when there is one and, unless offline, checks
+        the sheet's revision on a background thread. A changed pool is written
+        back to the cache and swapped in only if no pick has been made yet;
+        otherwise it takes effect from the next draft. Without a snapshot the
+        tab is downloaded once (blocking) and cached.
         Returns count of players loaded.
         """
-        creds  = ServiceAccountCredentials.from_json_keyfile_name(SERVICE_ACCOUNT_FILE, _SCOPE)
-        client = gspread.authorize(creds)
-        ws     = client.open_by_key(POOL_SPREADSHEET_ID).worksheet(POOL_TAB_NAME)
-        rows   = ws.get_all_values()   # full grid — small enough to fetch at once
-
-        names: list[str]        = []
-        adp:   dict[str, float] = {}
-
-        _SKIP = {'player', 'player name', 'name', 'players', 'adp', ''}
-
-        for row in rows:
-            # col B = index 1 (player name), col C = index 2 (ADP)
-            player_val = row[1].strip() if len(row) > 1 else ''
-            adp_val    = row[2].strip() if len(row) > 2 else ''
-
-            if not player_val or player_val.lower() in _SKIP:
-                continue
-            if re.match(r'^\d+$', player_val):
-                continue   # skip pure numbers
-
-            names.append(player_val)
-
-            # Parse ADP if present and numeric
-            try:
-                adp[player_val] = float(adp_val)
-            except ValueError:
-                pass   # no ADP for this row — fallback handled in ai_drafter
+        snap = POOL_CACHE.get(POOL_SPREADSHEET_ID, POOL_TAB_NAME)
+        if snap is not None:
+            self._set_pool(snap.players, snap.adp)
+            age = (time.time() - snap.fetched_at) / 60
+            print(f"[Pool] Loaded {len(snap.players)} players | {len(snap.adp)} with ADP "
+                  f"from cached '{POOL_TAB_NAME}' ({age:.0f} min old)")
+            if not offline and refresh:
+                threading.Thread(target=self._refresh_pool, args=(snap.revision,),
+                                 daemon=True, name="pool-refresh").start()
+            return len(snap.players)
+
+        if offline:
+            raise RuntimeError(f"No cached pool for '{POOL_TAB_NAME}' and offline mode is on.")
+
+        snap = fetch_pool_snapshot()
+        POOL_CACHE.put(POOL_SPREADSHEET_ID, POOL_TAB_NAME, snap)
+        print(f"[Pool] Loaded {len(snap.players)} players | {len(snap.adp)} with ADP from '{POOL_TAB_NAME}'")
+        self._set_pool(snap.players, snap.adp)
+        return len(snap.players)
+
+    def _refresh_pool(self, known_revision: str | None) -> None:
+        """Background revision check for load_player_pool()."""
+        try:
+            snap = fetch_pool_snapshot(known_revision)
+        except Exception as e:
+            print(f"[Pool] Background refresh failed, keeping cached pool: {e}")
+            return
+        if snap is None:
+            POOL_CACHE.touch(POOL_SPREADSHEET_ID, POOL_TAB_NAME)
+            print(f"[Pool] Cached '{POOL_TAB_NAME}' is current")
+            return
+
+        POOL_CACHE.put(POOL_SPREADSHEET_ID, POOL_TAB_NAME, snap)
+        with self._pool_lock:
+            if self.current_pick == 0:
+                self._set_pool(snap.players, snap.adp)
+                print(f"[Pool] '{POOL_TAB_NAME}' changed — refreshed to {len(snap.players)} players before the first pick")
+                return
+        print(f"[Pool] '{POOL_TAB_NAME}' changed — cache updated, applies from the next draft")
+
+    def _set_pool(self, names: list[str], adp: dict[str, float]) -> None:
+        self.player_pool = list(names)
+        self.player_adp  = dict(adp)
+
+    def load_pool_snapshot(self, path: str) -> int:
+        """
+        Load the player pool from a local file instead of the sheet.
+          .json — {"players": [...], "adp": {player: adp}}
+          .csv  — same layout as the pool tab (col B name, col C ADP), so a
+                  "Download as CSV" of the sheet works unchanged
+        Returns count of players loaded.
+        """
+        if path.lower().endswith(".json"):
+            with open(path) as f:
+                data = json.load(f)
+            names = list(data["players"])
+            adp   = {p: float(v) for p, v in data.get("adp", {}).items()}
+        else:
+            with open(path, newline="", encoding="utf-8") as f:
+                names, adp = parse_pool_rows(list(csv.reader(f)))
 
-        print(f"[Pool] Loaded {len(names)} players | {len(adp)} with ADP from '{POOL_TAB_NAME}'")
+        print(f"[Pool] Loaded {len(names)} players | {len(adp)} with ADP from '{path}'")
         self.player_pool = names
         self.player_adp  = adp
         return len(names)
 
+    def save_pool_snapshot(self, path: str) -> None:
+        """Write the loaded pool to a .json or .csv snapshot (see load_pool_snapshot)."""
+        if path.lower().endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"players": self.player_pool, "adp": self.player_adp}, f, indent=2)
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(["#", "Player", "ADP"])
+                for i, p in enumerate(self.player_pool, 1):
+                    w.writerow([i, p, self.player_adp.get(p, "")])
+
+    # ── Player name lookup ───────────────────────────────────────────────────
+    def _name_indexes(self) -> tuple[NameIndex, NameIndex]:
+        if self._names_for is not self.player_pool:
+            self._available_names = NameIndex(p for p in self.player_pool if p not in self.drafted)
+            self._drafted_names   = NameIndex(self.drafted)
+            self._names_for = self.player_pool
+        return self._available_names, self._drafted_names
+
+    def resolve_available(self, text: str, cutoff: float = 0.6) -> str | None:
+        """Fuzzy-match a typed name against players still available."""
+        return self._name_indexes()[0].resolve(text, cutoff)
+
+    def resolve_drafted(self, text: str, cutoff: float = 0.75) -> str | None:
+        """Fuzzy-match a typed name against players already drafted (no partial-name hits)."""
+        return self._name_indexes()[1].resolve(text, cutoff, partial=False)
+
     # ── Pick recording ───────────────────────────────────────────────────────
-    def record_pick(self, player: str) -> None:
-        self.current_team.picks.append(player)
-        self.drafted.add(player)
-        self.current_pick += 1
+    def record_pick(self, player: str, source: str = "ai", seed: int | None = None,
+                    weights_version: str | None = None, trace: list[dict] | None = None) -> None:
+        """
+        Record the current team's pick. `source` is "ai", "human" or "auto"
+        (AI pick after a human timeout); `seed` and `weights_version` are the
+        RNG seed and weights (Weights.version) the AI pick was made with, if
+        any. All go into self.events for replay. `trace` is the engine's
+        candidate breakdown for this pick, kept in self.traces.
+        """
+        with self._pool_lock:
+            team = self.current_team
+            if trace:
+                self.traces.add(PickTrace(self.pick_number, self.round_number, team.name, player,
+                                          source, weights_version, trace))
+            self.events.append({
+                "overall_pick":    self.pick_number,
+                "team_slot":       self.pick_order[self.current_pick],
+                "player":          player,
+                "source":          source,
+                "seed":            seed,
+                "weights_version": weights_version,
+                "available_hash":  self.available_players.digest,
+            })
+            team.picks.append(player)
+            team.profile.add(player, self.player_adp.get(player, 9999.0))
+            self.drafted.add(player)
+            if self._available is not None:
+                self._available.remove(player)
+            self.current_pick += 1
+            if self._names_for is self.player_pool:
+                self._available_names.remove(player)
+                self._drafted_names.add(player)
 
     def is_complete(self) -> bool:
         return self.current_pick >= self.total_picks
 
+    @property
+    def weights_version(self) -> str | None:
+        """Weights version of the draft's first AI pick (None if no AI picked)."""
+        return next((e["weights_version"] for e in self.events if e["weights_version"]), None)
+
     # ── Google Sheets output ─────────────────────────────────────────────────
     def write_results(self, tab_label: str = "") -> str:
         """
@@ -259,9 +526,7 @@ class DraftManager:
         from datetime import datetime
         tab_name = tab_label or f"Draft {datetime.now().strftime('%Y-%m-%d %H:%M')}"
 
-        creds  = ServiceAccountCredentials.from_json_keyfile_name(SERVICE_ACCOUNT_FILE, _SCOPE)
-        client = gspread.authorize(creds)
-        ss     = client.open_by_key(OUTPUT_SPREADSHEET_ID)
+        ss = _client().open_by_key(OUTPUT_SPREADSHEET_ID)
 
         # Create (or clear) the worksheet
         try:
@@ -270,83 +535,19 @@ class DraftManager:
         except gspread.exceptions.WorksheetNotFound:
             ws = ss.add_worksheet(title=tab_name, rows=50, cols=self.total_teams * 4 + 5)
 
-        # Build cell updates
-        updates = []
-
-        # Optional row 1: position labels in column A
+        # Build the whole grid as one contiguous block starting at A1:
+        #   col A = position labels, team i's names in column i*4+1 (B, F, J, …)
         labels = ["", "Starting PG", "Starting SG", "Starting SF", "Starting PF", "Starting C",
                   "Bench PG", "Bench SG", "Bench SF", "Bench PF", "Bench C"]
-        for row_offset, label in enumerate(labels):
-            updates.append({
-                'range': gspread.utils.rowcol_to_a1(row_offset + 1, 1),
-                'values': [[label]],
-            })
+        width = (len(self.teams) - 1) * 4 + 2 if self.teams else 1
+        block = [[label] + [""] * (width - 1) for label in labels]
 
         for team_idx, team in enumerate(self.teams):
-            col = team_idx * 4 + 2   # column B, F, J, ... (1-indexed; col A = labels)
-
-            # Header row: team name
-            updates.append({
-                'range': gspread.utils.rowcol_to_a1(1, col),
-                'values': [[team.name]],
-            })
-
-            # Build the 10 player slots (5 starters + 5 bench, by position)
-            from player_data import get_positions
-            slots: dict[tuple[str, str], str] = {}  # (starter/bench, pos) -> player
-            unplaced: list[str] = []
-
-            for player in team.picks:
-                positions = get_positions(player)
-                if not positions:
-                    positions = POSITION_ORDER   # fallback: try all positions
-                placed = False
-                # Prefer an open starter slot across all positions before any bench slot.
-                # e.g. Havlicek (SG/SF) with SG starter taken → goes to SF starter, not SG bench.
-                for pos in positions:
-                    key = ('starter', pos)
-                    if key not in slots:
-                        slots[key] = player
-                        placed = True
-                        break
-                if not placed:
-                    for pos in positions:
-                        key = ('bench', pos)
-                        if key not in slots:
-                            slots[key] = player
-                            placed = True
-                            break
-                if not placed:
-                    unplaced.append(player)
-
-            # Spillover: place any remaining players in the first open slot
-            for player in unplaced:
-                for slot_type in ('starter', 'bench'):
-                    for pos in POSITION_ORDER:
-                        key = (slot_type, pos)
-                        if key not in slots:
-                            slots[key] = player
-                            break
-                    else:
-                        continue
-                    break
+            col = team_idx * 4 + 1   # 0-based column in the block (B, F, J, …)
+            block[0][col] = team.name
+            for row, player in _team_rows(team.picks).items():
+                block[row - 1][col] = player
 
-            # Write players in the correct row offsets
-            row_map = {
-                ('starter', 'PG'): 2,  ('bench', 'PG'): 7,
-                ('starter', 'SG'): 3,  ('bench', 'SG'): 8,
-                ('starter', 'SF'): 4,  ('bench', 'SF'): 9,
-                ('starter', 'PF'): 5,  ('bench', 'PF'): 10,
-                ('starter', 'C'):  6,  ('bench', 'C'):  11,
-            }
-            for key, player in slots.items():
-                row = row_map.get(key)
-                if row:
-                    updates.append({
-                        'range': gspread.utils.rowcol_to_a1(row, col),
-                        'values': [[player]],
-                    })
-
-        # Write all updates in one batch
-        ws.batch_update(updates)
+        # One write for the whole tab instead of one range per cell
+        ws.update(range_name="A1", values=block)
         return tab_name
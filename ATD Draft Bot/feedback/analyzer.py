@@ -135,10 +135,16 @@ MIN_REJECTION_SIGNAL = 3
 # Maximum nudge per review cycle (as a fraction of current value)
 MAX_NUDGE_FRACTION = 0.30
 
+# Proposals read reason counts summed over this many recent reviewed drafts
+# played under the current weights, so one unusual draft can't swing a weight
+# on its own and a confirmed change resets the window
+SIGNAL_WINDOW_DRAFTS = 5
+
 
 def compute_signals(summary: dict) -> dict[str, float]:
     """
-    Given a review summary dict from db.get_review_summary(), return a dict of
+    Given a review summary dict from db.get_review_summary() (or the multi-draft
+    db.get_rolling_summary()), return a dict of
     {weight_key: signal} where signal is in [-1, 1].
     Positive signal → weight should increase.
     Negative signal → weight should decrease.
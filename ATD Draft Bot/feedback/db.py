@@ -1,22 +1,64 @@
 """
 feedback/db.py
 SQLite persistence for draft history, team reviews, weight proposals, and weight history.
+Every pick is also stored as one row in `picks` for the cross-draft analytics at the bottom.
 """
 
+import hashlib
 import json
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
+from player_data import (
+    lookup,
+    F_BALL_DOMINANT, F_SHOT_CREATOR, F_SHOOTER, F_HIGH_PORTABILITY,
+    F_NON_SCORING_BIG, F_SOFT_BIG, F_IMMOBILE_CENTER, F_VERSATILE_DEFENDER,
+    F_PERIMETER_DEFENDER, F_ELITE_RIM_PROTECTOR, F_ELITE_PLAYMAKER,
+    F_PNR_CREATOR, F_DO_NOT_DRAFT,
+)
+
 _DB_PATH = os.path.join(os.path.dirname(__file__), "..", "draft_feedback.db")
 
+# One connection shared by every thread (event loop, result writer, executors).
+# sqlite3 caches compiled statements per connection, so repeated queries reuse
+# their prepared statements instead of re-parsing. Access is serialised by
+# _lock; WAL lets readers in other processes (optimizer, scripts) run alongside.
+_con:  sqlite3.Connection | None = None
+_lock = threading.RLock()
+
 
-def _conn() -> sqlite3.Connection:
-    con = sqlite3.connect(_DB_PATH)
+def _open() -> sqlite3.Connection:
+    con = sqlite3.connect(_DB_PATH, check_same_thread=False, timeout=10,
+                          cached_statements=256)
     con.row_factory = sqlite3.Row
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
     return con
 
 
+@contextmanager
+def _conn():
+    """Shared connection, held for one transaction (commit on success, rollback on error)."""
+    global _con
+    with _lock:
+        if _con is None:
+            _con = _open()
+        with _con:
+            yield _con
+
+
+def close() -> None:
+    """Close the shared connection (it reopens on next use)."""
+    global _con
+    with _lock:
+        if _con is not None:
+            _con.close()
+            _con = None
+
+
 def init_db() -> None:
     """Create all tables if they don't exist. Call once at bot startup."""
     with _conn() as con:
@@ -38,6 +80,17 @@ def init_db() -> None:
                 reviewed_at TEXT
             );
 
+            CREATE TABLE IF NOT EXISTS picks (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                draft_id        INTEGER NOT NULL REFERENCES drafts(id),
+                team_draft_id   INTEGER NOT NULL REFERENCES team_drafts(id),
+                team_slot       INTEGER NOT NULL,   -- 0-based draft position
+                overall_pick    INTEGER NOT NULL,   -- 1-based
+                round           INTEGER NOT NULL,   -- 1-based
+                player          TEXT    NOT NULL,
+                flags           INTEGER NOT NULL DEFAULT 0   -- player_data F_* bits when saved
+            );
+
             CREATE TABLE IF NOT EXISTS reviews (
                 id              INTEGER PRIMARY KEY AUTOINCREMENT,
                 team_draft_id   INTEGER NOT NULL REFERENCES team_drafts(id),
@@ -46,6 +99,51 @@ def init_db() -> None:
                 timestamp       TEXT    NOT NULL
             );
 
+            -- Pick-by-pick log for replay.py: one row per pick, with the RNG
+            -- seed the AI pick was made with and a hash of the players still
+            -- available at that point (AvailablePool.digest)
+            CREATE TABLE IF NOT EXISTS pick_events (
+                draft_id        INTEGER NOT NULL REFERENCES drafts(id),
+                overall_pick    INTEGER NOT NULL,
+                team_slot       INTEGER NOT NULL,
+                player          TEXT    NOT NULL,
+                source          TEXT    NOT NULL,   -- ai | human | auto
+                seed            INTEGER,
+                available_hash  TEXT    NOT NULL,
+                PRIMARY KEY (draft_id, overall_pick)
+            );
+
+            -- Player pools drafts were run on, stored once per distinct pool
+            CREATE TABLE IF NOT EXISTS pools (
+                hash        TEXT PRIMARY KEY,
+                players     TEXT NOT NULL,   -- JSON array, pool order
+                adp         TEXT NOT NULL    -- JSON {player: adp}
+            );
+
+            -- Review aggregates, maintained by save_draft / record_verdict so
+            -- summaries never rescan team_drafts or reviews
+            CREATE TABLE IF NOT EXISTS review_stats (
+                draft_id    INTEGER PRIMARY KEY REFERENCES drafts(id),
+                total       INTEGER NOT NULL,
+                approved    INTEGER NOT NULL DEFAULT 0,
+                rejected    INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS review_reason_stats (
+                draft_id    INTEGER NOT NULL REFERENCES drafts(id),
+                reason      TEXT    NOT NULL,
+                count       INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (draft_id, reason)
+            );
+
+            -- Every weight set the bot has run with, keyed by Weights.version
+            -- (drafts.weights_version / pick_events.weights_version)
+            CREATE TABLE IF NOT EXISTS weight_sets (
+                version     TEXT PRIMARY KEY,
+                weights     TEXT NOT NULL,   -- JSON {key: value}
+                first_seen  TEXT NOT NULL
+            );
+
             CREATE TABLE IF NOT EXISTS weight_proposals (
                 id          INTEGER PRIMARY KEY AUTOINCREMENT,
                 draft_id    INTEGER NOT NULL REFERENCES drafts(id),
@@ -66,34 +164,157 @@ def init_db() -> None:
             );
         """)
         # Migrations — safe to run on existing databases
-        try:
-            con.execute("ALTER TABLE drafts ADD COLUMN started_by TEXT")
-        except Exception:
-            pass  # column already exists
+        for table, column in (("drafts", "started_by TEXT"), ("drafts", "pool_hash TEXT"),
+                              ("drafts", "weights_version TEXT"),
+                              ("pick_events", "weights_version TEXT")):
+            try:
+                con.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+            except Exception:
+                pass  # column already exists
+
+        con.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_team_drafts_draft    ON team_drafts(draft_id, verdict);
+            CREATE INDEX IF NOT EXISTS idx_reviews_team_draft   ON reviews(team_draft_id);
+            CREATE INDEX IF NOT EXISTS idx_proposals_status     ON weight_proposals(status, id);
+            CREATE INDEX IF NOT EXISTS idx_weight_history_ts    ON weight_history(timestamp);
+            CREATE INDEX IF NOT EXISTS idx_picks_player         ON picks(player, round);
+            CREATE INDEX IF NOT EXISTS idx_picks_team_draft     ON picks(team_draft_id);
+            CREATE INDEX IF NOT EXISTS idx_picks_draft          ON picks(draft_id, overall_pick);
+        """)
+        _migrate_json_picks(con)
+        _migrate_review_stats(con)
+
+
+def _pick_rows(draft_id: int, team_draft_id: int, slot: int, picks: list[str],
+               order: list[int]) -> list[tuple]:
+    """`picks` rows for one roster. `order` is build_snake_order() for the draft."""
+    overall = [i + 1 for i, team in enumerate(order) if team == slot]
+    return [
+        (draft_id, team_draft_id, slot, overall[r] if r < len(overall) else 0,
+         r + 1, player, lookup(player).flags)
+        for r, player in enumerate(picks)
+    ]
+
+
+def _migrate_review_stats(con: sqlite3.Connection) -> None:
+    """Build review_stats / review_reason_stats for drafts saved before they existed."""
+    missing = con.execute(
+        "SELECT d.id FROM drafts d WHERE NOT EXISTS (SELECT 1 FROM review_stats s WHERE s.draft_id = d.id)"
+    ).fetchall()
+    if not missing:
+        return
+    for r in missing:
+        con.execute(
+            "INSERT INTO review_stats (draft_id, total, approved, rejected) "
+            "SELECT ?, COUNT(*), COALESCE(SUM(verdict = 'approved'), 0), COALESCE(SUM(verdict = 'rejected'), 0) "
+            "FROM team_drafts WHERE draft_id = ?",
+            (r["id"], r["id"]),
+        )
+        reason_counts: dict[str, int] = {}
+        for row in con.execute(
+            "SELECT r.reasons FROM reviews r JOIN team_drafts t ON t.id = r.team_draft_id "
+            "WHERE t.draft_id = ? AND t.verdict = 'rejected'",
+            (r["id"],),
+        ):
+            for reason in json.loads(row["reasons"]):
+                reason_counts[reason] = reason_counts.get(reason, 0) + 1
+        con.executemany(
+            "INSERT INTO review_reason_stats (draft_id, reason, count) VALUES (?, ?, ?)",
+            [(r["id"], reason, n) for reason, n in reason_counts.items()],
+        )
+    print(f"[FeedbackDB] Built review aggregates for {len(missing)} drafts")
+
+
+_INSERT_PICK = (
+    "INSERT INTO picks (draft_id, team_draft_id, team_slot, overall_pick, round, player, flags) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _migrate_json_picks(con: sqlite3.Connection) -> None:
+    """Backfill `picks` from team_drafts.picks JSON for rosters saved before the table existed."""
+    rows = con.execute(
+        "SELECT t.id, t.draft_id, t.picks FROM team_drafts t "
+        "WHERE NOT EXISTS (SELECT 1 FROM picks p WHERE p.team_draft_id = t.id) "
+        "ORDER BY t.draft_id, t.id"
+    ).fetchall()
+    if not rows:
+        return
+    from draft_manager import build_snake_order
+
+    # Draft slot = position of the roster among its draft's team_drafts rows
+    slots: dict[int, int] = {}
+    teams_per_draft: dict[int, int] = {}
+    for r in con.execute("SELECT id, draft_id FROM team_drafts ORDER BY draft_id, id"):
+        slots[r["id"]] = teams_per_draft.get(r["draft_id"], 0)
+        teams_per_draft[r["draft_id"]] = slots[r["id"]] + 1
+
+    orders: dict[int, list[int]] = {}
+    batch: list[tuple] = []
+    for r in rows:
+        n = teams_per_draft[r["draft_id"]]
+        order = orders.setdefault(n, build_snake_order(n))
+        batch += _pick_rows(r["draft_id"], r["id"], slots[r["id"]], json.loads(r["picks"]), order)
+    con.executemany(_INSERT_PICK, batch)
+    print(f"[FeedbackDB] Migrated {len(rows)} rosters ({len(batch)} picks) into the picks table")
 
 
 # ── Draft ────────────────────────────────────────────────────────────────────
 
+def _store_pool(con: sqlite3.Connection, players: list[str], adp: dict[str, float]) -> str:
+    """Insert a pool if it isn't stored yet. Returns its hash."""
+    players_json = json.dumps(players)
+    adp_json     = json.dumps(adp, sort_keys=True)
+    key = hashlib.sha1(f"{players_json}\n{adp_json}".encode()).hexdigest()[:16]
+    con.execute(
+        "INSERT OR IGNORE INTO pools (hash, players, adp) VALUES (?, ?, ?)",
+        (key, players_json, adp_json),
+    )
+    return key
+
+
 def save_draft(num_teams: int, teams: dict[str, list[str]],
-               started_by: str | None = None) -> int:
+               started_by: str | None = None,
+               events: list[dict] | None = None,
+               pool: tuple[list[str], dict[str, float]] | None = None,
+               weights_version: str | None = None) -> int:
     """
     Persist a completed draft.
-    teams: {team_name: [pick1, pick2, ...]}
+    teams: {team_name: [pick1, pick2, ...]} in draft-slot order
     started_by: Discord username or mention of whoever ran !draft (None = all-AI watch).
+    events: DraftManager.events — the pick-by-pick log used by replay.py
+    pool: (player_pool, player_adp) the draft ran on
+    weights_version: Weights.version the draft started with (see save_weight_set)
     Returns the new draft_id.
     """
     ts = datetime.utcnow().isoformat()
     with _conn() as con:
+        pool_key = _store_pool(con, *pool) if pool else None
         cur = con.execute(
-            "INSERT INTO drafts (timestamp, num_teams, status, started_by) VALUES (?, ?, 'pending_review', ?)",
-            (ts, num_teams, started_by),
+            "INSERT INTO drafts (timestamp, num_teams, status, started_by, pool_hash, weights_version) "
+            "VALUES (?, ?, 'pending_review', ?, ?, ?)",
+            (ts, num_teams, started_by, pool_key, weights_version),
         )
         draft_id = cur.lastrowid
-        for team_name, picks in teams.items():
-            con.execute(
+        from draft_manager import build_snake_order
+        order = build_snake_order(num_teams)
+        for slot, (team_name, picks) in enumerate(teams.items()):
+            cur = con.execute(
                 "INSERT INTO team_drafts (draft_id, team_name, picks) VALUES (?, ?, ?)",
                 (draft_id, team_name, json.dumps(picks)),
             )
+            con.executemany(_INSERT_PICK, _pick_rows(draft_id, cur.lastrowid, slot, picks, order))
+        con.execute(
+            "INSERT INTO review_stats (draft_id, total) VALUES (?, ?)",
+            (draft_id, len(teams)),
+        )
+        if events:
+            con.executemany(
+                "INSERT INTO pick_events (draft_id, overall_pick, team_slot, player, source, seed, "
+                "available_hash, weights_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(draft_id, e["overall_pick"], e["team_slot"], e["player"], e["source"],
+                  e["seed"], e["available_hash"], e.get("weights_version")) for e in events],
+            )
     return draft_id
 
 
@@ -119,6 +340,56 @@ def get_draft_teams(draft_id: int) -> list[dict]:
     ]
 
 
+def get_draft_log(draft_id: int) -> dict | None:
+    """
+    Everything replay.py needs to re-run a draft, or None if the draft has no
+    pick log or stored pool (drafts saved before logging existed):
+    {draft_id, num_teams, players, adp,
+     events: [{overall_pick, team_slot, player, source, seed, available_hash, weights_version}],
+     weight_sets: {weights_version: values} for the versions the events used that are stored}
+    """
+    with _conn() as con:
+        row = con.execute(
+            "SELECT d.num_teams, p.players, p.adp FROM drafts d JOIN pools p ON p.hash = d.pool_hash "
+            "WHERE d.id = ?",
+            (draft_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        events = con.execute(
+            "SELECT overall_pick, team_slot, player, source, seed, available_hash, weights_version "
+            "FROM pick_events WHERE draft_id = ? ORDER BY overall_pick",
+            (draft_id,),
+        ).fetchall()
+        if not events:
+            return None
+        versions = sorted({e["weights_version"] for e in events if e["weights_version"]})
+        sets = con.execute(
+            f"SELECT version, weights FROM weight_sets WHERE version IN ({','.join('?' * len(versions))})",
+            versions,
+        ).fetchall() if versions else []
+    return {
+        "draft_id":    draft_id,
+        "num_teams":   row["num_teams"],
+        "players":     json.loads(row["players"]),
+        "adp":         json.loads(row["adp"]),
+        "events":      [dict(e) for e in events],
+        "weight_sets": {r["version"]: json.loads(r["weights"]) for r in sets},
+    }
+
+
+def get_replayable_draft_ids(limit: int = 50) -> list[int]:
+    """Most recent drafts that have a pick log and stored pool, newest first."""
+    with _conn() as con:
+        rows = con.execute(
+            "SELECT d.id FROM drafts d WHERE d.pool_hash IS NOT NULL "
+            "AND EXISTS (SELECT 1 FROM pick_events e WHERE e.draft_id = d.id) "
+            "ORDER BY d.id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    return [r["id"] for r in rows]
+
+
 def get_draft_status(draft_id: int) -> str | None:
     with _conn() as con:
         row = con.execute("SELECT status FROM drafts WHERE id = ?", (draft_id,)).fetchone()
@@ -143,6 +414,22 @@ def get_draft_history(limit: int = 10) -> list[dict]:
 
 # ── Reviews ──────────────────────────────────────────────────────────────────
 
+def _bump_review_stats(con: sqlite3.Connection, draft_id: int, verdict: str | None,
+                       reasons: list[str], step: int) -> None:
+    """Add (step=1) or remove (step=-1) one team's verdict from the aggregates."""
+    if verdict in ("approved", "rejected"):
+        con.execute(
+            f"UPDATE review_stats SET {verdict} = {verdict} + ? WHERE draft_id = ?",
+            (step, draft_id),
+        )
+    if verdict == "rejected":
+        con.executemany(
+            "INSERT INTO review_reason_stats (draft_id, reason, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (draft_id, reason) DO UPDATE SET count = count + excluded.count",
+            [(draft_id, reason, step) for reason in reasons],
+        )
+
+
 def record_verdict(
     team_draft_id: int,
     verdict: str,           # "approved" | "rejected"
@@ -151,6 +438,20 @@ def record_verdict(
 ) -> None:
     ts = datetime.utcnow().isoformat()
     with _conn() as con:
+        prev = con.execute(
+            "SELECT draft_id, verdict FROM team_drafts WHERE id = ?", (team_draft_id,)
+        ).fetchone()
+        if prev is None:
+            return
+        if prev["verdict"] is not None:
+            # Re-review: take the earlier verdict and its reasons back out first
+            last = con.execute(
+                "SELECT reasons FROM reviews WHERE team_draft_id = ? ORDER BY id DESC LIMIT 1",
+                (team_draft_id,),
+            ).fetchone()
+            old_reasons = json.loads(last["reasons"]) if last else []
+            _bump_review_stats(con, prev["draft_id"], prev["verdict"], old_reasons, -1)
+
         con.execute(
             "UPDATE team_drafts SET verdict = ?, reviewed_at = ? WHERE id = ?",
             (verdict, ts, team_draft_id),
@@ -160,6 +461,7 @@ def record_verdict(
                 "INSERT INTO reviews (team_draft_id, reasons, reviewed_by, timestamp) VALUES (?, ?, ?, ?)",
                 (team_draft_id, json.dumps(reasons), reviewed_by, ts),
             )
+        _bump_review_stats(con, prev["draft_id"], verdict, reasons, 1)
 
 
 def get_unreviewed_team(draft_id: int) -> dict | None:
@@ -185,30 +487,56 @@ def get_review_summary(draft_id: int) -> dict:
     }
     """
     with _conn() as con:
-        teams = con.execute(
-            "SELECT id, verdict FROM team_drafts WHERE draft_id = ?", (draft_id,)
+        row = con.execute(
+            "SELECT total, approved, rejected FROM review_stats WHERE draft_id = ?", (draft_id,)
+        ).fetchone()
+        reasons = con.execute(
+            "SELECT reason, count FROM review_reason_stats WHERE draft_id = ? AND count > 0",
+            (draft_id,),
         ).fetchall()
 
-        approved = sum(1 for t in teams if t["verdict"] == "approved")
-        rejected = sum(1 for t in teams if t["verdict"] == "rejected")
+    return {
+        "total": row["total"] if row else 0,
+        "approved": row["approved"] if row else 0,
+        "rejected": row["rejected"] if row else 0,
+        "reason_counts": {r["reason"]: r["count"] for r in reasons},
+    }
+
 
-        rejected_ids = [t["id"] for t in teams if t["verdict"] == "rejected"]
-        reason_counts: dict[str, int] = {}
-        if rejected_ids:
-            placeholders = ",".join("?" * len(rejected_ids))
-            review_rows = con.execute(
-                f"SELECT reasons FROM reviews WHERE team_draft_id IN ({placeholders})",
-                rejected_ids,
-            ).fetchall()
-            for row in review_rows:
-                for reason in json.loads(row["reasons"]):
-                    reason_counts[reason] = reason_counts.get(reason, 0) + 1
+def get_rolling_summary(draft_id: int, window: int, weights_version: str | None = None) -> dict:
+    """
+    get_review_summary() summed over the last `window` drafts with at least one
+    verdict, up to and including `draft_id`. Adds "drafts": how many were summed.
+    With `weights_version`, only drafts played under that weight set count.
+    """
+    with _conn() as con:
+        ids = [r["draft_id"] for r in con.execute(
+            "SELECT s.draft_id FROM review_stats s JOIN drafts d ON d.id = s.draft_id "
+            "WHERE s.draft_id <= ? AND s.approved + s.rejected > 0 "
+            "AND (? IS NULL OR d.weights_version = ?) "
+            "ORDER BY s.draft_id DESC LIMIT ?",
+            (draft_id, weights_version, weights_version, window),
+        )]
+        if not ids:
+            return {"total": 0, "approved": 0, "rejected": 0, "reason_counts": {}, "drafts": 0}
+        marks = ",".join("?" * len(ids))
+        row = con.execute(
+            f"SELECT SUM(total) AS total, SUM(approved) AS approved, SUM(rejected) AS rejected "
+            f"FROM review_stats WHERE draft_id IN ({marks})",
+            ids,
+        ).fetchone()
+        reasons = con.execute(
+            f"SELECT reason, SUM(count) AS count FROM review_reason_stats "
+            f"WHERE draft_id IN ({marks}) GROUP BY reason HAVING SUM(count) > 0",
+            ids,
+        ).fetchall()
 
     return {
-        "total": len(teams),
-        "approved": approved,
-        "rejected": rejected,
-        "reason_counts": reason_counts,
+        "total": row["total"],
+        "approved": row["approved"],
+        "rejected": row["rejected"],
+        "reason_counts": {r["reason"]: r["count"] for r in reasons},
+        "drafts": len(ids),
     }
 
 
@@ -239,6 +567,15 @@ def get_pending_proposal() -> dict | None:
     return {"id": row["id"], "draft_id": row["draft_id"], "proposals": json.loads(row["proposals"])}
 
 
+def update_proposal(proposal_id: int, proposals: list[dict]) -> None:
+    """Replace the proposal list of a pending proposal (e.g. after !setweight)."""
+    with _conn() as con:
+        con.execute(
+            "UPDATE weight_proposals SET proposals = ? WHERE id = ?",
+            (json.dumps(proposals), proposal_id),
+        )
+
+
 def confirm_proposal(proposal_id: int, applied_keys: list[str]) -> None:
     """Mark proposal confirmed; skipped items are noted via applied_keys."""
     with _conn() as con:
@@ -280,3 +617,106 @@ def get_weight_history(limit: int = 20) -> list[dict]:
             (limit,),
         ).fetchall()
     return [dict(r) for r in rows]
+
+
+def save_weight_set(version: str, weights: dict[str, float]) -> None:
+    """Remember the values behind a Weights.version (no-op if already stored)."""
+    with _conn() as con:
+        con.execute(
+            "INSERT OR IGNORE INTO weight_sets (version, weights, first_seen) VALUES (?, ?, ?)",
+            (version, json.dumps(weights), datetime.utcnow().isoformat()),
+        )
+
+
+def get_weight_set(version: str) -> dict[str, float] | None:
+    with _conn() as con:
+        row = con.execute("SELECT weights FROM weight_sets WHERE version = ?", (version,)).fetchone()
+    return json.loads(row["weights"]) if row else None
+
+
+# ── Analytics ─────────────────────────────────────────────────────────────────
+# Cross-draft aggregates over the `picks` table.
+
+ARCHETYPES: dict[str, int] = {
+    "ball_dominant":       F_BALL_DOMINANT,
+    "shot_creator":        F_SHOT_CREATOR,
+    "shooter":             F_SHOOTER,
+    "high_portability":    F_HIGH_PORTABILITY,
+    "non_scoring_big":     F_NON_SCORING_BIG,
+    "soft_big":            F_SOFT_BIG,
+    "immobile_center":     F_IMMOBILE_CENTER,
+    "versatile_defender":  F_VERSATILE_DEFENDER,
+    "perimeter_defender":  F_PERIMETER_DEFENDER,
+    "elite_rim_protector": F_ELITE_RIM_PROTECTOR,
+    "elite_playmaker":     F_ELITE_PLAYMAKER,
+    "pnr_creator":         F_PNR_CREATOR,
+    "do_not_draft":        F_DO_NOT_DRAFT,
+}
+
+
+def adp_by_player(min_drafts: int = 1, limit: int | None = None,
+                  player: str | None = None) -> list[dict]:
+    """
+    Observed draft position per player, best first:
+    [{player, drafts, adp, avg_round, earliest, latest, round1}]
+    round1 = how many times the player went in round 1.
+    """
+    sql = (
+        "SELECT player, COUNT(*) AS drafts, AVG(overall_pick) AS adp, AVG(round) AS avg_round, "
+        "MIN(overall_pick) AS earliest, MAX(overall_pick) AS latest, SUM(round = 1) AS round1 "
+        "FROM picks "
+    )
+    params: list = []
+    if player is not None:
+        sql += "WHERE player = ? "
+        params.append(player)
+    sql += "GROUP BY player HAVING COUNT(*) >= ? ORDER BY adp"
+    params.append(min_drafts)
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    with _conn() as con:
+        rows = con.execute(sql, params).fetchall()
+    return [dict(r) for r in rows]
+
+
+def co_occurrence(player: str, limit: int = 20) -> list[dict]:
+    """
+    Players most often drafted onto the same team as `player`:
+    [{player, teams, rejected}] — rejected counts reviewed teams rejected.
+    """
+    with _conn() as con:
+        rows = con.execute(
+            "SELECT b.player, COUNT(*) AS teams, COALESCE(SUM(t.verdict = 'rejected'), 0) AS rejected "
+            "FROM picks a "
+            "JOIN picks b       ON b.team_draft_id = a.team_draft_id AND b.player != a.player "
+            "JOIN team_drafts t ON t.id = a.team_draft_id "
+            "WHERE a.player = ? "
+            "GROUP BY b.player ORDER BY teams DESC, b.player LIMIT ?",
+            (player, limit),
+        ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def rejection_rate_by_archetype(min_teams: int = 1) -> list[dict]:
+    """
+    For each archetype, the share of reviewed teams with at least one such
+    player that were rejected: [{archetype, teams, rejected, rate}], highest rate first.
+    """
+    values = ", ".join("(?, ?)" for _ in ARCHETYPES)
+    params = [x for item in ARCHETYPES.items() for x in item]
+    with _conn() as con:
+        rows = con.execute(
+            f"WITH arch(archetype, bit) AS (VALUES {values}) "
+            "SELECT a.archetype, COUNT(DISTINCT t.id) AS teams, "
+            "COUNT(DISTINCT CASE WHEN t.verdict = 'rejected' THEN t.id END) AS rejected "
+            "FROM arch a "
+            "JOIN picks p       ON p.flags & a.bit "
+            "JOIN team_drafts t ON t.id = p.team_draft_id "
+            "WHERE t.verdict IS NOT NULL "
+            "GROUP BY a.archetype HAVING COUNT(DISTINCT t.id) >= ?",
+            (*params, min_teams),
+        ).fetchall()
+    out = [{**dict(r), "rate": r["rejected"] / r["teams"]} for r in rows]
+    out.sort(key=lambda r: (-r["rate"], r["archetype"]))
+    return out
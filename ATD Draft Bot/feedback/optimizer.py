@@ -0,0 +1,376 @@
+"""
+feedback/optimizer.py
+Offline weight search over simulated drafts.
+
+Where analyzer/proposer nudge weights by a fixed percentage after one reviewed
+draft, the optimizer scores whole weight vectors on many headless drafts
+(see simulator.py) and searches the WEIGHT_BOUNDS box with a (1+λ) evolution
+strategy. Every candidate is evaluated on the same draft seeds, so differences
+in loss come from the weights rather than the dice.
+
+Objectives, computed per team from its final roster:
+  - composition violations, named after the review reasons they stand in for
+    (no scorer, no shooting, position stack, ball-dominant conflict, ...)
+  - ADP fidelity: mean |overall pick − ADP|, in rounds
+  - tier coverage: share of tiers 1-10 the roster is missing
+
+The result is a proposal list in the same shape build_proposals() returns, so
+it can be saved as a pending proposal and applied with !confirmweights.
+
+Usage (from the ATD Draft Bot directory):
+  python -m feedback.optimizer --pool pool.json --drafts 64 --generations 20
+  python -m feedback.optimizer --pool pool.json --reasons no_scorer no_shooting --save
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ai_drafter
+import simulator
+from draft_manager import DraftManager, build_snake_order, pool_hash
+from team_profile import TeamProfile
+from feedback.analyzer import WEIGHT_BOUNDS, REASON_WEIGHTS
+
+# ── Objectives ────────────────────────────────────────────────────────────────
+# Each metric is a per-team rate or average; the loss is their weighted sum.
+
+OBJECTIVE_WEIGHTS: dict[str, float] = {
+    "no_scorer":              1.0,   # no shot creator in picks 1-5
+    "bench_issues":           0.5,   # no shot creator in picks 6-10
+    "no_shooting":            1.0,   # no shooter on the roster
+    "no_defense":             0.5,   # no versatile or perimeter defender
+    "position_stack":         1.0,   # a pick that fits no open slot
+    "ball_dominant_conflict": 0.5,   # 2+ ball-dominant players
+    "adp_fidelity":           0.25,  # mean |overall pick − ADP| in rounds
+    "tier_coverage":          1.0,   # share of tiers 1-10 missing
+}
+
+
+def roster_metrics(team: TeamProfile) -> dict[str, float]:
+    """Composition metrics for one finished roster."""
+    return {
+        "no_scorer":              float(team.starter_scorers == 0),
+        "bench_issues":           float(team.bench_scorers == 0),
+        "no_shooting":            float(team.shooter_count == 0),
+        "no_defense":             float(team.defender_count == 0),
+        "position_stack":         float(sum(team.slots.values()) < team.n_picks),
+        "ball_dominant_conflict": float(team.bd_count >= 2),
+        "tier_coverage":          team.missing_tier_count / 10,
+    }
+
+
+def draft_metrics(teams: list[dict], player_adp: dict[str, float]) -> dict[str, float]:
+    """Average roster_metrics over every team, plus ADP fidelity for the draft."""
+    num_teams = len(teams)
+    order = build_snake_order(num_teams)
+    overall: dict[str, int] = {}
+    seen = [0] * num_teams
+    for pick_no, team_idx in enumerate(order, 1):
+        picks = teams[team_idx]["picks"]
+        if seen[team_idx] < len(picks):
+            overall[picks[seen[team_idx]]] = pick_no
+            seen[team_idx] += 1
+
+    totals = dict.fromkeys(OBJECTIVE_WEIGHTS, 0.0)
+    for t in teams:
+        for k, v in roster_metrics(TeamProfile.from_picks(t["picks"], player_adp)).items():
+            totals[k] += v
+    out = {k: v / num_teams for k, v in totals.items()}
+
+    devs = [abs(pick_no - player_adp[p]) for p, pick_no in overall.items() if p in player_adp]
+    out["adp_fidelity"] = (sum(devs) / len(devs) / num_teams) if devs else 0.0
+    return out
+
+
+def loss(metrics: dict[str, float], objective_weights: dict[str, float] | None = None) -> float:
+    ow = objective_weights or OBJECTIVE_WEIGHTS
+    return sum(ow.get(k, 0.0) * v for k, v in metrics.items())
+
+
+# ── Worker side ───────────────────────────────────────────────────────────────
+# Workers are initialised once with the pool (simulator._init_worker); each
+# task carries only the candidate weights and one seed.
+
+_base_weights = ai_drafter.W
+
+
+def _init_worker(player_pool, player_adp, num_teams, engine) -> None:
+    global _base_weights
+    simulator._init_worker(player_pool, player_adp, num_teams, engine, None)
+    _base_weights = ai_drafter.W
+
+
+def _eval_draft(task: tuple[dict[str, float], int]) -> dict[str, float]:
+    weights, seed = task
+    ai_drafter.W = _base_weights.replace(weights)
+    try:
+        teams = simulator.simulate_draft(
+            simulator._worker_pool, simulator._worker_adp,
+            simulator._worker_teams, seed, simulator._worker_engine,
+        )
+    finally:
+        ai_drafter.W = _base_weights
+    return draft_metrics(teams, simulator._worker_adp)
+
+
+# ── Search ────────────────────────────────────────────────────────────────────
+
+class Optimizer:
+    """
+    (1+λ) evolution strategy in the unit cube over the chosen weight keys.
+
+    Each generation samples λ children around the current best with Gaussian
+    steps of size σ (as a fraction of each key's bound width), rounds them to
+    whole numbers like proposer does, and keeps the best child if it beats the
+    parent. σ grows after a success and shrinks after a failure. Evaluations
+    are cached per rounded weight vector, so revisits cost nothing.
+    """
+
+    def __init__(
+        self,
+        player_pool: list[str],
+        player_adp:  dict[str, float],
+        keys:        list[str],
+        drafts:      int = 32,
+        num_teams:   int = 30,
+        seed:        int = 0,
+        workers:     int | None = None,
+        engine:      str = "scalar",
+        objective_weights: dict[str, float] | None = None,
+        cache_path:  str | None = None,
+    ):
+        self.player_pool = player_pool
+        self.player_adp  = player_adp
+        self.keys        = keys
+        self.seeds       = [seed + i for i in range(drafts)]
+        self.num_teams   = num_teams
+        self.workers     = workers
+        self.engine      = engine
+        self.objective_weights = objective_weights or OBJECTIVE_WEIGHTS
+        self.rng         = random.Random(seed)
+        self.cache_path  = cache_path
+        # Everything besides the searched keys that changes a draft's metrics:
+        # engine, teams, seeds, the pool, its ADP and the base weights the
+        # candidates are applied on top of (ai_drafter.W, as workers start with it).
+        adp_digest = hashlib.sha1(json.dumps(sorted(player_adp.items())).encode()).hexdigest()[:16]
+        self._setup = (f"{engine}|{num_teams}|{self.seeds[0]}+{len(self.seeds)}|"
+                       f"{pool_hash(player_pool)}|{adp_digest}|{ai_drafter.W.version}")
+        self.cache: dict[str, dict[str, float]] = {}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                self.cache = json.load(f)
+        self._executor: ProcessPoolExecutor | None = None
+
+    # ── Encoding ─────────────────────────────────────────────────────────────
+    def _cache_key(self, weights: dict[str, float]) -> str:
+        # The whole setup is part of the key, so a cache file reused after a
+        # pool refresh or a weights.json change misses instead of returning
+        # metrics measured under the old setup.
+        vec = ",".join(f"{k}={weights[k]:g}" for k in self.keys)
+        return f"{self._setup}|{vec}"
+
+    def _to_unit(self, weights: dict[str, float]) -> list[float]:
+        out = []
+        for k in self.keys:
+            lo, hi = WEIGHT_BOUNDS[k]
+            out.append((weights[k] - lo) / (hi - lo))
+        return out
+
+    def _from_unit(self, x: list[float]) -> dict[str, float]:
+        out = {}
+        for k, v in zip(self.keys, x):
+            lo, hi = WEIGHT_BOUNDS[k]
+            out[k] = float(round(lo + min(1.0, max(0.0, v)) * (hi - lo)))
+        return out
+
+    # ── Evaluation ───────────────────────────────────────────────────────────
+    def evaluate(self, candidates: list[dict[str, float]]) -> list[dict[str, float]]:
+        """Mean draft metrics for each candidate; uncached ones run in one parallel batch."""
+        todo = [c for c in {self._cache_key(c): c for c in candidates}.items()
+                if c[0] not in self.cache]
+        if todo:
+            tasks = [(w, s) for _, w in todo for s in self.seeds]
+            if self.workers == 1:
+                _init_worker(self.player_pool, self.player_adp, self.num_teams, self.engine)
+                try:
+                    results = [_eval_draft(t) for t in tasks]
+                finally:
+                    ai_drafter.W = _base_weights
+            else:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, initializer=_init_worker,
+                        initargs=(self.player_pool, self.player_adp, self.num_teams, self.engine),
+                    )
+                results = list(self._executor.map(_eval_draft, tasks))
+
+            n = len(self.seeds)
+            for i, (key, _) in enumerate(todo):
+                chunk = results[i * n:(i + 1) * n]
+                self.cache[key] = {m: sum(r[m] for r in chunk) / n for m in chunk[0]}
+            self._save_cache()
+
+        return [self.cache[self._cache_key(c)] for c in candidates]
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        tmp = self.cache_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp, self.cache_path)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    # ── Main loop ────────────────────────────────────────────────────────────
+    def run(
+        self,
+        start:       dict[str, float],
+        generations: int = 20,
+        population:  int = 8,
+        sigma:       float = 0.15,
+    ) -> dict:
+        """
+        Search from `start` (current weights). Returns
+        {"start": {...}, "best": {...}, "start_metrics", "best_metrics",
+         "start_loss", "best_loss", "evaluations"}.
+        """
+        parent = {k: float(start[k]) for k in self.keys}
+        parent_metrics = self.evaluate([parent])[0]
+        parent_loss = loss(parent_metrics, self.objective_weights)
+        result = {"start": dict(parent), "start_metrics": parent_metrics, "start_loss": parent_loss}
+        print(f"[Opt] start loss {parent_loss:.4f}")
+
+        for gen in range(1, generations + 1):
+            t0 = time.perf_counter()
+            x = self._to_unit(parent)
+            children = [
+                self._from_unit([v + self.rng.gauss(0.0, sigma) for v in x])
+                for _ in range(population)
+            ]
+            metrics = self.evaluate(children)
+            losses = [loss(m, self.objective_weights) for m in metrics]
+            best_i = min(range(len(children)), key=losses.__getitem__)
+
+            if losses[best_i] < parent_loss:
+                parent, parent_metrics, parent_loss = children[best_i], metrics[best_i], losses[best_i]
+                sigma = min(sigma * 1.3, 0.5)
+                mark = "↓"
+            else:
+                sigma = max(sigma * 0.8, 0.01)
+                mark = " "
+            print(f"[Opt] gen {gen:>3} {mark} loss {parent_loss:.4f}  σ={sigma:.3f}  "
+                  f"({time.perf_counter() - t0:.1f}s)")
+
+        result.update(best=parent, best_metrics=parent_metrics, best_loss=parent_loss,
+                      evaluations=len(self.cache))
+        return result
+
+
+# ── Proposal output ───────────────────────────────────────────────────────────
+
+def build_optimizer_proposals(result: dict, drafts: int) -> list[dict]:
+    """
+    Turn an Optimizer.run() result into the proposal list format used by
+    build_proposals() / apply_proposals().
+    """
+    start_m, best_m = result["start_metrics"], result["best_metrics"]
+    improved = [
+        f"{m} {start_m[m]:.3f}→{best_m[m]:.3f}"
+        for m in OBJECTIVE_WEIGHTS if best_m.get(m, 0) < start_m.get(m, 0)
+    ]
+    reason = (f"optimizer: loss {result['start_loss']:.3f} → {result['best_loss']:.3f} "
+              f"over {drafts} simulated drafts")
+    if improved:
+        reason += f" ({', '.join(improved[:3])})"
+
+    proposals = []
+    for key, new in result["best"].items():
+        old = result["start"][key]
+        if new == old:
+            continue
+        proposals.append({
+            "key":        key,
+            "old_value":  old,
+            "new_value":  new,
+            "pct_change": round((new - old) / old * 100, 1) if old else 0.0,
+            "reason":     reason,
+        })
+    proposals.sort(key=lambda p: abs(p["pct_change"]), reverse=True)
+    return proposals
+
+
+def _search_keys(weights: dict, reasons: list[str] | None, keys: list[str] | None) -> list[str]:
+    if keys:
+        chosen = keys
+    elif reasons:
+        chosen = list(dict.fromkeys(w["key"] for r in reasons for w in REASON_WEIGHTS[r]))
+    else:
+        chosen = list(WEIGHT_BOUNDS)
+    return [k for k in chosen if k in WEIGHT_BOUNDS and k in weights]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search weight space on simulated drafts.")
+    parser.add_argument("--pool", required=True, help="player pool snapshot (.csv or .json)")
+    parser.add_argument("--drafts", type=int, default=32, help="simulated drafts per candidate")
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--engine", choices=["scalar", "vector"], default="vector")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population", type=int, default=8)
+    parser.add_argument("--sigma", type=float, default=0.15)
+    parser.add_argument("--reasons", nargs="+", choices=sorted(REASON_WEIGHTS),
+                        help="only search the weights tied to these review reasons")
+    parser.add_argument("--keys", nargs="+", help="only search these weight keys")
+    parser.add_argument("--objectives", help="JSON file overriding OBJECTIVE_WEIGHTS")
+    parser.add_argument("--cache", default="optimizer_cache.json")
+    parser.add_argument("--out", default="optimizer_proposal.json")
+    parser.add_argument("--save", action="store_true",
+                        help="store the result as the pending proposal for !confirmweights")
+    args = parser.parse_args()
+
+    dm = DraftManager()
+    dm.load_pool_snapshot(args.pool)
+
+    objective_weights = dict(OBJECTIVE_WEIGHTS)
+    if args.objectives:
+        with open(args.objectives) as f:
+            objective_weights.update(json.load(f))
+
+    keys = _search_keys(ai_drafter.W, args.reasons, args.keys)
+    if not keys:
+        parser.error("no searchable weight keys selected")
+    print(f"[Opt] searching {len(keys)} weights × {args.drafts} drafts/candidate")
+
+    opt = Optimizer(dm.player_pool, dm.player_adp, keys, args.drafts, args.teams,
+                    args.seed, args.workers, args.engine, objective_weights, args.cache)
+    try:
+        result = opt.run(ai_drafter.W, args.generations, args.population, args.sigma)
+    finally:
+        opt.close()
+
+    proposals = build_optimizer_proposals(result, args.drafts)
+    with open(args.out, "w") as f:
+        json.dump({"proposals": proposals, **result}, f, indent=2)
+    print(f"[Opt] {len(proposals)} proposed change(s) → {args.out}")
+
+    if args.save and proposals:
+        from feedback import db as fdb
+        fdb.init_db()
+        # weight_proposals.draft_id is NOT NULL; 0 marks an offline proposal
+        pid = fdb.save_proposal(0, proposals)
+        print(f"[Opt] saved as pending proposal #{pid} — apply with !confirmweights")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,9 @@ import json
 import os
 from datetime import datetime
 
-from feedback.analyzer import WEIGHT_BOUNDS, REASON_LABELS, compute_signals
+from feedback.analyzer import WEIGHT_BOUNDS, REASON_LABELS, SIGNAL_WINDOW_DRAFTS, compute_signals
 from feedback import db as fdb
+import weights
 
 _WEIGHTS_PATH = os.path.join(os.path.dirname(__file__), "..", "weights.json")
 
@@ -21,29 +22,35 @@ def _load_weights() -> dict:
 
 def _save_weights(data: dict) -> None:
     data["_last_updated"] = datetime.utcnow().strftime("%Y-%m-%d")
-    with open(_WEIGHTS_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    weights.save(_WEIGHTS_PATH, data)   # atomic — the bot's watcher may be reading
 
 
 # ── Proposal generation ───────────────────────────────────────────────────────
 
 def build_proposals(draft_id: int) -> list[dict]:
     """
-    Run analysis on a completed draft and return a list of proposed changes:
+    Run analysis after a draft's review and return a list of proposed changes.
+    Signals come from the last SIGNAL_WINDOW_DRAFTS reviewed drafts up to and
+    including this one that were played under the current weights.json
+    (precomputed aggregates, no review rows are rescanned). Once a change is
+    confirmed the version moves on, so rejections that drove it aren't counted
+    again against the new values:
     [
         {
             "key":        "ball_dominant_single",
             "old_value":  40,
             "new_value":  50,
             "pct_change": 25.0,
-            "reason":     "4 teams rejected for ball-dominant conflict (50% of rejections)"
+            "reason":     "4 rejections over last 3 drafts: Ball-dominant conflict"
         },
         ...
     ]
     Returns an empty list if there are no actionable signals.
     """
-    summary = fdb.get_review_summary(draft_id)
+    version = weights.load(_WEIGHTS_PATH).version
+    summary = fdb.get_rolling_summary(draft_id, SIGNAL_WINDOW_DRAFTS, weights_version=version)
     signals = compute_signals(summary)
+    span = "this draft" if summary["drafts"] == 1 else f"last {summary['drafts']} drafts"
     if not signals:
         return []
 
@@ -72,7 +79,7 @@ def build_proposals(draft_id: int) -> list[dict]:
             if reason in REASON_WEIGHTS:
                 if any(w["key"] == key for w in REASON_WEIGHTS[reason]):
                     label = REASON_LABELS.get(reason, reason)
-                    driving_reasons.append(f"{count} rejections: {label}")
+                    driving_reasons.append(f"{count} rejections over {span}: {label}")
 
         proposals.append({
             "key":        key,
@@ -0,0 +1,161 @@
+# name_index.py
+# Fuzzy player-name lookup for human pick messages.
+#
+# Names are indexed once per pool under a normalized key (player_meta.normalize:
+# lowercase, accents and punctuation stripped — the same key the shared player
+# metadata is indexed by), by whole token, by surname and by character trigram.
+# A lookup tries, in order:
+#   1. exact normalized match           "shaquille oneal"  → Shaquille O'Neal
+#   2. whole-token match (partial=True) "jokic" / "magic"  → the one player with
+#      that token. If several players share it ("davis", "james") the name is
+#      ambiguous and nothing is returned — no guessing between them
+#   3. fuzzy match — only names sharing the most trigrams with the query are
+#      scored, with difflib's ratio on the text as typed against the names as
+#      written (case-sensitive, exactly as difflib.get_close_matches scored the
+#      whole pool before). A tie for the best score is ambiguous: None
+# add()/remove() keep the index current as players are drafted.
+
+import difflib
+from collections import defaultdict
+
+from player_meta import normalize
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+_MAX_FUZZY_CANDIDATES = 25   # names scored with difflib per lookup
+
+
+def _surname(tokens: list[str]) -> str:
+    core = [t for t in tokens if t not in _SUFFIXES]
+    return core[-1] if core else tokens[-1]
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    def __init__(self, names=()):
+        self._key:      dict[str, str] = {}                      # name → normalized key
+        self._exact:    dict[str, str] = {}                      # key → name
+        self._tokens:   dict[str, set[str]] = defaultdict(set)   # token → names
+        self._surnames: dict[str, set[str]] = defaultdict(set)   # surname → names
+        self._grams:    dict[str, set[str]] = defaultdict(set)   # trigram → names
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._key)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._key
+
+    def add(self, name: str) -> None:
+        if name in self._key:
+            return
+        key = normalize(name)
+        self._key[name] = key
+        self._exact.setdefault(key, name)
+        tokens = key.split()
+        if tokens:
+            for t in tokens:
+                self._tokens[t].add(name)
+            self._surnames[_surname(tokens)].add(name)
+        for g in _trigrams(key):
+            self._grams[g].add(name)
+
+    def remove(self, name: str) -> None:
+        key = self._key.pop(name, None)
+        if key is None:
+            return
+        if self._exact.get(key) == name:
+            del self._exact[key]
+        tokens = key.split()
+        for t in tokens:
+            self._tokens[t].discard(name)
+        if tokens:
+            self._surnames[_surname(tokens)].discard(name)
+        for g in _trigrams(key):
+            self._grams[g].discard(name)
+
+    def resolve(self, text: str, cutoff: float = 0.6, partial: bool = True) -> str | None:
+        """
+        Best match for `text`, or None if nothing scores `cutoff` or better.
+        partial=False skips the whole-token step (use it when a wrong partial
+        hit would be misleading, e.g. the already-drafted check).
+        """
+        key = normalize(text)
+        if not key:
+            return None
+        if key in self._exact:
+            return self._exact[key]
+
+        if partial:
+            tokens = key.split()
+            hits = set.intersection(*(self._tokens.get(t, set()) for t in tokens))
+            if len(hits) == 1:
+                return next(iter(hits))
+            if hits:
+                return None   # several players share the name: ambiguous
+
+        # Trigram pruning: count shared trigrams, score only the best few
+        shared: dict[str, int] = defaultdict(int)
+        for g in _trigrams(key):
+            for name in self._grams.get(g, ()):
+                shared[name] += 1
+        if not shared:
+            return None
+        candidates = sorted(shared, key=lambda n: (-shared[n], n))[:_MAX_FUZZY_CANDIDATES]
+
+        sm = difflib.SequenceMatcher()
+        sm.set_seq2(text.strip())
+        best, best_ratio, tied = None, cutoff, False
+        for name in candidates:
+            sm.set_seq1(name)
+            if sm.real_quick_ratio() >= best_ratio and sm.quick_ratio() >= best_ratio:
+                r = sm.ratio()
+                if r > best_ratio or (r == best_ratio and best is None):
+                    best, best_ratio, tied = name, r, False
+                elif r == best_ratio:
+                    tied = True
+        return None if tied else best
+
+
+if __name__ == "__main__":
+    # Resolver self-check: python name_index.py
+    index = NameIndex([
+        "Michael Jordan", "DeAndre Jordan", "LeBron James", "James Harden", "James Worthy",
+        "Anthony Davis", "Baron Davis", "Walter Davis", "David West", "Klay Thompson",
+        "Amen Thompson", "David Robinson", "Duncan Robinson", "Nikola Jokić",
+        "Shaquille O'Neal", "Giannis Antetokounmpo", "Carmelo Anthony",
+    ])
+    cases = {
+        # exact, ignoring case, accents and punctuation
+        "michael jordan":   "Michael Jordan",
+        "Nikola Jokic":     "Nikola Jokić",
+        "shaquille oneal":  "Shaquille O'Neal",
+        # a name only one player has
+        "jokic":            "Nikola Jokić",
+        "giannis":          "Giannis Antetokounmpo",
+        # names several players share are ambiguous, even as a surname
+        "jordan":           None,
+        "davis":            None,
+        "thompson":         None,
+        "robinson":         None,
+        "james":            None,
+        "anthony":          None,
+        # typos
+        "Micheal Jordan":   "Michael Jordan",
+        "Anthony Daviss":   "Anthony Davis",
+        "Klay Thomson":     "Klay Thompson",
+        "Zzz Qqq":          None,
+    }
+    failed = [(q, want, index.resolve(q)) for q, want in cases.items() if index.resolve(q) != want]
+    # A tie for the best fuzzy score resolves to nothing
+    tie = NameIndex(["Bob Smitt", "Bob Smitz"])
+    if tie.resolve("Bob Smith") is not None:
+        failed.append(("Bob Smith", None, tie.resolve("Bob Smith")))
+    for q, want, got in failed:
+        print(f"  {q!r}: expected {want!r}, got {got!r}")
+    print("OK" if not failed else f"{len(failed)} failures")
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,146 @@
+# outlook.py
+# Monte Carlo "who will still be there at my next pick" estimate for !outlook.
+#
+# snapshot() copies what a simulation needs from a live DraftManager: the
+# available pool (AvailablePool.copy — only the alive flags are copied), and
+# the roster length and TeamProfile of every team picking before the user's
+# next turn. It runs on the event loop, so the live draft can't change state
+# underneath it. run() then replays those picks with the AI engine over and
+# over, queued on the pick scheduler's worker processes at sim priority so it
+# never delays a live pick or touches the bot process's RNG:
+#   - each simulation copies the snapshot and updates it pick by pick
+#     (AvailablePool.remove, TeamProfile.add), so nothing is rebuilt from
+#     rosters, and the engine uses its windowed ADP path and indexed player
+#     records exactly as in a real draft
+#   - every team in the window, human or not, is simulated with the AI
+#   - run() stops at max_sims or when the time budget is spent, and reports
+#     the simulations finished so far (complete=False)
+
+import random
+import time
+from dataclasses import dataclass
+
+import ai_drafter
+from available_pool import AvailablePool
+from team_profile import TeamProfile
+from weights import Weights
+
+
+def _engine(name: str):
+    if name == "vector":
+        import vector_drafter
+        return vector_drafter
+    return ai_drafter
+
+
+@dataclass
+class OutlookJob:
+    team_slot:  int
+    next_pick:  int                               # overall pick number of the user's next turn
+    window:     list[tuple[int, int]]             # (overall pick, team slot) before that turn
+    available:  AvailablePool
+    rosters:    dict[int, int]                    # team slot → picks made so far
+    profiles:   dict[int, TeamProfile]
+    player_adp: dict[str, float]
+    pool_size:  int
+    num_teams:  int
+    weights:    Weights                           # ai_drafter.W at snapshot time
+
+
+@dataclass
+class Outlook:
+    next_pick: int
+    picks_before: int              # picks by other teams before the user's turn
+    sims:      int
+    elapsed:   float               # seconds
+    complete:  bool                # False if the time budget ran out first
+    survival:  dict[str, float]    # player → share of sims they were still available
+
+
+def snapshot(dm, team_slot: int) -> OutlookJob | None:
+    """
+    Freeze the state needed to simulate up to `team_slot`'s next pick.
+    None if that team has no pick left after the current one, or is on the clock now.
+    """
+    order, current = dm.pick_order, dm.current_pick
+    if current < len(order) and order[current] == team_slot:
+        return None
+    next_idx = next((i for i in range(current, len(order)) if order[i] == team_slot), None)
+    if next_idx is None:
+        return None
+    window = [(i + 1, order[i]) for i in range(current, next_idx)]
+    slots = {t for _, t in window}
+    return OutlookJob(
+        team_slot=team_slot,
+        next_pick=next_idx + 1,
+        window=window,
+        available=dm.available_players.copy(),
+        rosters={t: len(dm.teams[t].picks) for t in slots},
+        profiles={t: dm.teams[t].profile.copy() for t in slots},
+        player_adp=dm.player_adp,
+        pool_size=len(dm.player_pool),
+        num_teams=dm.total_teams,
+        weights=ai_drafter.W,
+    )
+
+
+def _simulate(job: OutlookJob, ai) -> AvailablePool:
+    """One pass over the window. Returns who is left at the user's turn."""
+    available = job.available.copy()
+    profiles  = {t: p.copy() for t, p in job.profiles.items()}
+    # pick() only reads len(team_picks) when given a profile
+    rosters   = {t: [None] * n for t, n in job.rosters.items()}
+    adp = job.player_adp
+    for overall, t in job.window:
+        if not available:
+            break
+        player = ai.pick(rosters[t], available, player_adp=adp, pool_size=job.pool_size,
+                         overall_pick=overall, num_teams=job.num_teams, profile=profiles[t])
+        available.remove(player)
+        rosters[t].append(player)
+        profiles[t].add(player, adp.get(player, 9999.0))
+    return available
+
+
+def run(job: OutlookJob, players: list[str], time_budget: float, max_sims: int,
+        engine: str = "scalar", seed: int | None = None) -> Outlook:
+    """
+    Simulate job's window up to max_sims times within time_budget seconds
+    (at least one simulation always runs) and return the survival share of
+    each of `players`. Reseeds the global RNG per simulation, like the
+    scheduler's workers do per pick; pass `seed` for a reproducible run.
+    """
+    if job.weights.version != ai_drafter.W.version:
+        ai_drafter.W = job.weights
+    ai = _engine(engine)
+    rng = random.Random(seed)
+    survived = dict.fromkeys(players, 0)
+    start = time.perf_counter()
+    deadline = start + time_budget
+    sims = 0
+    while sims < max_sims and (sims == 0 or time.perf_counter() < deadline):
+        random.seed(rng.getrandbits(32))
+        left = _simulate(job, ai)
+        for p in players:
+            if p in left:
+                survived[p] += 1
+        sims += 1
+    return Outlook(
+        next_pick=job.next_pick,
+        picks_before=len(job.window),
+        sims=sims,
+        elapsed=time.perf_counter() - start,
+        complete=sims >= max_sims,
+        survival={p: n / sims for p, n in survived.items()},
+    )
+
+
+def top_available(job: OutlookJob, n: int) -> list[str]:
+    """The n best currently-available players by raw ADP — the ones worth asking about."""
+    ap = job.available
+    out = []
+    for i in ap.adp_indices():
+        out.append(ap.players[i])
+        if len(out) >= n:
+            break
+    return out
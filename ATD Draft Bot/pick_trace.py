@@ -0,0 +1,76 @@
+# pick_trace.py
+# Opt-in explanations of AI picks, kept per draft for !whypick.
+#
+# With AI_TRACE_PICKS > 0, every AI pick asks the engine for its top
+# AI_TRACE_TOP_K candidates broken down by rule (ai_drafter.explain: raw ADP,
+# then each penalty/pull that fired and its delta). The result is kept in a
+# ring buffer on the DraftManager holding the last AI_TRACE_PICKS picks, so a
+# long draft never grows it. With tracing off (the default) nothing is
+# computed or stored and the engine skips the top-K bookkeeping entirely.
+
+from collections import deque
+from dataclasses import dataclass
+
+from config import AI_TRACE_PICKS
+
+_MAX_RULES_SHOWN = 8   # per candidate: the largest |delta|, shown in the order they fired
+
+
+@dataclass
+class PickTrace:
+    overall_pick:    int
+    round:           int
+    team:            str
+    player:          str          # who was actually picked (jitter can reorder the top few)
+    source:          str          # ai | auto
+    weights_version: str | None
+    candidates:      list[dict]   # ai_drafter.explain() dicts, best effective ADP first
+
+
+class TraceBuffer:
+    def __init__(self, size: int = AI_TRACE_PICKS):
+        self.size = max(0, size)
+        self._traces: deque[PickTrace] = deque(maxlen=self.size or 1)
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def add(self, trace: PickTrace) -> None:
+        if self.enabled:
+            self._traces.append(trace)
+
+    def get(self, overall_pick: int) -> PickTrace | None:
+        return next((t for t in self._traces if t.overall_pick == overall_pick), None)
+
+    def picks(self) -> list[int]:
+        return [t.overall_pick for t in self._traces]
+
+    def __len__(self) -> int:
+        return len(self._traces) if self.enabled else 0
+
+
+def _fmt_delta(delta: float) -> str:
+    return f"{delta:+.0f}" if delta == int(delta) else f"{delta:+.1f}"
+
+
+def format_trace(trace: PickTrace) -> str:
+    """Discord message for one traced pick."""
+    lines = [f"🔎 **Pick #{trace.overall_pick}** (R{trace.round}) — "
+             f"**{trace.team}** took **{trace.player}**"
+             + (" _(timeout)_" if trace.source == "auto" else "")]
+    for rank, c in enumerate(trace.candidates, 1):
+        adp = f"{c['adp']:.1f}" if c["adp"] is not None else "?"
+        mark = " ✅" if c["player"] == trace.player else ""
+        lines.append(f"`{rank}.` **{c['player']}**{mark} — ADP {adp} → eff **{c['eff']:.1f}**")
+        rules = c["rules"]
+        keep = sorted(sorted(range(len(rules)), key=lambda i: -abs(rules[i][1]))[:_MAX_RULES_SHOWN])
+        shown = [f"`{rules[i][0]}` {_fmt_delta(rules[i][1])}" for i in keep]
+        if len(rules) > _MAX_RULES_SHOWN:
+            shown.append(f"+{len(rules) - _MAX_RULES_SHOWN} smaller")
+        lines.append("  ↳ " + (" · ".join(shown) if shown else "no adjustments (pure ADP)"))
+    if trace.candidates and trace.candidates[0]["player"] != trace.player:
+        lines.append("_Scores within the random jitter (±1 in R1, ±4 after) can swap places._")
+    if trace.weights_version:
+        lines.append(f"_Weights `{trace.weights_version}`_")
+    return "\n".join(lines)
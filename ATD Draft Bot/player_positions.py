@@ -1,744 +0,0 @@
-PLAYER_POSITIONS = {
-    # ── Point Guards ──────────────────────────────────────────────────────────
-    "Magic Johnson":             "PG",
-    "Stephen Curry":             "PG/SG",
-    "Chris Paul":                "PG",
-    "Steve Nash":                "PG",
-    "Oscar Robertson":           "PG",
-    "John Stockton":             "PG",
-    "Isiah Thomas":              "PG",
-    "Gary Payton":               "PG",
-    "Jason Kidd":                "PG",
-    "Kyrie Irving":              "PG/SG",
-    "Russell Westbrook":         "PG",
-    "Damian Lillard":            "PG",
-    "Allen Iverson":             "PG/SG",
-    "Chauncey Billups":          "PG",
-    "Walt Frazier":              "PG/SG",
-    "Dennis Johnson":            "PG/SG",
-    "Tiny Archibald":            "PG",
-    "Bob Cousy":                 "PG",
-    "Penny Hardaway":            "PG/SG",
-    "Rajon Rondo":               "PG",
-    "Deron Williams":            "PG",
-    "Tyrese Haliburton":         "PG",
-    "Jalen Brunson":             "PG",
-    "Trae Young":                "PG",
-    "Lenny Wilkens":             "PG",
-    "Dave Bing":                 "PG/SG",
-    "Pete Maravich":             "PG/SG",
-    "Gus Williams":              "PG",
-    "Paul Westphal":             "PG",
-    "Tim Hardaway Sr.":          "PG",
-    "Mark Price":                "PG",
-    "Kevin Johnson":             "PG",
-    "Terry Porter":              "PG",
-    "Terrell Brandon":           "PG",
-    "Darrell Armstrong":         "PG",
-    "Gail Goodrich":             "SG/PG",
-    "Norm Van Lier":             "PG",
-    "Nate McMillan":             "PG",
-    "Don Buse":                  "PG",
-    "Micheal Williams":          "PG",
-    "De'Aaron Fox":              "PG",
-    "Ja Morant":                 "PG",
-    "Lonzo Ball":                "PG",
-    "LaMelo Ball":               "PG",
-    "Derrick Rose":              "PG",
-    "John Wall":                 "PG",
-    "Baron Davis":               "PG",
-    "Gilbert Arenas":            "PG",
-    "Kyle Lowry":                "PG",
-    "Mike Conley":               "PG",
-    "Kemba Walker":              "PG",
-    "Fred VanVleet":             "PG",
-    "Sleepy Floyd":              "PG",
-    "Kenny Anderson":            "PG",
-    "Sam Cassell":               "PG",
-    "Rod Strickland":            "PG",
-    "Steve Francis":             "PG",
-    "Stephon Marbury":           "PG",
-    "Mo Williams":               "PG",
-    "Ricky Rubio":               "PG",
-    "Darius Garland":            "PG",
-    "Jamal Murray":              "PG",
-    "Goran Dragic":              "PG",
-    "Fat Lever":                 "PG",
-    "Maurice Cheeks":            "PG",
-    "Ty Lawson":                 "PG",
-    "Lucius Allen":              "PG",
-    "Doc Rivers":                "PG",
-    "Mookie Blaylock":           "PG",
-    "Mike Bibby":                "PG",
-    "Jerry Sloan":               "SG/PG",
-    "Brian Taylor":              "PG/SG",
-    "Calvin Murphy":             "PG",
-    "Louie Dampier":             "PG/SG",
-    "JoJo White":                "PG",
-    "Quinn Buckner":             "PG",
-    "Andre Miller":              "PG",
-    "Sam Lacey":                 "C",
-    "Johnny Moore":              "PG",
-    "Sleepy Floyd":              "PG",
-    "Ricky Pierce":              "SG",
-    "Anthony Parker":            "SG",
-    "Jason Williams":            "PG",
-    "Isaiah Thomas":             "PG",
-
-    # ── Shooting Guards ───────────────────────────────────────────────────────
-    "Michael Jordan":            "SG/PG",
-    "Kobe Bryant":               "SG",
-    "Jerry West":                "SG/PG",
-    "Dwyane Wade":               "SG/PG",
-    "Shai Gilgeous-Alexander":   "SG/PG",
-    "Shai Gilgeous Alexander":   "SG/PG",
-    "James Harden":              "PG/SG",
-    "Tracy McGrady":             "SG/SF",
-    "Clyde Drexler":             "SG/SF",
-    "Reggie Miller":             "SG",
-    "Ray Allen":                 "SG",
-    "Manu Ginobili":             "SG",
-    "Klay Thompson":             "SG",
-    "Anthony Edwards":           "SG",
-    "Devin Booker":              "SG",
-    "Zach LaVine":               "SG",
-    "Luka Doncic":               "PG/SG",
-    "Cade Cunningham":           "PG",
-    "Jrue Holiday":              "PG/SG",
-    "Donovan Mitchell":          "SG",
-    "Bradley Beal":              "SG",
-    "Tyrese Maxey":              "PG/SG",
-    "Jalen Suggs":               "PG/SG",
-    "Derrick White":             "PG/SG",
-    "CJ McCollum":               "SG",
-    "Jalen Williams":            "SF/SG",
-    "Alex Caruso":               "SG/PG",
-    "Austin Reaves":             "SG/PG",
-    "Jaylen Brown":              "SG/SF",
-    "Malcolm Brogdon":           "SG/PG",
-    "Mitch Richmond":            "SG/SF",
-    "Joe Dumars":                "SG",
-    "Sidney Moncrief":           "SG/PG",
-    "George Gervin":             "SG/SF",
-    "Rick Barry":                "SF",
-    "John Havlicek":             "SF/SG",
-    "Chris Mullin":              "SG/SF",
-    "Dan Majerle":               "SG/SF",
-    "Jeff Hornacek":             "SG/PG",
-    "Michael Cooper":            "SG",
-    "Ron Harper":                "SG/PG",
-    "Steve Smith":               "SG/SF",
-    "Hersey Hawkins":            "SG",
-    "Dale Ellis":                "SG/SF",
-    "Sam Jones":                 "SG/PG",
-    "Lou Hudson":                "SG/SF",
-    "Vince Carter":              "SG/SF",
-    "Peja Stojakovic":           "SF/PF",
-    "Jason Richardson":          "SG/SF",
-    "Michael Finley":            "SG/SF",
-    "Eddie Jones":               "SG/SF",
-    "Reggie Lewis":              "SG/SF",
-    "Phil Chenier":              "SG",
-    "Victor Oladipo":            "SG",
-    "Walter Davis":              "SG/SF",
-    "Brent Barry":               "SG",
-    "Dennis Rodman":             "PF/SF",
-    "Dennis Johnson":            "PG/SG",
-    "Hal Greer":                 "SG/PG",
-    "Dick Van Arsdale":          "SG/SF",
-    "Paul Arizin":               "SG/SF",
-    "Richie Guerin":             "SG/PG",
-    "Bill Sharman":              "SG/PG",
-    "Jack Twyman":               "SG/SF",
-    "World B. Free":             "SG/PG",
-    "Kyle Korver":               "SG/SF",
-    "Derek Harper":              "PG/SG",
-    "Latrell Sprewell":          "SG/SF",
-    "Marques Johnson":           "SF",
-    "Byron Scott":               "SG/PG",
-    "Danny Ainge":               "SG",
-    "Rolando Blackman":          "SG",
-    "Jim Paxson":                "SG/PG",
-    "Archie Clark":              "SG/PG",
-    "Otis Birdsong":             "SG",
-    "Kevin Martin":              "SG",
-    "Allan Houston":             "SG",
-    "Raja Bell":                 "SG",
-    "Kerry Kittles":             "SG",
-    "Bobby Phills":              "SG/SF",
-    "JJ Redick":                 "SG",
-    "Doug Collins":              "SG/PG",
-    "Brian Winters":             "SG/PG",
-    "Bryon Russell":             "SF/SG",
-    "Arron Afflalo":             "SG",
-    "Kendall Gill":              "SG/PG",
-    "Glen Rice":                 "SF/SG",
-    "Desmond Bane":              "SG/SF",
-    "David Thompson":            "SG/SF",
-    "Bob Love":                  "PF/SF",
-    "Kentavious Caldwell-Pope":  "SG",
-    "Alvin Robertson":           "SG/PG",
-    "Carl Braun":                "SG/PG",
-    "Jon McGlocklin":            "SG",
-    "Phil Smith":                "SG",
-    "Fred Brown":                "SG/PG",
-    "John Starks":               "SG/PG",
-    "JR Smith":                  "SG/PG",
-    "Tony Allen":                "SG/SF",
-    "Thabo Sefolosha":           "SG/SF",
-    "Ben Gordon":                "SG/PG",
-    "Gus Johnson":               "PF/SF",
-    "Gary Harris":               "SG",
-    "Wesley Matthews":           "SG/SF",
-    "Michael Redd":              "SG/SF",
-    "Jason Terry":               "SG/PG",
-    "Bobby Simmons":             "SF/SG",
-    "Wesley Person":             "SG/SF",
-    "Kirk Hinrich":              "PG/SG",
-    "George Hill":               "PG/SG",
-    "Lu Dort":                   "SG/SF",
-    "Duncan Robinson":           "SG/SF",
-    "Norman Powell":             "SG/SF",
-    "Nick Anderson":             "SG/SF",
-    "Andrew Toney":              "SG/PG",
-    "Drazen Petrovic":           "SG/PG",
-    "Herb Jones":                "SG/SF",
-    "Micheal Ray Richardson":    "PG/SG",
-    "Earl Monroe":               "SG/PG",
-    "Billy Knight":              "SF/SG",
-    "Scott Wedman":              "SF/SG",
-    "Doug Christie":             "SG/SF",
-    "Jamal Mashburn":            "SF/SG",
-    "Jason Terry":               "SG/PG",
-    "Eddie Johnson":             "SG/PG",
-    "Paul Pierce":               "SF/SG",
-    "Danny Green":               "SG/SF",
-
-    # ── Small Forwards ────────────────────────────────────────────────────────
-    "LeBron James":              "PF/SF",
-    "Kevin Durant":              "SF/PF",
-    "Kawhi Leonard":             "SF/SG",
-    "Larry Bird":                "SF/PF",
-    "Julius Erving":             "SF/PF",
-    "Paul George":               "SF/SG",
-    "Jayson Tatum":              "SF/PF",
-    "Scottie Pippen":            "SF/PF",
-    "Dominique Wilkins":         "SF",
-    "Grant Hill":                "SF/PG",
-    "Carmelo Anthony":           "SF/PF",
-    "Jimmy Butler":              "SF/SG",
-    "Mikal Bridges":             "SF/SG",
-    "OG Anunoby":                "SF/SG",
-    "Andrew Wiggins":            "SF/SG",
-    "Pascal Siakam":             "PF",
-    "Khris Middleton":           "SF/SG",
-    "Andre Iguodala":            "SF/SG",
-    "Luol Deng":                 "SF",
-    "Nicolas Batum":             "SF/SG",
-    "Tayshaun Prince":           "SF",
-    "James Worthy":              "SF",
-    "Alex English":              "SF",
-    "Elgin Baylor":              "SF",
-    "Connie Hawkins":            "PF",
-    "Bob Dandridge":             "SF/PF",
-    "Robert Horry":              "PF/SF",
-    "Horace Grant":              "PF",
-    "Shawn Marion":              "PF",
-    "Shane Battier":             "SF/PF",
-    "Danny Granger":             "SF/PF",
-    "Rashard Lewis":             "SF/PF",
-    "Hedo Turkoglu":             "SF/PF",
-    "Gordon Hayward":            "SF",
-    "Lamar Odom":                "PF",
-    "Boris Diaw":                "PF",
-    "Detlef Schrempf":           "SF/PF",
-    "Danilo Gallinari":          "SF/PF",
-    "Chet Walker":               "SF/SG",
-    "Kiki VanDeWeghe":           "SF/PF",
-    "Billy Cunningham":          "PF/SF",
-    "Michael Porter Jr.":        "SF",
-    "Deni Avdija":               "SF/PF",
-    "Jalen Johnson":             "SF/PF",
-    "Amen Thompson":             "SF",
-    "Brandon Ingram":            "SF",
-    "Roger Brown":               "SF",
-    "Trevor Ariza":              "SF",
-    "Otto Porter Jr.":           "SF",
-    "Richard Jefferson":         "SF",
-    "Robert Covington":          "SF/PF",
-    "Gerald Wallace":            "SF/PF",
-    "Clifford Robinson":         "SF/PF",
-    "Toni Kukoc":                "SF/PF",
-    "Jamaal Wilkes":             "SF",
-    "David West":                "PF",
-    "Joe Ingles":                "SF/PF",
-    "Jalen Rose":                "SF/PF",
-    "Rudy Tomjanovich":          "SF/PF",
-    "Glenn Robinson":            "SF",
-    "Brian Taylor":              "PG/SG",
-    "Larry Kenon":               "SF/PF",
-    "Mickey Johnson":            "SF/PF",
-    "Marvin Williams":           "PF/SF",
-    "Joakim Noah":               "C",
-    "Derrick Coleman":           "PF",
-    "Anthony Mason":             "PF",
-    "Shareef Abdul-Rahim":       "PF/SF",
-    "Antawn Jamison":            "PF/SF",
-    "Tom Chambers":              "PF/SF",
-    "Andrei Kirilenko":          "PF",
-    "Bobby Jones":               "PF",
-    "Josh Howard":               "SF",
-    "Greg Ballard":              "SF/PF",
-    "Dorian Finney-Smith":       "SF/PF",
-    "Jae Crowder":               "SF/PF",
-    "Scottie Barnes":            "SF/PF",
-    "Aaron Gordon":              "PF/SF",
-    "Trey Murphy":               "SF/SG",
-    "Josh Smith":                "PF",
-    "Jerome Kersey":             "SF/PF",
-    "Larry Johnson":             "PF/SF",
-    "Bob McAdoo":                "PF/C",
-    "Bernard King":              "SF",
-    "Jaden McDaniels":           "SF/PF",
-    "DeMar DeRozan":             "SF",
-    "Myles Turner":              "C/PF",
-    "Calvin Natt":               "SF/SG",
-    "Rodney McCray":             "SF/PF",
-    "Chuck Person":              "SF/PF",
-    "Caron Butler":              "SF/SG",
-    "James Posey":               "SF",
-    "Mike Miller":               "SF/SG",
-    "Wally Szczerbiak":          "SF/SG",
-    "James Silas":               "PG/SG",
-    "Gus Johnson":               "PF/SF",
-    "Dan Roundfield":            "PF",
-    "Mark Aguirre":              "SF/PF",
-    "Xavier McDaniel":           "SF/PF",
-    "Derrick McKey":             "SF/PF",
-    "Sean Elliott":              "SF/SG",
-    "Dave DeBusschere":          "PF/SF",
-    "Willie Wise":               "SF/SG",
-    "Joe Johnson":               "SG/SF",
-    "Lauri Markkanen":           "SF/PF",
-    "Franz Wagner":              "SF/PF",
-    "Danny Green":               "SG/SF",
-
-    # ── Power Forwards ────────────────────────────────────────────────────────
-    "Tim Duncan":                "PF/C",
-    "Karl Malone":               "PF",
-    "Dirk Nowitzki":             "PF",
-    "Giannis Antetokounmpo":     "PF/C",
-    "Charles Barkley":           "PF",
-    "Kevin Garnett":             "PF/C",
-    "Anthony Davis":             "PF/C",
-    "Draymond Green":            "PF",
-    "Rasheed Wallace":           "PF/C",
-    "Paul Millsap":              "PF",
-    "Horace Grant":              "PF",
-    "Dan Roundfield":            "PF",
-    "Zion Williamson":           "PF",
-    "Julius Randle":             "PF",
-    "LaMarcus Aldridge":         "PF/C",
-    "Chris Webber":              "PF",
-    "Lauri Markkanen":           "SF/PF",
-    "Kevin Love":                "PF",
-    "Blake Griffin":             "PF",
-    "Amar'e Stoudemire":         "PF/C",
-    "Shawn Kemp":                "PF/C",
-    "Charles Oakley":            "PF",
-    "Buck Williams":             "PF/C",
-    "Terry Cummings":            "PF/SF",
-    "Bob Pettit":                "PF",
-    "Sam Perkins":               "PF",
-    "PJ Brown":                  "PF/C",
-    "Antonio McDyess":           "PF",
-    "Elton Brand":               "PF/C",
-    "Evan Mobley":               "PF",
-    "Jaren Jackson Jr.":         "PF",
-    "Kristaps Porzingis":        "C/PF",
-    "Serge Ibaka":               "PF/C",
-    "Ben Simmons":               "PF/PG",
-    "Channing Frye":             "PF/C",
-    "Kenyon Martin":             "PF/C",
-    "Jay Vincent":               "PF",
-    "Bo Outlaw":                 "PF/C",
-    "Vin Baker":                 "PF/C",
-    "Elvin Hayes":               "PF/C",
-    "Maurice Lucas":             "PF/C",
-    "Horace Grant":              "PF",
-    "Spencer Haywood":           "PF/C",
-    "Paul Silas":                "PF/C",
-    "Jack Sikma":                "C",
-    "Bill Bridges":              "PF/C",
-    "Mel Daniels":               "C",
-    "Zach Randolph":             "PF/C",
-    "Nene Hilario":              "C/",
-    "Brad Miller":               "C/PF",
-    "Pau Gasol":                 "C/PF",
-    "Jermaine O'Neal":           "C/PF",
-    "Michael Porter Jr.":        "SF",
-    "George McGinnis":           "PF/SF",
-
-    # ── Centers ───────────────────────────────────────────────────────────────
-    "Shaquille O'Neal":          "C",
-    "Kareem Abdul-Jabbar":       "C",
-    "Hakeem Olajuwon":           "C",
-    "Wilt Chamberlain":          "C",
-    "Bill Russell":              "C",
-    "Joel Embiid":               "C",
-    "Nikola Jokic":              "C",
-    "David Robinson":            "C",
-    "Patrick Ewing":             "C",
-    "Bill Walton":               "C",
-    "Moses Malone":              "C",
-    "Dwight Howard":             "C",
-    "Alonzo Mourning":           "C",
-    "Willis Reed":               "C",
-    "Dikembe Mutombo":           "C",
-    "Marc Gasol":                "C",
-    "Rudy Gobert":               "C",
-    "Victor Wembanyama":         "C/PF",
-    "Chet Holmgren":             "C/PF",
-    "Yao Ming":                  "C",
-    "Bob Lanier":                "C",
-    "Artis Gilmore":             "C",
-    "Dave Cowens":               "C/PF",
-    "Nate Thurmond":             "C",
-    "Walt Bellamy":              "C",
-    "Brad Daugherty":            "C",
-    "Robert Parish":             "C",
-    "Mark Eaton":                "C",
-    "Tyson Chandler":            "C",
-    "DeAndre Jordan":            "C",
-    "Jarrett Allen":             "C",
-    "Ivica Zubac":               "C",
-    "Clint Capela":              "C",
-    "Nicolas Claxton":           "C",
-    "Isaiah Hartenstein":        "C",
-    "Bam Adebayo":               "C/PF",
-    "Al Horford":                "C",
-    "Karl-Anthony Towns":        "C/PF",
-    "Brook Lopez":               "C",
-    "Vlade Divac":               "C",
-    "Andrew Bogut":              "C",
-    "Arvydas Sabonis":           "C",
-    "DeMarcus Cousins":          "C/PF",
-    "Nikola Vucevic":            "C",
-    "Domantas Sabonis":          "C",
-    "Deandre Ayton":             "C",
-    "Rik Smits":                 "C",
-    "Zydrunas Ilgauskas":        "C",
-    "Raef LaFrentz":             "C/PF",
-    "Ralph Sampson":             "C",
-    "Andrew Bynum":              "C",
-    "Mychal Thompson":           "C/PF",
-    "Bill Laimbeer":             "C",
-    "Marcus Camby":              "C",
-    "Theo Ratliff":              "C",
-    "Darryl Dawkins":            "C",
-    "Cliff Ray":                 "C",
-    "Zelmo Beaty":               "C",
-    "Tom Boerwinkle":            "C",
-    "Jerry Lucas":               "C/PF",
-    "Mehmet Okur":               "C/PF",
-    "Chris Bosh":                "PF/C",
-    "Pau Gasol":                 "C/PF",
-    "Alvan Adams":               "C/PF",
-    "Robert Williams":           "C",
-    "Ben Wallace":               "C",
-    "Joakim Noah":               "C",
-    "Larry Nance Sr.":           "PF/C",
-    "Tom Gola":                  "SG/PG",
-    "Wes Unseld":                "C/PF",
-    "Bill Cartwright":           "C",
-    "Maurice Stokes":            "PF/C",
-    "Cedric Maxwell":            "SF/PF",
-    "Jermaine O'Neal":           "C/PF",
-
-    # ── Multi-position / Misc ─────────────────────────────────────────────────
-    "Chris Paul":                "PG",
-    "Kiki VanDeWeghe":           "SF/PF",
-    "Penny Hardaway":            "PG/SF",
-    "Andre Iguodala":            "SF/SG",
-    "Danny Manning":             "PF/SF",
-    "Vince Carter":              "SG/SF",
-    "Jrue Holiday":              "PG/SG",
-    "Bobby Jones":               "PF",
-
-    # ── Additional ────────────────────────────────────────────────────────────
-    "Jayson Tatum":              "SF/PF",
-    "Jimmy Butler":              "SF/SG",
-    "Khris Middleton":           "SF/SG",
-    "Mikal Bridges":             "SF/SG",
-    "Paul Pierce":               "SF/SG",
-    "Vince Carter":              "SG/SF",
-    "Penny Hardaway":            "PG/SF",
-    "Grant Hill":                "SF/PG",
-    "Scottie Pippen":            "SF/PF",
-    "Draymond Green":            "PF",
-    "Manu Ginobili":             "SG",
-    "Ray Allen":                 "SG",
-    "Damian Lillard":            "PG",
-    "Derrick Rose":              "PG",
-    "Chet Holmgren":             "C/PF",
-    "Paolo Banchero":            "PF/SF",
-    "Amen Thompson":             "SF",
-    "Franz Wagner":              "SF/PF",
-    "Herb Jones":                "SG/SF",
-    "Scottie Barnes":            "SF/PF",
-    "Jaden McDaniels":           "SF/PF",
-    "Trey Murphy":               "SF/SG",
-    "Lu Dort":                   "SG/SF",
-    "Austin Reaves":             "SG/PG",
-    "Alex Caruso":               "SG/PG",
-    "Derrick White":             "PG/SG",
-    "Deni Avdija":               "SF/PF",
-    "Jalen Johnson":             "SF/PF",
-    "Duncan Robinson":           "SG/SF",
-    "Desmond Bane":              "SG/SF",
-    "Tyrese Maxey":              "PG/SG",
-    "Tyrese Haliburton":         "PG",
-    "Jalen Suggs":               "PG/SG",
-    "Cade Cunningham":           "PG",
-    "Anthony Edwards":           "SG",
-    "Devin Booker":              "SG",
-    "Donovan Mitchell":          "SG",
-    "Zach LaVine":               "SG",
-    "Bradley Beal":              "SG",
-    "Trae Young":                "PG",
-    "LaMelo Ball":               "PG",
-    "Ja Morant":                 "PG",
-    "Evan Mobley":               "PF",
-    "Bam Adebayo":               "C/PF",
-    "Zion Williamson":           "PF",
-    "De'Aaron Fox":              "PG",
-    "Darius Garland":            "PG",
-    "Karl-Anthony Towns":        "C/PF",
-    "Victor Wembanyama":         "C/PF",
-    "Paolo Banchero":            "PF/SF",
-    "Jalen Williams":            "SF/SG",
-    "Lauri Markkanen":           "SF/PF",
-    "Nikola Vucevic":            "C",
-    "Ivica Zubac":               "C",
-    "Domantas Sabonis":          "C",
-    "Jarrett Allen":             "C",
-    "Isaiah Hartenstein":        "C",
-    "Nicolas Claxton":           "C",
-    "Clint Capela":              "C",
-    "Rudy Gobert":               "C",
-    "Brook Lopez":               "C",
-    "Myles Turner":              "C/PF",
-    "Kristaps Porzingis":        "C/PF",
-    "Al Horford":                "C",
-    "Julius Randle":             "PF",
-    "Aaron Gordon":              "PF/SF",
-    "Scottie Barnes":            "SF/PF",
-    "OG Anunoby":                "SF/SG",
-    "Pascal Siakam":             "PF",
-    "Fred VanVleet":             "PG",
-    "Kyle Lowry":                "PG",
-    "Jrue Holiday":              "PG/SG",
-    "Khris Middleton":           "SF/SG",
-    "Giannis Antetokounmpo":     "PF/C",
-    "Kyrie Irving":              "PG/SG",
-    "Jaylen Brown":              "SG/SF",
-    "Malcolm Brogdon":           "SG/PG",
-    "Derrick White":             "PG/SG",
-    "Al Horford":                "C",
-    "Marcus Smart":              "PG/SG",
-    "Mike Conley":               "PG",
-    "Jamal Murray":              "PG/SG",
-    "Nikola Jokic":              "C",
-    "Aaron Gordon":              "PF/SF",
-    "Michael Porter Jr.":        "SF",
-    "Kentavious Caldwell-Pope":  "SG",
-    "Russell Westbrook":         "PG",
-    "LeBron James":              "PF/SF",
-    "Anthony Davis":             "PF/C",
-    "Lonzo Ball":                "PG/SG",
-    "Damian Lillard":            "PG",
-    "CJ McCollum":               "SG/PG",
-    "Anfernee Simons":           "SG/PG",
-    "Jusuf Nurkic":              "C",
-    "Jerami Grant":              "PF/SF",
-    "Anfernee Hardaway":         "PG/SF",
-
-    # Players who may be less common — adding with best known position
-    "Bob McAdoo":                "PF/C",
-    "Jamaal Wilkes":             "SF",
-    "Alvan Adams":               "C/PF",
-    "Dale Ellis":                "SG/SF",
-    "Fat Lever":                 "PG",
-    "Byron Scott":               "SG/PG",
-    "Maurice Lucas":             "PF/C",
-    "Maurice Stokes":            "PF/C",
-    "Spencer Haywood":           "PF/C",
-    "Roger Brown":               "SF",
-    "Mel Daniels":               "C",
-    "Louie Dampier":             "PG/SG",
-    "James Silas":               "PG/SG",
-    "Willie Wise":               "SF/SG",
-    "Sam Lacey":                 "C",
-    "Dave Bing":                 "PG/SG",
-    "Jerry Lucas":               "C/PF",
-    "Bill Bridges":              "PF/C",
-    "JoJo White":                "PG",
-    "Rudy Tomjanovich":          "SF/PF",
-    "Paul Arizin":               "SG/SF",
-    "Richie Guerin":             "SG/PG",
-    "Carl Braun":                "SG/PG",
-    "Tom Gola":                  "SG/PG",
-    "Andrew Toney":              "SG/PG",
-    "Archie Clark":              "SG/PG",
-    "Gus Johnson":               "PF/SF",
-    "Wes Unseld":                "C/PF",
-    "Zelmo Beaty":               "C",
-    "Tom Boerwinkle":            "C",
-    "Darryl Dawkins":            "C",
-    "Calvin Murphy":             "PG",
-    "Bobby Simmons":             "SF/SG",
-    "Danny Manning":             "PF/SF",
-    "Cedric Maxwell":            "SF/PF",
-    "Anthony Parker":            "SG",
-    "Jay Vincent":               "PF",
-    "Nate McMillan":             "PG",
-    "Clifford Ray":              "C",
-    "Bo Outlaw":                 "PF/C",
-    "Norm Van Lier":             "PG",
-    "Don Buse":                  "PG",
-    "Greg Ballard":              "SF/PF",
-    "Sam Jones":                 "SG",
-    "Phil Smith":                "SG",
-    "Fred Brown":                "SG",
-    "Jon McGlocklin":            "SG",
-    "Larry Kenon":               "SF/PF",
-    "Mickey Johnson":            "SF/PF",
-    "Marques Johnson":           "SF",
-    "Paul Pressey":              "SG/PG",
-    "Dan Roundfield":            "PF",
-    "Connie Hawkins":            "PF",
-    "Bob Dandridge":             "SF/PF",
-    "Dick Van Arsdale":          "SG/SF",
-    "George McGinnis":           "PF/SF",
-    "Rodney McCray":             "SF/PF",
-    "Chuck Person":              "SF/PF",
-    "Calvin Natt":               "SF/SG",
-    "Mark Aguirre":              "SF/PF",
-    "Kiki VanDeWeghe":           "SF/PF",
-    "Scott Wedman":              "SF/SG",
-    "Lucius Allen":              "PG",
-    "Quinn Buckner":             "PG",
-    "Micheal Williams":          "PG",
-    "Micheal Ray Richardson":    "PG/SG",
-    "Sleepy Floyd":              "PG",
-    "Brad Daugherty":            "C",
-    "Mark Eaton":                "C",
-    "Walt Bellamy":              "C",
-    "Artis Gilmore":             "C",
-    "Nate Thurmond":             "C",
-    "Willis Reed":               "C",
-    "Elvin Hayes":               "PF/C",
-    "Maurice Cheeks":            "PG",
-    "Mookie Blaylock":           "PG",
-    "Darrell Armstrong":         "PG",
-    "Terrell Brandon":           "PG",
-    "Rod Strickland":            "PG",
-    "Sam Cassell":               "PG",
-    "Baron Davis":               "PG",
-    "Deron Williams":            "PG",
-    "Andre Miller":              "PG",
-    "Doc Rivers":                "PG",
-    "Lenny Wilkens":             "PG",
-    "Paul Westphal":             "PG",
-    "Gus Williams":              "PG",
-    "Tiny Archibald":            "PG",
-    "Tim Hardaway Sr.":          "PG",
-    "Kevin Johnson":             "PG",
-    "Terry Porter":              "PG",
-    "Mark Price":                "PG",
-    "Ricky Rubio":               "PG",
-    "Mo Williams":               "PG",
-    "Stephon Marbury":           "PG",
-    "Steve Francis":             "PG",
-    "Kenny Anderson":            "PG",
-    "Mike Bibby":                "PG",
-    "John Wall":                 "PG",
-    "Gilbert Arenas":            "PG/SG",
-    "Rajon Rondo":               "PG",
-    "Pete Maravich":             "PG/SG",
-    "Hal Greer":                 "SG/PG",
-    "Bill Sharman":              "SG/PG",
-    "Bob Cousy":                 "PG",
-    "Richie Guerin":             "SG/PG",
-    "Gail Goodrich":             "SG/PG",
-    "World B. Free":             "SG/PG",
-    "Brian Winters":             "SG/PG",
-    "Eddie Johnson":             "SG/PG",
-    "Ty Lawson":                 "PG",
-    "Goran Dragic":              "PG/SG",
-    "Kyle Lowry":                "PG",
-    "Fred VanVleet":             "PG",
-    "Kemba Walker":              "PG",
-    "Dennis Johnson":            "PG/SG",
-    "Walt Frazier":              "PG/SG",
-    "Derek Harper":              "PG/SG",
-    "Fat Lever":                 "PG",
-    "Jrue Holiday":              "PG/SG",
-    "George Hill":               "PG/SG",
-    "Kirk Hinrich":              "PG/SG",
-    "Marcus Smart":              "SG",
-    "Derrick White":             "PG/SG",
-    "Alex Caruso":               "SG/PG",
-    "Austin Reaves":             "SG/PG",
-    "Jalen Suggs":               "PG/SG",
-    "James Silas":               "PG/SG",
-    "Brian Taylor":              "PG/SG",
-    "Micheal Ray Richardson":    "PG/SG",
-    "Don Buse":                  "PG",
-    "Nate McMillan":             "PG",
-
-    # ── Players added via ATD draft pool ─────────────────────────────────────
-    "Jaylen Brown":              "SG/SF",
-    "Donovan Mitchell":          "SG/PG",
-    "Bradley Beal":              "SG",
-    "Klay Thompson":             "SG",
-    "Andrew Wiggins":            "SF/SG",
-    "Franz Wagner":              "SF/PF",
-    "Mikal Bridges":             "SF/SG",
-    "OG Anunoby":                "SF/SG",
-    "Lu Dort":                   "SG/SF",
-    "Herb Jones":                "SG/SF",
-    "Desmond Bane":              "SG/SF",
-    "Duncan Robinson":           "SG/SF",
-    "Norman Powell":             "SG/SF",
-    "Trey Murphy":               "SF/SG",
-    "Scottie Barnes":            "SF/PF",
-    "Jaden McDaniels":           "SF/PF",
-    "Aaron Gordon":              "PF/SF",
-    "Deni Avdija":               "SF/PF",
-    "Jalen Johnson":             "SF/PF",
-    "Amen Thompson":             "SF",
-    "Paolo Banchero":            "PF/SF",
-    "Evan Mobley":               "PF",
-    "Chet Holmgren":             "C/PF",
-    "Isaiah Hartenstein":        "C",
-    "Nicolas Claxton":           "C",
-    "Jarrett Allen":             "C",
-    "Robert Williams":           "C",
-    "Bo Outlaw":                 "PF/C",
-    "Mark Eaton":                "C",
-    "Clifford Ray":              "C",
-    "Sam Lacey":                 "C",
-    "Willie Wise":               "SF/SG",
-    "Roger Brown":               "SF",
-    "Mel Daniels":               "C",
-    "Louie Dampier":             "PG/SG",
-    "James Silas":               "PG/SG",
-    "Dan Issel":                "PF/C",
-    "Adrian Dantley":           "SF",
-    "Ron Artest":                "SF",
-    "Tony Parker":                "PG",
-    "John Collins":              "PF",
-    "Richard Hamilton":        "SG/SF",
-    "Brandon Roy":               "SG",
-}
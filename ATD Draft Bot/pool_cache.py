@@ -0,0 +1,93 @@
+# pool_cache.py
+# Local snapshot store for player pools, keyed by spreadsheet ID + tab.
+#
+# DraftManager.load_player_pool() starts a draft from the cached snapshot
+# immediately and checks the sheet's revision (Drive modifiedTime) in the
+# background; the worksheet is only downloaded again when the revision has
+# changed. With POOL_OFFLINE=1 (or offline=True) the sheet is never contacted,
+# which is what the simulator uses.
+#
+# The store is one compact JSON file:
+#   {"<spreadsheet_id>/<tab>": {"revision", "fetched_at", "players", "adp"}, ...}
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from config import POOL_CACHE_FILE
+
+
+@dataclass
+class PoolSnapshot:
+    players:    list[str]
+    adp:        dict[str, float] = field(default_factory=dict)
+    revision:   str | None = None    # sheet modifiedTime when fetched; None = unknown
+    fetched_at: float = 0.0          # unix time of the last download or revision check
+
+    def to_dict(self) -> dict:
+        return {
+            "revision":   self.revision,
+            "fetched_at": self.fetched_at,
+            "players":    self.players,
+            "adp":        self.adp,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "PoolSnapshot":
+        return cls(
+            players=list(d["players"]),
+            adp={p: float(v) for p, v in d.get("adp", {}).items()},
+            revision=d.get("revision"),
+            fetched_at=float(d.get("fetched_at", 0.0)),
+        )
+
+
+class PoolCache:
+    """Thread-safe JSON-backed snapshot store. Writes are atomic (tmp + rename)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] | None = None   # loaded lazily
+
+    @staticmethod
+    def _key(spreadsheet_id: str, tab: str) -> str:
+        return f"{spreadsheet_id}/{tab}"
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                print(f"[PoolCache] Ignoring unreadable cache {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, spreadsheet_id: str, tab: str) -> PoolSnapshot | None:
+        with self._lock:
+            entry = self._load().get(self._key(spreadsheet_id, tab))
+        return PoolSnapshot.from_dict(entry) if entry else None
+
+    def put(self, spreadsheet_id: str, tab: str, snap: PoolSnapshot) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[self._key(spreadsheet_id, tab)] = snap.to_dict()
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(entries, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+
+    def touch(self, spreadsheet_id: str, tab: str) -> None:
+        """Record that the cached revision was just confirmed current."""
+        snap = self.get(spreadsheet_id, tab)
+        if snap:
+            snap.fetched_at = time.time()
+            self.put(spreadsheet_id, tab, snap)
+
+
+POOL_CACHE = PoolCache(POOL_CACHE_FILE)
@@ -0,0 +1,242 @@
+# replay.py
+# What-if replays of saved drafts under alternative weights.
+#
+# Every draft the bot saves carries a pick-by-pick log (feedback DB table
+# pick_events: overall pick, team slot, player, source, RNG seed, hash of the
+# players still available) and the pool it ran on. A replay walks the log in
+# order, keeps each team's roster exactly as it really went, and at every AI
+# pick re-runs the AI engine from the recorded seed under the trial weights:
+# the weight set that pick was made with (weight_sets, by the event's
+# weights_version) with the trial overrides on top. Any slot where the AI
+# would now take someone else is a divergence point.
+#
+# Human picks are replayed as made. Because history is followed rather than
+# the new picks, every divergence is "this team, in this exact spot, would now
+# pick differently" because of the overrides — with no overrides a replay
+# reports none, however the weights have changed since. Picks whose weight
+# set was never stored are replayed on the current weights instead and
+# reported as unrecorded.
+#
+# Usage:
+#   python replay.py --weights trial_weights.json              # last 20 drafts
+#   python replay.py --pending-proposal --last 100 --workers 8
+#   python replay.py --drafts 41 42 --weights w.json --show 10 --out replay.json
+
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ai_drafter
+from available_pool import AvailablePool
+from draft_manager import pool_hash
+from feedback import db as fdb
+from team_profile import TeamProfile
+from weights import WeightsError
+
+
+def _engine(name: str):
+    if name == "vector":
+        import vector_drafter
+        return vector_drafter
+    return ai_drafter
+
+
+def _trial_weights(log: dict, overrides: dict[str, float] | None) -> dict:
+    """
+    weights_version → (trial Weights, recorded?) for every version the log's
+    events used. A stored set that no longer loads (keys or bounds changed
+    since) counts as unrecorded, like a missing one.
+    """
+    current = ai_drafter.W
+    trials = {}
+    for version in {ev["weights_version"] for ev in log["events"]}:
+        values = log.get("weight_sets", {}).get(version)
+        base, recorded = current, False
+        if values is not None:
+            try:
+                base = current.replace({k: v for k, v in values.items() if k in current})
+                recorded = True
+            except WeightsError:
+                pass
+        trials[version] = (base.replace(overrides), recorded)
+    return trials
+
+
+def replay_draft(log: dict, engine: str = "scalar",
+                 overrides: dict[str, float] | None = None) -> dict:
+    """
+    Replay one draft log (fdb.get_draft_log), each AI pick under the weights it
+    was made with plus `overrides`. Returns {draft_id, ai_picks, divergences,
+    unrecorded, error} where each divergence is {overall_pick, round,
+    team_slot, actual, replayed} and `unrecorded` counts AI picks replayed on
+    the current weights because their own set wasn't stored.
+    """
+    ai = _engine(engine)
+    trials = _trial_weights(log, overrides)
+    players, adp = log["players"], log["adp"]
+    num_teams = log["num_teams"]
+    rosters  = [[] for _ in range(num_teams)]
+    profiles = [TeamProfile.from_picks([], adp) for _ in range(num_teams)]
+    available = AvailablePool(players, adp)
+    divergences: list[dict] = []
+    ai_picks = unrecorded = 0
+    result = {"draft_id": log["draft_id"], "ai_picks": 0, "divergences": divergences,
+              "unrecorded": 0, "error": None}
+
+    saved = ai_drafter.W   # the engines read ai_drafter.W; put it back afterwards
+    try:
+        for ev in log["events"]:
+            # Logs written before AvailablePool.digest hold pool_hash() instead
+            h = ev["available_hash"]
+            if h != available.digest and h != pool_hash(available):
+                result["error"] = f"available pool differs from the log at pick #{ev['overall_pick']}"
+                break
+
+            slot = ev["team_slot"]
+            if ev["source"] in ("ai", "auto") and ev["seed"] is not None:
+                ai_drafter.W, recorded = trials[ev["weights_version"]]
+                unrecorded += not recorded
+                random.seed(ev["seed"])
+                replayed = ai.pick(
+                    rosters[slot], available,
+                    player_adp=adp,
+                    pool_size=len(players),
+                    overall_pick=ev["overall_pick"],
+                    num_teams=num_teams,
+                    profile=profiles[slot],
+                )
+                ai_picks += 1
+                if replayed != ev["player"]:
+                    divergences.append({
+                        "overall_pick": ev["overall_pick"],
+                        "round":        (ev["overall_pick"] - 1) // num_teams + 1,
+                        "team_slot":    slot,
+                        "actual":       ev["player"],
+                        "replayed":     replayed,
+                    })
+
+            # Follow history, not the replayed pick
+            rosters[slot].append(ev["player"])
+            profiles[slot].add(ev["player"], adp.get(ev["player"], 9999.0))
+            available.remove(ev["player"])
+    finally:
+        ai_drafter.W = saved
+
+    result["ai_picks"], result["unrecorded"] = ai_picks, unrecorded
+    return result
+
+
+# ── Worker plumbing ──────────────────────────────────────────────────────────
+# Logs are loaded from the DB in the parent and shipped to workers, so workers
+# never share the parent's SQLite connection.
+
+_worker_engine:    str = "scalar"
+_worker_overrides: dict[str, float] | None = None
+
+
+def _init_worker(engine: str, weights: dict[str, float] | None) -> None:
+    global _worker_engine, _worker_overrides
+    _worker_engine, _worker_overrides = engine, weights
+
+
+def _replay_one(log: dict) -> dict:
+    return replay_draft(log, _worker_engine, _worker_overrides)
+
+
+def replay_batch(
+    logs:    list[dict],
+    weights: dict[str, float] | None = None,
+    workers: int | None = None,
+    engine:  str = "scalar",
+) -> list[dict]:
+    """
+    Replay many draft logs with `weights` overriding each pick's recorded
+    weights, in parallel unless workers == 1. Results keep input order.
+    """
+    if workers == 1:
+        return [replay_draft(log, engine, weights) for log in logs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine, weights)) as ex:
+        return list(ex.map(_replay_one, logs))
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay saved drafts under alternative weights.")
+    parser.add_argument("--drafts", type=int, nargs="+", help="draft IDs to replay")
+    parser.add_argument("--last", type=int, default=20,
+                        help="replay the N most recent logged drafts (default 20)")
+    parser.add_argument("--weights", help="JSON file of weight overrides")
+    parser.add_argument("--pending-proposal", action="store_true",
+                        help="use the new values of the pending weight proposal")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--engine", choices=["scalar", "vector"], default="scalar")
+    parser.add_argument("--show", type=int, default=3, help="divergence points listed per draft")
+    parser.add_argument("--out", help="write full results as JSON")
+    args = parser.parse_args()
+
+    fdb.init_db()
+    weights: dict[str, float] = {}
+    if args.weights:
+        with open(args.weights) as f:
+            weights.update({k: v for k, v in json.load(f).items() if not k.startswith("_")})
+    if args.pending_proposal:
+        pending = fdb.get_pending_proposal()
+        if not pending:
+            parser.error("no pending weight proposal")
+        weights.update({p["key"]: p["new_value"] for p in pending["proposals"]})
+    try:
+        ai_drafter.W.replace(weights)   # validate before starting workers
+    except WeightsError as exc:
+        parser.error(str(exc))
+
+    ids = args.drafts or fdb.get_replayable_draft_ids(args.last)
+    logs = []
+    for draft_id in ids:
+        log = fdb.get_draft_log(draft_id)
+        if log is None:
+            print(f"[Replay] Draft #{draft_id} has no pick log — skipped")
+            continue
+        logs.append(log)
+    if not logs:
+        print("[Replay] Nothing to replay.")
+        return
+
+    start = time.perf_counter()
+    results = replay_batch(logs, weights or None, args.workers, args.engine)
+    elapsed = time.perf_counter() - start
+
+    total_ai = total_div = total_unrecorded = 0
+    for r in results:
+        if r["error"]:
+            print(f"Draft #{r['draft_id']}: ⚠️ {r['error']}")
+            continue
+        n = len(r["divergences"])
+        total_ai += r["ai_picks"]
+        total_div += n
+        total_unrecorded += r["unrecorded"]
+        note = f" ({r['unrecorded']} on current weights)" if r["unrecorded"] else ""
+        print(f"Draft #{r['draft_id']}: {n}/{r['ai_picks']} AI picks diverge{note}")
+        for d in r["divergences"][:args.show]:
+            print(f"    #{d['overall_pick']:>3} (R{d['round']:>2}, slot {d['team_slot'] + 1:>2}): "
+                  f"{d['actual']} → {d['replayed']}")
+
+    rate = total_div / total_ai if total_ai else 0.0
+    print(f"\n[Replay] {len(results)} drafts, {total_ai} AI picks, {total_div} divergences "
+          f"({rate:.1%}) in {elapsed:.1f}s — {len(weights)} override(s) on each pick's recorded weights")
+    if total_unrecorded:
+        print(f"[Replay] {total_unrecorded} AI pick(s) had no stored weight set and were replayed on "
+              f"the current weights ({ai_drafter.W.version}); their divergences may predate the overrides")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"weights": weights, "results": results}, f, separators=(",", ":"))
+        print(f"[Replay] Results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+# scheduler.py
+# Runs AI pick computation for every draft in the bot off the event loop.
+#
+# ai_drafter.pick() is CPU-bound; called inline, a few simultaneous !draftskip
+# sims would starve each other and delay the messages of live drafts. Instead,
+# each draft loop awaits PickScheduler.pick(), which queues the job and has it
+# computed in a process pool:
+#
+#   - Jobs are served by priority: human-facing drafts (PRIORITY_LIVE) always
+#     go ahead of fast sims (PRIORITY_SIM), FIFO within a priority.
+#   - At most MAX_CONCURRENT_SIMS sims run at once; further sims wait for a
+#     slot (sim_slot()) before their first pick.
+#   - Per-draft pick latency (queue wait + compute) and the queue depth are
+#     kept for !draftstatus.
+#
+# The caller's weights snapshot (normally the current ai_drafter.W) is sent
+# with every job, so confirmed or hot-reloaded weight changes apply to the next
+# pick without restarting the workers, and a pick never sees a mix of two sets.
+#
+# The pool and ADP are not sent with every pick. A draft's AvailablePool goes
+# out as a _PoolRef — its content key plus the alive flags — and each worker
+# keeps the pools it has seen by key. A worker that doesn't know the key yet
+# answers None and the pick is resubmitted once with the pool attached. Picks
+# then reuse the worker's own ADP dict, so the vector engine's per-pool
+# arrays (cached by ADP identity) are built once per worker per draft.
+
+import asyncio
+import itertools
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import ai_drafter
+from available_pool import AvailablePool
+from config import AI_ENGINE, PICK_WORKERS, MAX_CONCURRENT_SIMS, AI_TRACE_TOP_K
+
+PRIORITY_LIVE = 0   # drafts people are watching or picking in
+PRIORITY_SIM  = 1   # !draftskip fast sims
+
+_LATENCY_WINDOW = 50   # picks kept per draft for the latency summary
+_MAX_CONTEXTS   = 64   # pools kept per worker (about one per draft)
+
+
+# ── Worker side ──────────────────────────────────────────────────────────────
+
+_engine = ai_drafter
+
+
+def _init_worker(engine: str) -> None:
+    global _engine
+    if engine == "vector":
+        import vector_drafter
+        _engine = vector_drafter
+    # Forked workers inherit the parent's random state — reseed so they don't
+    # all draw the same jitter.
+    random.seed()
+
+
+# AvailablePool.key → that pool with every player available, in this worker
+_CONTEXTS: dict[str, AvailablePool] = {}
+
+
+@dataclass
+class _PoolRef:
+    """An AvailablePool by reference: its key, its alive flags and, on a resend, the pool itself."""
+    key:     str
+    alive:   bytes
+    context: tuple[list[str], dict[str, float]] | None = None
+
+    def resolve(self) -> AvailablePool | None:
+        base = _CONTEXTS.get(self.key)
+        if base is None:
+            if self.context is None:
+                return None
+            if len(_CONTEXTS) >= _MAX_CONTEXTS:
+                _CONTEXTS.clear()
+            base = _CONTEXTS[self.key] = AvailablePool(*self.context)
+        return base.with_alive(self.alive)
+
+
+def _compute_pick(weights, seed, team_picks, available, player_adp, pool_size,
+                  overall_pick, num_teams, profile, trace_k) -> tuple[str, float, list | None] | None:
+    """
+    Worker-process body. Returns (player, compute seconds, trace or None), or
+    None if `available` is a _PoolRef to a pool this worker doesn't have.
+    """
+    if isinstance(available, _PoolRef):
+        available = available.resolve()
+        if available is None:
+            return None
+        player_adp = available.adp
+    if weights.version != ai_drafter.W.version:
+        ai_drafter.W = weights
+    if seed is not None:
+        random.seed(seed)   # replayable: same seed + weights + state → same pick
+    trace = [] if trace_k else None
+    t0 = time.perf_counter()
+    player = _engine.pick(team_picks, available, player_adp=player_adp,
+                          pool_size=pool_size, overall_pick=overall_pick,
+                          num_teams=num_teams, profile=profile,
+                          trace=trace, trace_k=trace_k)
+    return player, time.perf_counter() - t0, trace
+
+
+# ── Scheduler ────────────────────────────────────────────────────────────────
+
+@dataclass
+class DraftStats:
+    picks:    int = 0
+    latency:  deque = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))  # seconds
+    compute:  deque = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def summary(self) -> dict:
+        lat = sorted(self.latency)
+        return {
+            "picks":      self.picks,
+            "last_ms":    self.latency[-1] * 1000 if lat else 0.0,
+            "p50_ms":     lat[len(lat) // 2] * 1000 if lat else 0.0,
+            "max_ms":     lat[-1] * 1000 if lat else 0.0,
+            "compute_ms": sum(self.compute) / len(self.compute) * 1000 if self.compute else 0.0,
+        }
+
+
+class PickScheduler:
+    def __init__(self, workers: int = PICK_WORKERS, max_sims: int = MAX_CONCURRENT_SIMS,
+                 engine: str = AI_ENGINE):
+        self.workers  = max(1, workers)
+        self.max_sims = max(1, max_sims)
+        self.engine   = engine
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_gen = 0   # bumped on every restart, so a broken pool is replaced once
+        self._queue: asyncio.PriorityQueue | None = None
+        self._dispatchers: list[asyncio.Task] = []
+        self._seq = itertools.count()
+        self._sim_slots: asyncio.Semaphore | None = None
+        self.sims_running = 0
+        self.sims_waiting = 0
+        self.busy = 0
+        self.stats: dict[int, DraftStats] = {}
+
+    # Started lazily from the first pick so the queue binds to the bot's loop.
+    def _ensure_started(self) -> None:
+        if self._queue is not None:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._sim_slots = asyncio.Semaphore(self.max_sims)
+        self._pool = self._new_pool()
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        print(f"[Scheduler] {self.workers} pick worker(s), max {self.max_sims} concurrent sim(s)")
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.engine,))
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            _prio, _seq, fn, args, fut = await self._queue.get()
+            if fut.cancelled():   # draft was cancelled while queued
+                continue
+            self.busy += 1
+            try:
+                result = await self._execute(loop, fn, args)
+            except Exception as exc:
+                if not fut.done():
+                    fut.set_exception(exc)
+            else:
+                if not fut.done():
+                    fut.set_result(result)
+            finally:
+                self.busy -= 1
+
+    async def _execute(self, loop, fn, args):
+        """
+        Run one job in the pool. If the pool breaks (a worker died), replace it
+        and resubmit the job once. Jobs never run inline: they would block the
+        event loop and overwrite the bot process's weights and RNG.
+        """
+        for attempt in range(2):
+            pool, gen = self._pool, self._pool_gen
+            try:
+                return await loop.run_in_executor(pool, fn, *args)
+            except BrokenProcessPool:
+                self._restart_pool(gen)
+                if attempt:
+                    raise
+
+    def _restart_pool(self, gen: int) -> None:
+        """Replace the pool of generation `gen`, unless another dispatcher already has."""
+        if gen != self._pool_gen:
+            return
+        print("[Scheduler] Worker pool broke — restarting it")
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+        self._pool_gen += 1
+
+    async def pick(self, draft_id: int, priority: int, team_picks: list[str],
+                   available: list[str], player_adp: dict[str, float], pool_size: int,
+                   overall_pick: int, num_teams: int, profile=None,
+                   seed: int | None = None, weights=None, trace: list | None = None) -> str:
+        """
+        Queue one AI pick and wait for the result. Same arguments as
+        ai_drafter.pick(), plus the RNG `seed` to make the pick with and the
+        `weights` to use (default: ai_drafter.W at call time). If `trace` is
+        a list, the top AI_TRACE_TOP_K candidate breakdowns are added to it.
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        ref = None
+        if isinstance(available, AvailablePool) and available.adp is player_adp:
+            ref = _PoolRef(available.key, available.alive_flags())
+        weights = weights if weights is not None else ai_drafter.W
+        trace_k = AI_TRACE_TOP_K if trace is not None else 0
+        t0 = time.perf_counter()
+        seq = next(self._seq)
+        while True:
+            fut = loop.create_future()
+            args = (weights, seed, team_picks, ref or available, None if ref else player_adp,
+                    pool_size, overall_pick, num_teams, profile, trace_k)
+            await self._queue.put((priority, seq, _compute_pick, args, fut))
+            result = await fut
+            if result is not None:
+                break
+            # The worker didn't have this pool yet: resend with it attached,
+            # keeping the original queue position.
+            ref.context = (available.players, available.adp)
+        player, compute, explained = result
+        if trace is not None and explained:
+            trace.extend(explained)
+
+        st = self.stats.setdefault(draft_id, DraftStats())
+        st.picks += 1
+        st.latency.append(time.perf_counter() - t0)
+        st.compute.append(compute)
+        return player
+
+    async def run(self, priority: int, fn, *args):
+        """
+        Queue any other CPU-bound job (e.g. outlook.run) on the same workers
+        and priorities as picks. `fn` and `args` must be picklable.
+        """
+        self._ensure_started()
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((priority, next(self._seq), fn, args, fut))
+        return await fut
+
+    @asynccontextmanager
+    async def sim_slot(self):
+        """Hold one of the MAX_CONCURRENT_SIMS sim slots for the duration of a sim."""
+        self._ensure_started()
+        self.sims_waiting += 1
+        try:
+            await self._sim_slots.acquire()
+        finally:
+            self.sims_waiting -= 1
+        self.sims_running += 1
+        try:
+            yield
+        finally:
+            self.sims_running -= 1
+            self._sim_slots.release()
+
+    def sim_slot_free(self) -> bool:
+        return self._sim_slots is None or not self._sim_slots.locked()
+
+    def forget(self, draft_id: int) -> None:
+        self.stats.pop(draft_id, None)
+
+    def draft_summary(self, draft_id: int) -> dict | None:
+        st = self.stats.get(draft_id)
+        return st.summary() if st else None
+
+    def shutdown(self) -> None:
+        for t in self._dispatchers:
+            t.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+SCHEDULER = PickScheduler()
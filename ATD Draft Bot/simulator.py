@@ -0,0 +1,194 @@
+# simulator.py
+# Headless batch draft simulator — no Discord, no Google Sheets.
+#
+# Runs complete all-AI drafts through the same DraftManager.setup(), snake
+# pick_order and AI engine the bot uses, reading the player pool from a local
+# snapshot file (see DraftManager.load_pool_snapshot) or the bot's pool cache. Drafts are spread across a
+# process pool; each draft seeds `random` from --seed + draft number, so a run
+# is reproducible regardless of worker count.
+#
+# Usage:
+#   python simulator.py --pool pool.csv --drafts 200 --workers 8 --out sim.json
+#   python simulator.py --pool pool.json --weights trial_weights.json
+#   python simulator.py --fetch-pool pool.json      # snapshot the live pool tab
+#   python simulator.py --cached-pool               # use the bot's pool cache, offline
+#
+# Output is one compact JSON file:
+#   {"meta": {...}, "drafts": [{"seed": n, "teams": [{"name", "picks"}, ...]}, ...]}
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ai_drafter
+from draft_manager import DraftManager, fetch_pool_snapshot
+from weights import WeightsError
+
+
+def _engine(name: str):
+    if name == "vector":
+        import vector_drafter
+        return vector_drafter
+    return ai_drafter
+
+
+def simulate_draft(
+    player_pool: list[str],
+    player_adp:  dict[str, float],
+    num_teams:   int = 30,
+    seed:        int = 0,
+    engine:      str = "scalar",
+) -> list[dict]:
+    """
+    Run one complete all-AI draft. Returns [{"name", "picks"}, ...] in draft-slot
+    order. Uses whatever weights are currently loaded in ai_drafter.W.
+    """
+    ai = _engine(engine)
+    random.seed(seed)
+
+    dm = DraftManager()
+    dm.player_pool = player_pool
+    dm.player_adp  = player_adp
+    dm.setup(num_teams, human_ids=[])
+
+    while not dm.is_complete():
+        team = dm.current_team
+        available = dm.available_players
+        if not available:
+            break
+        player = ai.pick(
+            team.picks, available,
+            player_adp=dm.player_adp,
+            pool_size=len(dm.player_pool),
+            overall_pick=dm.pick_number,
+            num_teams=dm.total_teams,
+            profile=team.profile,
+        )
+        dm.record_pick(player)
+
+    return [{"name": t.name, "picks": t.picks} for t in dm.teams]
+
+
+# ── Worker plumbing ──────────────────────────────────────────────────────────
+# The pool and weights are sent to each worker once (initializer), not per task.
+
+_worker_pool:   list[str]        = []
+_worker_adp:    dict[str, float] = {}
+_worker_teams:  int = 30
+_worker_engine: str = "scalar"
+
+
+def _init_worker(player_pool, player_adp, num_teams, engine, weights) -> None:
+    global _worker_pool, _worker_adp, _worker_teams, _worker_engine
+    _worker_pool, _worker_adp = player_pool, player_adp
+    _worker_teams, _worker_engine = num_teams, engine
+    if weights:
+        ai_drafter.W = ai_drafter.W.replace(weights)
+
+
+def _run_one(seed: int) -> dict:
+    teams = simulate_draft(_worker_pool, _worker_adp, _worker_teams, seed, _worker_engine)
+    return {"seed": seed, "teams": teams}
+
+
+def run_batch(
+    player_pool: list[str],
+    player_adp:  dict[str, float],
+    drafts:      int = 10,
+    num_teams:   int = 30,
+    seed:        int = 0,
+    workers:     int | None = None,
+    engine:      str = "scalar",
+    weights:     dict[str, float] | None = None,
+) -> list[dict]:
+    """
+    Run `drafts` drafts seeded seed, seed+1, … and return them in seed order.
+    `weights` overrides individual weights.json keys for this batch only.
+    """
+    seeds = [seed + i for i in range(drafts)]
+    init_args = (player_pool, player_adp, num_teams, engine, weights)
+
+    if workers == 1:
+        saved = ai_drafter.W
+        try:
+            _init_worker(*init_args)
+            return [_run_one(s) for s in seeds]
+        finally:
+            ai_drafter.W = saved
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=init_args) as ex:
+        return list(ex.map(_run_one, seeds))
+
+
+def write_results(path: str, results: list[dict], meta: dict) -> None:
+    """Write one compact JSON results file."""
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "drafts": results}, f, separators=(",", ":"))
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run headless all-AI drafts.")
+    parser.add_argument("--pool", help="player pool snapshot (.csv or .json)")
+    parser.add_argument("--fetch-pool", metavar="PATH",
+                        help="download the live pool tab to PATH and exit")
+    parser.add_argument("--cached-pool", action="store_true",
+                        help="use the cached pool for POOL_TAB_NAME (offline, no Sheets access)")
+    parser.add_argument("--drafts", type=int, default=10)
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--engine", choices=["scalar", "vector"], default="scalar")
+    parser.add_argument("--weights", help="JSON file of weight overrides")
+    parser.add_argument("--out", default="sim_results.json")
+    args = parser.parse_args()
+
+    dm = DraftManager()
+    if args.fetch_pool:
+        snap = fetch_pool_snapshot()
+        dm.player_pool, dm.player_adp = snap.players, snap.adp
+        dm.save_pool_snapshot(args.fetch_pool)
+        print(f"[Sim] Saved pool snapshot → {args.fetch_pool}")
+        return
+    if args.cached_pool:
+        dm.load_player_pool(offline=True)
+    elif args.pool:
+        dm.load_pool_snapshot(args.pool)
+    else:
+        parser.error("--pool or --cached-pool is required (or use --fetch-pool to create one)")
+
+    weights = None
+    if args.weights:
+        with open(args.weights) as f:
+            weights = {k: v for k, v in json.load(f).items() if not k.startswith("_")}
+    try:
+        version = ai_drafter.W.replace(weights).version   # validate before starting workers
+    except WeightsError as exc:
+        parser.error(f"--weights: {exc}")
+
+    start = time.perf_counter()
+    results = run_batch(dm.player_pool, dm.player_adp, args.drafts, args.teams,
+                        args.seed, args.workers, args.engine, weights)
+    elapsed = time.perf_counter() - start
+
+    meta = {
+        "drafts":  args.drafts,
+        "teams":   args.teams,
+        "seed":    args.seed,
+        "engine":  args.engine,
+        "pool":    os.path.basename(args.pool) if args.pool else "cache",
+        "weights": weights or {},
+        "weights_version": version,
+    }
+    write_results(args.out, results, meta)
+    print(f"[Sim] {args.drafts} drafts × {args.teams} teams in {elapsed:.1f}s → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# team_profile.py
+# Running roster summary for one team, updated once per pick.
+#
+# ai_drafter needs the same team-level facts for every candidate it scores —
+# slots filled, who the starters are, how many ball-dominant players, shooters,
+# scorers, tiers covered, and so on. TeamProfile keeps all of them up to date as
+# picks are recorded, so pick() reads them directly instead of rescanning the
+# roster on every call.
+#
+# Counts follow the roster order exactly as the old per-pick helpers did:
+#   - slots prefer an open starter slot before a bench slot
+#   - the "starter" at a position is the first player drafted who lists it
+#   - picks 1-5 are the starter phase, picks 6+ the bench phase
+
+from dataclasses import dataclass, field, replace
+
+from player_data import (
+    lookup,
+    PlayerRecord,
+    F_BALL_DOMINANT,
+    F_SHOT_CREATOR,
+    F_SHOOTER,
+    F_NON_SCORING_BIG,
+    F_SOFT_BIG,
+    F_IMMOBILE_CENTER,
+    F_VERSATILE_DEFENDER,
+    F_PERIMETER_DEFENDER,
+    F_ELITE_RIM_PROTECTOR,
+    F_ELITE_PLAYMAKER,
+    F_PNR_CREATOR,
+)
+
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+_UNKNOWN_ADP = 9999.0
+_HANDLER = F_BALL_DOMINANT | F_ELITE_PLAYMAKER
+
+
+def is_pnr_big(rec: PlayerRecord) -> bool:
+    """C/PF who can screen and finish at the rim or pop for a jumper.
+    Must be a shot creator — non-scoring bigs (Mutombo, Rodman) don't qualify."""
+    return (
+        any(p in ('PF', 'C') for p in rec.positions)
+        and bool(rec.flags & F_SHOT_CREATOR)
+        and not rec.flags & F_NON_SCORING_BIG
+    )
+
+
+def is_scoring_wing(rec: PlayerRecord) -> bool:
+    """Wing/forward who can both shoot AND self-create — not a pure spot-up guy.
+    Ideal complement for elite distributors (LeBron, Magic) who kick out off drives."""
+    return (
+        bool(rec.flags & F_SHOT_CREATOR)
+        and bool(rec.flags & F_SHOOTER)
+        and not rec.flags & F_BALL_DOMINANT
+        and any(p in ('SG', 'SF', 'PF') for p in rec.positions)
+    )
+
+
+@dataclass
+class TeamProfile:
+    n_picks:          int = 0
+    slots:            dict[str, int] = field(default_factory=lambda: {p: 0 for p in POSITIONS})
+    starters:         dict[str, str] = field(default_factory=dict)   # pos → first player listing it
+    starter_adp:      dict[str, float] = field(default_factory=dict) # pos → that player's ADP
+    tiers_present:    set[int] = field(default_factory=set)
+    bd_count:         int = 0
+    nsb_count:        int = 0
+    soft_big_ct:      int = 0
+    shooter_count:    int = 0
+    starter_scorers:  int = 0     # shot creators among picks 1-5
+    bench_scorers:    int = 0     # shot creators among picks 6+
+    defender_count:   int = 0     # versatile or perimeter defenders
+    scoring_wings:    int = 0
+    c_count:          int = 0     # players who list C
+    bench_scoring_guards: int = 0 # shot creators in picks 6+ who play only PG/SG
+    has_immob_c:      bool = False
+    has_vd:           bool = False
+    has_pnr_creator:  bool = False
+    has_pnr_big:      bool = False
+    has_elite_playmaker: bool = False
+    has_rim_protector:   bool = False
+    bench_has_pg_handler: bool = False
+    star_is_shooter:  bool = False  # a top-2 pick is an elite shooter-scorer (ADP ≤ 25)
+    star_mask:        int = 0       # position bits of the first two picks
+    starter_handlers: list[str] = field(default_factory=list)  # BD/EP players in picks 1-5
+
+    # ── Updates ──────────────────────────────────────────────────────────────
+    def add(self, player: str, adp: float = _UNKNOWN_ADP) -> None:
+        """Fold one drafted player into the profile. Call in draft order."""
+        rec   = lookup(player)
+        flags = rec.flags
+        positions = rec.positions
+        idx = self.n_picks          # 0-based pick index within this team
+        self.n_picks += 1
+
+        # Prefer open starter slot first, then the first available bench slot
+        slots = self.slots
+        pos = next((p for p in positions if slots[p] == 0), None)
+        if pos is None:
+            pos = next((p for p in positions if slots[p] < 2), None)
+        if pos is not None:
+            slots[pos] += 1
+
+        for p in positions:
+            if p not in self.starters:
+                self.starters[p] = player
+                self.starter_adp[p] = adp
+
+        if rec.tier <= 10:
+            self.tiers_present.add(rec.tier)
+        if flags & F_BALL_DOMINANT:
+            self.bd_count += 1
+        if flags & F_NON_SCORING_BIG:
+            self.nsb_count += 1
+        if flags & F_SOFT_BIG:
+            self.soft_big_ct += 1
+        if flags & F_SHOOTER:
+            self.shooter_count += 1
+        if flags & F_SHOT_CREATOR:
+            if idx < 5:
+                self.starter_scorers += 1
+            else:
+                self.bench_scorers += 1
+        if flags & (F_VERSATILE_DEFENDER | F_PERIMETER_DEFENDER):
+            self.defender_count += 1
+        if is_scoring_wing(rec):
+            self.scoring_wings += 1
+        if 'C' in positions:
+            self.c_count += 1
+        if idx >= 5 and flags & F_SHOT_CREATOR and all(p in ('PG', 'SG') for p in positions):
+            self.bench_scoring_guards += 1
+
+        self.has_immob_c         |= bool(flags & F_IMMOBILE_CENTER)
+        self.has_vd              |= bool(flags & F_VERSATILE_DEFENDER)
+        self.has_pnr_creator     |= bool(flags & F_PNR_CREATOR)
+        self.has_pnr_big         |= is_pnr_big(rec)
+        self.has_elite_playmaker |= bool(flags & F_ELITE_PLAYMAKER)
+        self.has_rim_protector   |= bool(flags & F_ELITE_RIM_PROTECTOR)
+
+        if idx < 5:
+            if flags & _HANDLER:
+                self.starter_handlers.append(player)
+        elif flags & _HANDLER and 'PG' in positions:
+            self.bench_has_pg_handler = True
+
+        if idx < 2:
+            self.star_mask |= rec.pos_mask
+            if flags & F_SHOOTER and flags & F_SHOT_CREATOR and adp <= 25:
+                self.star_is_shooter = True
+
+    def copy(self) -> "TeamProfile":
+        """Independent copy — add() on it leaves this profile untouched."""
+        return replace(
+            self,
+            slots=dict(self.slots),
+            starters=dict(self.starters),
+            starter_adp=dict(self.starter_adp),
+            tiers_present=set(self.tiers_present),
+            starter_handlers=list(self.starter_handlers),
+        )
+
+    @classmethod
+    def from_picks(cls, picks: list[str], player_adp: dict[str, float] | None = None) -> "TeamProfile":
+        """Build a profile by replaying a roster in draft order."""
+        player_adp = player_adp or {}
+        profile = cls()
+        for p in picks:
+            profile.add(p, player_adp.get(p, _UNKNOWN_ADP))
+        return profile
+
+    # ── Derived facts ────────────────────────────────────────────────────────
+    @property
+    def round_num(self) -> int:
+        return self.n_picks + 1
+
+    @property
+    def missing_tier_count(self) -> int:
+        return 10 - len(self.tiers_present)
+
+    @property
+    def open_starters(self) -> bool:
+        return any(n == 0 for n in self.slots.values())
+
+    @property
+    def has_c_flex(self) -> bool:
+        """A PF/C swing player besides the starting C covers backup-C duties."""
+        return self.c_count >= 2
+
+    @property
+    def has_secondary_handler(self) -> bool:
+        """Someone in picks 1-5 other than the PG starter can initiate offense."""
+        pg = self.starters.get('PG')
+        return any(p != pg for p in self.starter_handlers)
+
+    @property
+    def weak_perimeter_ct(self) -> int:
+        """Starting PG/SG/SF who are not perimeter defenders."""
+        return sum(
+            1 for pos in ('PG', 'SG', 'SF')
+            if (s := self.starters.get(pos)) and not lookup(s).flags & F_PERIMETER_DEFENDER
+        )
+
+    def flex_covered_positions(self) -> set[str]:
+        """
+        Returns bench positions 'covered' by starter versatility.
+        A covered position can wait until rounds 9-10 for a dedicated backup
+        rather than being sought urgently in rounds 7-8.
+
+        Coverage rules (ATD-specific):
+        - PG bench: covered if the SG starter is ball-dominant (handles bench
+                    ball-handling duties — Wade, Kobe, Harden, Iverson, etc.)
+        - SG bench: covered if the SF starter is listed as SG/SF (can slide down)
+        - SF bench: covered if the PF starter is listed as SF/PF (can slide up)
+
+        LeBron is intentionally excluded — he plays SF/PF only in ATD context
+        and does NOT cover PG bench duties.
+        """
+        covered: set[str] = set()
+        sg = self.starters.get('SG')
+        if sg and lookup(sg).flags & F_BALL_DOMINANT:
+            covered.add('PG')
+        sf = self.starters.get('SF')
+        if sf and 'SG' in lookup(sf).positions:
+            covered.add('SG')
+        pf = self.starters.get('PF')
+        if pf and 'SF' in lookup(pf).positions:
+            covered.add('SF')
+        return covered
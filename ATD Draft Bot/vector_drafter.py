@@ -0,0 +1,531 @@
+# vector_drafter.py
+# NumPy scoring engine for the AI drafter.
+#
+# Same rules, same weights and same pick as ai_drafter.pick(), but the available
+# pool is held as arrays (raw ADP, tier, position bitmask, archetype flags) and
+# every penalty/pull in _effective_adp is applied as one masked array operation
+# per pick instead of one Python branch per player.
+#
+# Team context (slots filled, starters, counts) comes from the team's running
+# TeamProfile — it is 0-10 players, so there is nothing to vectorise there.
+#
+# Rules are applied in exactly the order ai_drafter._effective_adp applies them,
+# so effective ADPs match the scalar path bit-for-bit, and the jitter is drawn
+# from `random` in pool order so a seeded draft picks the same players.
+#
+# Run `python vector_drafter.py` to replay full drafts through both engines and
+# report any pick or score that differs.
+
+import random
+
+import numpy as np
+
+import ai_drafter
+from ai_drafter import (
+    POSITIONS,
+    _UNKNOWN_ADP,
+    _global_max_fall,
+    _jitter,
+)
+from config import ROUNDS
+from player_data import (
+    lookup,
+    POS_BITS,
+    F_BALL_DOMINANT,
+    F_SHOT_CREATOR,
+    F_HIGH_PORTABILITY,
+    F_SHOOTER,
+    F_NON_SCORING_BIG,
+    F_SOFT_BIG,
+    F_IMMOBILE_CENTER,
+    F_VERSATILE_DEFENDER,
+    F_PERIMETER_DEFENDER,
+    F_ELITE_RIM_PROTECTOR,
+    F_ELITE_PLAYMAKER,
+    F_DO_NOT_DRAFT,
+)
+from team_profile import TeamProfile
+
+_PG, _SG, _SF, _PF, _C = (POS_BITS[p] for p in POSITIONS)
+_GUARDS     = _PG | _SG
+_PERIMETER  = _PG | _SG | _SF
+_FRONTCOURT = _PF | _C
+_WINGS      = _SG | _SF | _PF
+_NON_C      = _PG | _SG | _SF | _PF
+
+
+# ── Pool arrays ───────────────────────────────────────────────────────────────
+
+class PoolArrays:
+    """Static per-player arrays for one draft's pool, indexed by pool position."""
+
+    def __init__(self, player_adp: dict[str, float]):
+        self.player_adp = player_adp
+        self.index: dict[str, int] = {}
+        self._adp:   list[float] = []
+        self._tier:  list[int]   = []
+        self._mask:  list[int]   = []
+        self._flags: list[int]   = []
+        self._frozen = False
+
+    def _add(self, player: str) -> int:
+        rec = lookup(player)
+        i = len(self._adp)
+        self.index[player] = i
+        self._adp.append(self.player_adp.get(player, _UNKNOWN_ADP))
+        self._tier.append(rec.tier)
+        self._mask.append(rec.pos_mask)
+        self._flags.append(rec.flags)
+        self._frozen = False
+        return i
+
+    def _freeze(self) -> None:
+        self.adp   = np.asarray(self._adp,   dtype=np.float64)
+        self.tier  = np.asarray(self._tier,  dtype=np.int64)
+        self.mask  = np.asarray(self._mask,  dtype=np.int64)
+        self.flags = np.asarray(self._flags, dtype=np.int64)
+        self._frozen = True
+
+    def indices(self, available: list[str]) -> np.ndarray:
+        """Pool indices for `available`, in the same order."""
+        index = self.index
+        idx = [index[p] if p in index else self._add(p) for p in available]
+        if not self._frozen:
+            self._freeze()
+        return np.asarray(idx, dtype=np.intp)
+
+
+# One PoolArrays per ADP mapping — i.e. one per draft. Keyed by id() and
+# holding a reference to the dict so the id can't be recycled while cached.
+_POOLS: dict[int, PoolArrays] = {}
+_MAX_POOLS = 64
+
+
+def _pool_for(player_adp: dict[str, float]) -> PoolArrays:
+    pool = _POOLS.get(id(player_adp))
+    if pool is None or pool.player_adp is not player_adp:
+        if len(_POOLS) >= _MAX_POOLS:
+            _POOLS.clear()
+        pool = PoolArrays(player_adp)
+        _POOLS[id(player_adp)] = pool
+    return pool
+
+
+# ── Scoring ───────────────────────────────────────────────────────────────────
+
+def _pos_bits(positions) -> int:
+    mask = 0
+    for p in positions:
+        mask |= POS_BITS[p]
+    return mask
+
+
+def score_arrays(
+    team:         TeamProfile,
+    adp:          np.ndarray,
+    tier:         np.ndarray,
+    mask:         np.ndarray,
+    flags:        np.ndarray,
+    player_adp:   dict[str, float],
+    overall_pick: int = 0,
+    num_teams:    int = 30,
+) -> np.ndarray:
+    """Vectorised ai_drafter.score_available over pre-gathered pool arrays."""
+    W = ai_drafter.W
+    round_num = team.round_num
+    n = adp.shape[0]
+
+    # ── Team context (scalars) ───────────────────────────────────────────────
+    slots         = team.slots
+    bd_count      = team.bd_count
+    nsb_count     = team.nsb_count
+    soft_big_ct   = team.soft_big_ct
+    has_immob_c   = team.has_immob_c
+    shooter_count = team.shooter_count
+    starter_scorers    = team.starter_scorers
+    bench_scorers      = team.bench_scorers
+    tiers_present      = team.tiers_present
+    missing_tier_count = team.missing_tier_count
+
+    empty_mask  = _pos_bits(p for p in POSITIONS if slots[p] == 0)
+    filled_mask = _pos_bits(p for p in POSITIONS if slots[p] >= 1)
+    full_mask   = _pos_bits(p for p in POSITIONS if slots[p] >= 2)
+    open_starters = empty_mask != 0
+
+    # ── Player predicates (arrays) ───────────────────────────────────────────
+    def flag(bit: int) -> np.ndarray:
+        return (flags & bit) != 0
+
+    has_pos   = mask != 0
+    dnd       = flag(F_DO_NOT_DRAFT)
+    sc        = flag(F_SHOT_CREATOR)
+    bd        = flag(F_BALL_DOMINANT)
+    shooter   = flag(F_SHOOTER)
+    vd        = flag(F_VERSATILE_DEFENDER)
+    pd        = flag(F_PERIMETER_DEFENDER)
+    has_c     = (mask & _C) != 0
+    has_pg    = (mask & _PG) != 0
+    has_sf    = (mask & _SF) != 0
+    has_pf    = (mask & _PF) != 0
+    pos_full   = has_pos & ((mask & ~full_mask) == 0)
+    bench_only = has_pos & ((mask & ~filled_mask) == 0)
+    # all(p in X for p in positions) — vacuously true for unknown positions
+    all_guard      = (mask & ~_GUARDS) == 0
+    all_frontcourt = (mask & ~_FRONTCOURT) == 0
+    all_perimeter  = (mask & ~_PERIMETER) == 0
+
+    eff = adp.copy()
+    this_adp = adp
+
+    # ── Do-Not-Draft / tier 11 / tier diversity ──────────────────────────────
+    eff[dnd] += 300.0
+    tier11 = tier >= 11
+    eff[tier11] += 150.0
+    if round_num >= 3:
+        present = np.zeros(12, dtype=bool)
+        for t in tiers_present:
+            present[t] = True
+        need = ~tier11 & ~present[np.minimum(tier, 11)]
+        overdue = np.maximum(0, round_num - tier)
+        pull = np.minimum(8 + overdue * 5, 40)
+        if ROUNDS - round_num < missing_tier_count:
+            pull = np.minimum(pull + 15, 50)
+        eff[need] -= pull[need]
+
+    # ── Position-full penalty ────────────────────────────────────────────────
+    eff[pos_full] += 500.0
+
+    # ── RULE 1: bench-only while starter slots are open ──────────────────────
+    if open_starters:
+        if round_num <= 5:
+            eff[bench_only & (this_adp > 8.0)] += W.bench_only_starter_phase
+        elif round_num <= 7:
+            eff[bench_only & (this_adp > 15.0)] += W.bench_only_early_bench
+
+    # ── Scorer distribution ──────────────────────────────────────────────────
+    if 2 <= round_num <= 5:
+        if starter_scorers == 0:
+            eff[sc] -= min(W.scorer_pull_0scorers_base + (round_num - 2) * 8, W.scorer_pull_0scorers_max)
+            if round_num >= 4:
+                eff[~sc] += min((round_num - 3) * 6, W.non_scorer_penalty_max)
+        elif starter_scorers == 1:
+            eff[sc] -= min(W.scorer_pull_1scorer_base + (round_num - 2) * 4, W.scorer_pull_1scorer_max)
+    else:
+        if bench_scorers == 0:
+            eff[sc] -= min(W.bench_scorer_pull_0_base + (round_num - 6) * 6, W.bench_scorer_pull_0_max)
+            if round_num >= 8:
+                eff[~sc] += min((round_num - 7) * 8, W.bench_non_scorer_penalty)
+        elif bench_scorers == 1:
+            eff[sc] -= W.bench_scorer_pull_1
+
+    # ── Chemistry conflicts ──────────────────────────────────────────────────
+    if bd_count >= 2:
+        eff[bd] += W.ball_dominant_double
+    elif bd_count == 1 and round_num >= 2:
+        eff[bd] += W.ball_dominant_single
+
+    if nsb_count >= 2:
+        eff[flag(F_NON_SCORING_BIG)] += W.nsb_redundancy_double
+    elif nsb_count == 1:
+        eff[flag(F_NON_SCORING_BIG)] += W.nsb_redundancy_single
+
+    soft = flag(F_SOFT_BIG)
+    if soft_big_ct >= 1:
+        eff[soft] += W.soft_big_stack
+    if has_immob_c:
+        eff[soft] += W.soft_big_immob_c
+
+    # ── Elite starter redundancy ─────────────────────────────────────────────
+    if round_num >= 2:
+        elite_mask = 0
+        for pos in POSITIONS:
+            if slots[pos] == 1:
+                if pos in team.starters and team.starter_adp[pos] <= 30.0:
+                    elite_mask |= POS_BITS[pos]
+        if elite_mask:
+            eff[(mask & elite_mask) != 0] += W.elite_starter_redundancy
+
+    # ── Position-priority pull — rounds 2-3 ──────────────────────────────────
+    if round_num in (2, 3):
+        left = ~bench_only
+        m = left & has_c & (slots['C'] == 0)
+        eff[m] -= W.c_priority_pull
+        left &= ~m
+        m = left & has_pg & (slots['PG'] == 0)
+        eff[m] -= W.pg_priority_pull
+        left &= ~m
+        m = left & has_sf & (slots['SF'] == 0)
+        eff[m] -= W.sf_priority_pull
+        left &= ~m
+        eff[left & ((mask & empty_mask) != 0)] -= W.other_pos_priority_pull
+
+    # Guard-only players while a ball-dominant creator already covers PG duties
+    if bd_count >= 1 and round_num <= 5:
+        open_frontcourt = slots['C'] == 0 or slots['PF'] == 0 or slots['SF'] == 0
+        eff[all_guard] += W.guard_frontcourt_penalty if open_frontcourt else W.guard_pg_only_penalty
+
+    # ── Both frontcourt slots empty ──────────────────────────────────────────
+    if slots['C'] == 0 and slots['PF'] == 0 and 3 <= round_num <= 5:
+        eff[has_pos & all_perimeter] += W.both_frontcourt_empty_penalty
+
+    # ── RULE 2: C + PG synergy ───────────────────────────────────────────────
+    if slots['C'] >= 1 and slots['PG'] == 0:
+        m = has_pg & bd
+        eff[m] -= W.pg_pull_with_c
+        if round_num <= 5:
+            eff[~m & all_frontcourt] += W.pure_frontcourt_pg_needed
+
+    # ── Versatile defender urgency ───────────────────────────────────────────
+    if (soft_big_ct >= 1 or has_immob_c) and not team.has_vd and round_num >= 2:
+        eff[vd] -= W.vd_pull_soft_c
+
+    # ── Elite playmaker need ─────────────────────────────────────────────────
+    if nsb_count >= 1 and slots['PG'] == 0:
+        pull = W.elite_playmaker_pull_2nsb if nsb_count >= 2 else W.elite_playmaker_pull_1nsb
+        eff[has_pg & flag(F_ELITE_PLAYMAKER)] -= pull
+
+    # ── PnR creator needs a scoring big ──────────────────────────────────────
+    if 2 <= round_num <= 5 and team.has_pnr_creator:
+        if not team.has_pnr_big:
+            pnr_big = ((mask & _FRONTCOURT) != 0) & sc & ~flag(F_NON_SCORING_BIG)
+            eff[pnr_big] -= W.pnr_big_pull_early if round_num <= 3 else W.pnr_big_pull_late
+
+    # ── Elite distributor needs scoring wings ────────────────────────────────
+    if 2 <= round_num <= 6 and team.has_elite_playmaker:
+        scoring_wings = team.scoring_wings
+        if scoring_wings <= 1:
+            wing = sc & shooter & ~bd & ((mask & _WINGS) != 0)
+            eff[wing] -= W.scoring_wing_pull_0 if scoring_wings == 0 else W.scoring_wing_pull_1
+
+    # ── Creative fit adjustments — rounds 4+ ─────────────────────────────────
+    if round_num >= 4:
+        eff[(mask & empty_mask) != 0] -= min((round_num - 3) * 2, W.starter_slot_pull_max)
+
+        if not team.has_rim_protector:
+            eff[flag(F_ELITE_RIM_PROTECTOR)] -= min(
+                W.rim_protector_urgency_base + (round_num - 4) * 5, W.rim_protector_urgency_max)
+
+        if round_num >= 6:
+            eff[flag(F_HIGH_PORTABILITY)] -= W.portability_bonus
+
+        if shooter_count == 0:
+            eff[shooter] -= min(W.shooter_pull_0_base + max(0, (round_num - 4) * 5), W.shooter_pull_0_max)
+        elif shooter_count == 1 and round_num <= 7:
+            eff[shooter] -= min(W.shooter_pull_1_base + max(0, (round_num - 4) * 3), W.shooter_pull_1_max)
+
+        if shooter_count == 0 and round_num >= 5:
+            eff[~shooter] += min(8 + (round_num - 5) * 4, W.spacing_urgency_penalty_max)
+
+    # ── Non-scoring C compensation ───────────────────────────────────────────
+    if slots['C'] >= 1 and round_num <= 5:
+        c_starter = team.starters.get('C')
+        if c_starter and lookup(c_starter).flags & F_NON_SCORING_BIG:
+            eff[sc & ((mask & _NON_C) != 0)] -= W.non_scoring_c_compensation
+
+    # ── RULE 3: Backup center ────────────────────────────────────────────────
+    if slots['C'] == 1 and 6 <= round_num <= 9:
+        c_starter = team.starters.get('C')
+        has_c_flex = team.has_c_flex
+        if not has_c_flex:
+            eff[has_c] -= W.backup_c_pull
+        if c_starter and lookup(c_starter).flags & (F_SOFT_BIG | F_IMMOBILE_CENTER):
+            if not has_c_flex:
+                eff[has_c & vd] -= W.backup_c_defensive_pull
+
+    # ── Bench playmaker need ─────────────────────────────────────────────────
+    if 6 <= round_num <= 8 and slots['PG'] == 1:
+        if not team.has_secondary_handler and not team.bench_has_pg_handler:
+            initiator = (flags & (F_BALL_DOMINANT | F_ELITE_PLAYMAKER | F_SHOT_CREATOR)) != 0
+            eff[has_pg & initiator] -= W.bench_playmaker_pull
+
+    # ── Backup position urgency (non-C) ──────────────────────────────────────
+    flex_covered = team.flex_covered_positions()
+    left = np.ones(n, dtype=bool)
+    for bpos in ('PG', 'SG', 'SF', 'PF'):
+        if slots[bpos] == 1:
+            m = left & ((mask & POS_BITS[bpos]) != 0)
+            urgency_start = 9 if bpos in flex_covered else 7
+            if urgency_start <= round_num <= 10:
+                eff[m] -= W.backup_position_pull
+            left &= ~m
+
+    # ── Weak perimeter defense compensation ──────────────────────────────────
+    if team.weak_perimeter_ct >= W.weak_perimeter_threshold + (1 if team.star_is_shooter else 0):
+        if round_num <= 5:
+            if slots['C'] == 0:
+                eff[has_c & vd] -= W.defensive_c_pull
+            if slots['PF'] == 0:
+                eff[has_pf & vd] -= W.defensive_pf_pull
+        if 6 <= round_num <= 9:
+            eff[pd] -= W.bench_perimeter_pull
+
+    # ── Defense saturation penalty ───────────────────────────────────────────
+    if team.defender_count >= 2:
+        eff[(vd | pd) & ~sc] += W.defense_saturation_penalty
+
+    # ── Bench guard redundancy ───────────────────────────────────────────────
+    if round_num >= 6:
+        if team.bench_scoring_guards >= 1:
+            eff[sc & has_pos & all_guard] += W.bench_guard_redundancy
+
+    # ── Round 6-7 star-position duplicates ───────────────────────────────────
+    if 6 <= round_num <= 7 and team.n_picks >= 2:
+        eff[has_pos & ((mask & ~team.star_mask) == 0)] += W.r6_r7_duplicate_penalty
+
+    # ── Fall protection floor ────────────────────────────────────────────────
+    protected = (~dnd & (tier < 11) & (this_adp < _UNKNOWN_ADP)
+                 & ~pos_full & ~(bench_only & open_starters))
+    if round_num == 1:
+        max_fall = np.full(n, 3.0)
+    elif round_num == 2:
+        max_fall = np.where(tier <= 2, 2.0, 5.0)
+    elif round_num == 3:
+        max_fall = np.where(tier <= 3, 4.0, 7.0)
+    elif round_num <= 5:
+        max_fall = np.full(n, 7.0)
+    else:
+        max_fall = np.full(n, 15.0)
+    eff = np.where(protected, np.minimum(eff, this_adp + max_fall), eff)
+
+    # ── Global overdue override ──────────────────────────────────────────────
+    if overall_pick > 0:
+        max_fall_global = _global_max_fall(round_num)
+        eligible = ((adp < _UNKNOWN_ADP) & ~dnd & ~tier11 & ~pos_full
+                    & ~(bench_only & open_starters))
+        deadline = np.where(tier == 1, num_teams,
+                   np.where(tier == 2, num_teams + 5,
+                   np.where(tier == 3, num_teams * 3 - 5, tier * num_teams)))
+        tier_overdue = eligible & (tier <= 5) & (overall_pick > deadline)
+        adp_overdue  = eligible & ~tier_overdue & (overall_pick > adp + max_fall_global)
+        eff = np.where(tier_overdue, adp - 50.0, eff)
+        eff = np.where(adp_overdue, adp - 20.0, eff)
+
+    return eff
+
+
+def score_available(
+    team_picks:   list[str],
+    available:    list[str],
+    player_adp:   dict[str, float],
+    overall_pick: int = 0,
+    num_teams:    int = 30,
+    profile:      TeamProfile | None = None,
+) -> np.ndarray:
+    """Effective ADP for each player in `available` (same order), as an array."""
+    if profile is None:
+        profile = TeamProfile.from_picks(team_picks, player_adp)
+    pool = _pool_for(player_adp)
+    idx = pool.indices(available)
+    return score_arrays(
+        profile, pool.adp[idx], pool.tier[idx], pool.mask[idx], pool.flags[idx],
+        player_adp, overall_pick, num_teams,
+    )
+
+
+def pick(
+    team_picks:   list[str],
+    available:    list[str],
+    player_adp:   dict[str, float] | None = None,
+    pool_size:    int                     = 450,
+    overall_pick: int                     = 0,
+    num_teams:    int                     = 30,
+    profile:      TeamProfile | None      = None,
+    trace:        list | None             = None,
+    trace_k:      int                     = 5,
+) -> str:
+    """
+    Drop-in replacement for ai_drafter.pick() backed by score_arrays().
+    Traces use the scalar ai_drafter.explain() — the scores are identical.
+    """
+    if not available:
+        raise ValueError("No players available to draft.")
+
+    if player_adp is None:
+        player_adp = {}
+
+    round_num = len(team_picks) + 1
+    if profile is None:
+        profile = TeamProfile.from_picks(team_picks, player_adp)
+    eff = score_available(team_picks, available, player_adp, overall_pick, num_teams, profile)
+
+    jitter = _jitter(round_num)
+    noise = np.fromiter((random.uniform(-jitter, jitter) for _ in range(len(eff))),
+                        dtype=np.float64, count=len(eff))
+    best = available[int(np.argmin(eff + noise))]
+
+    if trace is not None:
+        for i in np.argsort(eff, kind="stable")[:trace_k]:
+            trace.append(ai_drafter.explain(available[i], profile, player_adp, overall_pick, num_teams))
+    return best
+
+
+# ── Parity check ──────────────────────────────────────────────────────────────
+
+def check_parity(
+    pool:       list[str],
+    player_adp: dict[str, float],
+    num_teams:  int = 30,
+    seed:       int = 0,
+) -> list[str]:
+    """
+    Run one full snake draft with ai_drafter, scoring every pick with both
+    engines. Returns a list of human-readable mismatches (empty = identical).
+    """
+    from draft_manager import build_snake_order
+
+    problems: list[str] = []
+    rosters: list[list[str]] = [[] for _ in range(num_teams)]
+    profiles = [TeamProfile() for _ in range(num_teams)]
+    drafted: set[str] = set()
+    order = build_snake_order(num_teams)
+
+    # The scalar side rebuilds its profile from the roster every pick; the
+    # vector side uses the running profile, so this also checks add().
+    for i, team_idx in enumerate(order, 1):
+        team = rosters[team_idx]
+        available = [p for p in pool if p not in drafted]
+        scalar = ai_drafter.score_available(team, available, player_adp, i, num_teams)
+        vector = score_available(team, available, player_adp, i, num_teams, profiles[team_idx])
+        for p, v in zip(available, vector):
+            if scalar[p] != v:
+                problems.append(f"pick {i} R{len(team) + 1}: {p} scalar={scalar[p]} vector={v}")
+
+        state = random.Random(seed * 100_003 + i).getstate()
+        random.setstate(state)
+        a = ai_drafter.pick(team, available, player_adp, len(pool), i, num_teams)
+        random.setstate(state)
+        b = pick(team, available, player_adp, len(pool), i, num_teams, profiles[team_idx])
+        if a != b:
+            problems.append(f"pick {i}: scalar chose {a}, vector chose {b}")
+
+        team.append(a)
+        profiles[team_idx].add(a, player_adp.get(a, _UNKNOWN_ADP))
+        drafted.add(a)
+
+    return problems
+
+
+if __name__ == "__main__":
+    import argparse
+    from player_data import PLAYER_TIERS, PLAYER_POSITIONS, get_tier
+
+    parser = argparse.ArgumentParser(description="Check vector_drafter against ai_drafter.")
+    parser.add_argument("--teams", type=int, nargs="+", default=[30, 12, 8])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Synthetic pool: every player the metadata knows, ADP roughly by tier.
+    rng = random.Random(args.seed)
+    names = list(dict.fromkeys([*PLAYER_TIERS, *PLAYER_POSITIONS]))
+    adp = {n: round(get_tier(n) * 28 + rng.uniform(-20, 20) + 1, 1)
+           for n in names if rng.random() < 0.95}
+
+    failed = False
+    for teams in args.teams:
+        problems = check_parity(names, adp, num_teams=teams, seed=args.seed)
+        status = "OK" if not problems else f"{len(problems)} mismatches"
+        print(f"{teams:>2} teams: {status}")
+        for line in problems[:20]:
+            print("   ", line)
+        failed |= bool(problems)
+    raise SystemExit(1 if failed else 0)
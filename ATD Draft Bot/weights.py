@@ -0,0 +1,219 @@
+# weights.py
+# The AI's tunable weights, compiled from weights.json into one immutable object.
+#
+# ai_drafter used to keep weights.json as a plain dict and look every value up
+# by string key inside _effective_adp, for every player on every pick. Weights
+# instead holds one slot per key (W.ball_dominant_single), and is built once
+# per load:
+#   - the key set is fixed (WEIGHT_KEYS) — a missing key fails at load, not
+#     halfway through a draft; unknown keys are reported and ignored
+#   - every value must be a finite number inside feedback.analyzer.WEIGHT_BOUNDS
+#     (keys without bounds must be >= 0)
+#   - instances are immutable, so a reload replaces the object instead of
+#     mutating one a pick may be reading
+#   - `version` is a short hash of the values; drafts record it with each pick
+#
+# Weights still reads like the old dict (w["key"], w.items(), {**w}), so code
+# that only displays or copies weights is unchanged.
+#
+# save() writes weights.json atomically and WeightsWatcher polls it, so an edit
+# made by hand or by !confirmweights is picked up without a restart.
+
+import hashlib
+import json
+import math
+import os
+import threading
+from collections.abc import Callable, Iterator, Mapping
+
+from feedback.analyzer import WEIGHT_BOUNDS
+
+WEIGHT_KEYS: tuple[str, ...] = (
+    "ball_dominant_single", "ball_dominant_double",
+    "nsb_redundancy_single", "nsb_redundancy_double",
+    "soft_big_stack", "soft_big_immob_c", "elite_starter_redundancy",
+    "bench_only_starter_phase", "bench_only_early_bench",
+    "guard_frontcourt_penalty", "guard_pg_only_penalty", "pure_frontcourt_pg_needed",
+    "r6_r7_duplicate_penalty", "bench_guard_redundancy", "defense_saturation_penalty",
+    "scorer_pull_0scorers_base", "scorer_pull_0scorers_max",
+    "scorer_pull_1scorer_base", "scorer_pull_1scorer_max", "non_scorer_penalty_max",
+    "bench_scorer_pull_0_base", "bench_scorer_pull_0_max", "bench_scorer_pull_1",
+    "bench_non_scorer_penalty",
+    "c_priority_pull", "pg_priority_pull", "sf_priority_pull", "other_pos_priority_pull",
+    "both_frontcourt_empty_penalty", "pg_pull_with_c", "pure_frontcourt_pg_push",
+    "vd_pull_soft_c", "elite_playmaker_pull_1nsb", "elite_playmaker_pull_2nsb",
+    "pnr_big_pull_early", "pnr_big_pull_late", "scoring_wing_pull_0", "scoring_wing_pull_1",
+    "starter_slot_pull_max", "rim_protector_urgency_base", "rim_protector_urgency_max",
+    "portability_bonus", "shooter_pull_0_base", "shooter_pull_0_max",
+    "shooter_pull_1_base", "shooter_pull_1_max", "spacing_urgency_penalty_max",
+    "non_scoring_c_compensation", "backup_c_pull", "backup_c_defensive_pull",
+    "backup_position_pull", "bench_playmaker_pull", "defensive_c_pull", "defensive_pf_pull",
+    "bench_perimeter_pull", "weak_perimeter_threshold",
+)
+_KEY_SET = frozenset(WEIGHT_KEYS)
+
+
+class WeightsError(ValueError):
+    """weights.json (or a set of overrides) is missing keys or has out-of-range values."""
+
+
+def validate(values: Mapping[str, float]) -> list[str]:
+    """Problems with `values` as a complete weight set; empty if it is usable."""
+    problems = [f"missing `{k}`" for k in WEIGHT_KEYS if k not in values]
+    for k in WEIGHT_KEYS:
+        if k not in values:
+            continue
+        v = values[k]
+        if isinstance(v, bool) or not isinstance(v, (int, float)) or not math.isfinite(v):
+            problems.append(f"`{k}` is not a number ({v!r})")
+            continue
+        lo, hi = WEIGHT_BOUNDS.get(k, (0, math.inf))
+        if not lo <= v <= hi:
+            problems.append(f"`{k}` = {v} outside [{lo}, {hi}]")
+    return problems
+
+
+class Weights:
+    __slots__ = WEIGHT_KEYS + ("version",)
+
+    def __init__(self, values: Mapping[str, float]):
+        problems = validate(values)
+        if problems:
+            raise WeightsError("; ".join(problems))
+        for k in WEIGHT_KEYS:
+            object.__setattr__(self, k, values[k])
+        digest = hashlib.sha1(json.dumps([values[k] for k in WEIGHT_KEYS]).encode())
+        object.__setattr__(self, "version", digest.hexdigest()[:12])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Weights are immutable — build a new set with replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError("Weights are immutable")
+
+    def __reduce__(self):
+        # Unpickling (scheduler / sim workers) goes through __init__, which re-validates
+        return (Weights, (self.to_dict(),))
+
+    def replace(self, overrides: Mapping[str, float] | None = None) -> "Weights":
+        """A new, validated weight set with `overrides` applied. Unknown keys raise."""
+        if not overrides:
+            return self
+        unknown = [k for k in overrides if k not in _KEY_SET]
+        if unknown:
+            raise WeightsError(f"unknown weight(s): {', '.join(sorted(unknown))}")
+        return Weights({**self.to_dict(), **overrides})
+
+    def to_dict(self) -> dict[str, float]:
+        return {k: getattr(self, k) for k in WEIGHT_KEYS}
+
+    # Read-only mapping interface, for display and copying
+    def __getitem__(self, key: str) -> float:
+        if key not in _KEY_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _KEY_SET else default
+
+    def keys(self) -> tuple[str, ...]:
+        return WEIGHT_KEYS
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        return ((k, getattr(self, k)) for k in WEIGHT_KEYS)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(WEIGHT_KEYS)
+
+    def __len__(self) -> int:
+        return len(WEIGHT_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _KEY_SET
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Weights):
+            return NotImplemented
+        return self.version == other.version
+
+    def __hash__(self) -> int:
+        return hash(self.version)
+
+    def __repr__(self) -> str:
+        return f"Weights(version={self.version})"
+
+
+# ── File I/O ──────────────────────────────────────────────────────────────────
+
+def load(path: str) -> Weights:
+    """
+    Compile weights.json. Keys starting with "_" are file metadata; other
+    unknown keys are reported and ignored. Raises WeightsError / OSError /
+    json.JSONDecodeError if the file can't be used.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    values = {k: v for k, v in data.items() if not k.startswith("_")}
+    unknown = sorted(values.keys() - _KEY_SET)
+    if unknown:
+        print(f"[Weights] Ignoring unknown key(s) in {os.path.basename(path)}: {', '.join(unknown)}")
+    return Weights(values)
+
+
+def save(path: str, data: dict) -> None:
+    """
+    Write weights.json atomically: a temp file in the same directory, fsynced,
+    then renamed over the original. Readers (and WeightsWatcher) only ever see
+    the old file or the complete new one.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# ── Hot reload ────────────────────────────────────────────────────────────────
+
+class WeightsWatcher:
+    """
+    Polls a weights file's mtime/size from a daemon thread and calls
+    `on_change(path)` when it changes. Polling rather than inotify keeps it
+    dependency-free and working on bind-mounted volumes.
+    """
+
+    def __init__(self, path: str, on_change: Callable[[str], None], interval: float = 5.0):
+        self.path      = path
+        self.on_change = on_change
+        self.interval  = interval
+        self._stamp    = self._stat()
+        self._stop     = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def start(self) -> "WeightsWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="weights-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            stamp = self._stat()
+            if stamp is None or stamp == self._stamp:
+                continue
+            self._stamp = stamp
+            try:
+                self.on_change(self.path)
+            except Exception as exc:
+                print(f"[Weights] Reload handler failed: {exc}")
@@ -10,9 +10,14 @@ import os
 from datetime import datetime
 import requests.exceptions
 from config import DISCORD_TOKEN, DISCORD_CHANNEL_ID, SPREADSHEET_ID, SERVICE_ACCOUNT_FILE, WORKSHEET_NAME, PRICE_REQUIRED, DRAFT_LIST_BOT_ID
-from player_positions import PLAYER_POSITIONS
+from player_meta import load as load_players, normalize
 from emoji_map import EMOJI_TEAM_MAP, UNICODE_EMOJI_MAP
 
+# Shared player metadata (players.json, built from atd_players/ at the repo root)
+PLAYERS = load_players()
+PLAYER_POSITIONS: dict[str, str] = {m.name: "/".join(m.positions) for m in PLAYERS if m.positions}
+PLAYER_ADP: dict[str, float] = {m.name: m.adp for m in PLAYERS if m.adp is not None}
+
 # ── Persistent storage ────────────────────────────────────────────────────────
 _CONFIG_FILE  = "/data/sheet_config.json"
 _UNDO_FILE    = "/data/undo_stack.json"
@@ -314,27 +319,21 @@ class SheetManager:
                 return [pos]
             return []
 
-        name_lower = player_name.lower().strip()
-        pos_str = None
-
-        # Exact match
-        for stored, p in PLAYER_POSITIONS.items():
-            if stored.lower() == name_lower:
-                pos_str = p
-                break
+        # Exact match on any spelling or alias
+        meta = PLAYERS.get(player_name)
 
         # Partial match fallback
-        if pos_str is None:
-            for stored, p in PLAYER_POSITIONS.items():
-                if name_lower in stored.lower() or stored.lower() in name_lower:
-                    pos_str = p
-                    break
+        if meta is None:
+            key = normalize(player_name)
+            if key:
+                meta = next((m for k, m in PLAYERS.index().items()
+                             if m.positions and (key in k or k in key)), None)
 
-        if pos_str is None:
+        if meta is None or not meta.positions:
             return []
 
         # Return all positions in order, filtering to valid ones only
-        return [p.strip().upper() for p in pos_str.split('/') if p.strip().upper() in POSITION_OFFSETS]
+        return [p for p in meta.positions if p in POSITION_OFFSETS]
 
     def add_player(self, team_name, player_name, year=None, price=None, position_override=None, bench_only=False):
         """
@@ -372,7 +371,7 @@ class SheetManager:
             return False, (
                 f"Position unknown for **{player_name}**.\n"
                 f"Add their position at the end of your message (e.g. `PG`, `SG`, `SF`, `PF`, `C`), "
-                f"or add them to `player_positions.py`."
+                f"or add them to `atd_players/positions.py`."
             )
 
         # 3. Duplicate check — player must not already exist anywhere in the sheet
@@ -1398,160 +1397,6 @@ async def cmd_addyear(ctx, *, args: str):
     await ctx.send(f"✅ **{player_name}** — year set to **{year}** on **{team_name}**.")
 
 
-_PLAYER_ADP = {
-    "Michael Jordan": 1.20, "LeBron James": 1.80, "Shaquille O'Neal": 3.70,
-    "Stephen Curry": 4.40, "Kevin Garnett": 4.40, "Larry Bird": 6.20,
-    "Magic Johnson": 7.00, "Kareem Abdul-Jabbar": 8.30, "Hakeem Olajuwon": 9.30,
-    "Kevin Durant": 9.70, "Kobe Bryant": 11.80, "Jerry West": 12.10,
-    "Tim Duncan": 12.10, "Nikola Jokic": 15.30, "Kawhi Leonard": 15.70,
-    "Shai Gilgeous-Alexander": 15.90, "Dwyane Wade": 16.10, "David Robinson": 19.00,
-    "Steve Nash": 19.00, "Chris Paul": 19.00, "Tracy McGrady": 20.90,
-    "Oscar Robertson": 21.70, "Bill Walton": 23.50, "Giannis Antetokounmpo": 24.60,
-    "Wilt Chamberlain": 24.70, "Anthony Davis": 25.90, "Joel Embiid": 27.20,
-    "Julius Erving": 27.70, "Bill Russell": 29.80, "James Harden": 31.40,
-    "Karl Malone": 32.20, "Dirk Nowitzki": 32.70, "Grant Hill": 32.70,
-    "Jayson Tatum": 33.80, "Luka Doncic": 33.80, "Scottie Pippen": 35.70,
-    "Reggie Miller": 36.60, "Draymond Green": 39.00, "Penny Hardaway": 39.60,
-    "Charles Barkley": 39.80, "Paul George": 40.00, "Manu Ginobili": 42.20,
-    "Walt Frazier": 44.50, "Clyde Drexler": 44.60, "Bob McAdoo": 45.40,
-    "Jimmy Butler": 45.70, "Victor Wembanyama": 47.10, "Ray Allen": 47.30,
-    "Paul Pierce": 49.50, "Dwight Howard": 51.10, "Damian Lillard": 52.30,
-    "Mark Price": 52.80, "John Havlicek": 54.00, "Rick Barry": 54.30,
-    "Chris Mullin": 54.90, "Sidney Moncrief": 55.80, "Vince Carter": 56.70,
-    "Moses Malone": 58.90, "Willis Reed": 61.00, "Chauncey Billups": 61.90,
-    "Patrick Ewing": 61.90, "Jason Kidd": 61.90, "Anthony Edwards": 62.10,
-    "Shawn Kemp": 62.80, "Russell Westbrook": 64.80, "Klay Thompson": 65.50,
-    "Terry Porter": 69.20, "Marques Johnson": 70.20, "Rasheed Wallace": 71.10,
-    "Brandon Roy": 71.10, "Devin Booker": 71.10, "Rashard Lewis": 71.70,
-    "Eddie Jones": 73.40, "Tyrese Haliburton": 73.60, "Deron Williams": 73.90,
-    "Kyle Lowry": 75.40, "Larry Nance Sr.": 76.30, "John Stockton": 79.90,
-    "Evan Mobley": 80.30, "Gary Payton": 80.90, "Peja Stojakovic": 81.30,
-    "George Gervin": 81.80, "Shawn Marion": 82.00, "Andrei Kirilenko": 84.30,
-    "Bobby Jones": 85.60, "Marc Gasol": 86.00, "Kevin Johnson": 87.10,
-    "Joe Dumars": 88.40, "Alonzo Mourning": 88.80, "Dave Cowens": 89.40,
-    "Pau Gasol": 90.30, "Victor Oladipo": 91.10, "James Worthy": 91.90,
-    "Isiah Thomas": 94.80, "Jalen Williams": 96.60, "Jaylen Brown": 97.00,
-    "Kyrie Irving": 97.80, "Mitch Richmond": 98.10, "Andre Iguodala": 99.40,
-    "Khris Middleton": 99.40, "Mike Conley": 101.00, "Bob Lanier": 101.30,
-    "Dan Majerle": 102.30, "Al Horford": 106.20, "Chris Bosh": 106.90,
-    "Pascal Siakam": 108.10, "Jrue Holiday": 108.20, "Alex English": 109.90,
-    "Bam Adebayo": 110.80, "Chet Holmgren": 111.10, "Rudy Gobert": 113.30,
-    "Derrick Rose": 113.50, "Jaren Jackson Jr.": 116.30, "Derek Harper": 117.00,
-    "Bradley Beal": 117.90, "Paul Millsap": 120.30, "Michael Cooper": 120.40,
-    "Donovan Mitchell": 121.20, "Allen Iverson": 121.30, "Karl-Anthony Towns": 121.40,
-    "Jalen Brunson": 122.00, "Mikal Bridges": 122.10, "Elgin Baylor": 122.80,
-    "Shane Battier": 125.20, "Doug Christie": 125.40, "Jeff Hornacek": 126.50,
-    "Derrick White": 127.00, "Zion Williamson": 127.40, "Danny Granger": 131.30,
-    "Horace Grant": 133.50, "Bob Dandridge": 134.30, "Danny Green": 134.90,
-    "Jack Sikma": 134.90, "Paul Pressey": 135.30, "Gordon Hayward": 135.30,
-    "Lauri Markkanen": 135.70, "Lamar Odom": 136.30, "Chris Webber": 136.70,
-    "Hersey Hawkins": 142.80, "Sam Jones": 143.10, "Lou Hudson": 144.00,
-    "Desmond Bane": 144.30, "Kevin Love": 145.10, "David Thompson": 145.30,
-    "Artis Gilmore": 145.50, "Michael Finley": 147.50, "Blake Griffin": 147.80,
-    "Dennis Rodman": 151.40, "Baron Davis": 151.50, "Gilbert Arenas": 152.10,
-    "Kevin McHale": 152.70, "Chet Walker": 153.70, "Joe Johnson": 154.40,
-    "Kiki VanDeWeghe": 154.90, "OG Anunoby": 156.50, "Tim Hardaway Sr.": 157.10,
-    "Dominique Wilkins": 157.60, "Cade Cunningham": 157.80, "Ron Artest": 158.00,
-    "Darius Garland": 158.10, "Richard Hamilton": 162.20, "Connie Hawkins": 163.00,
-    "Walter Davis": 165.30, "Ja Morant": 166.30, "Hedo Turkoglu": 169.90,
-    "Joakim Noah": 171.00, "Tayshaun Prince": 171.40, "Reggie Lewis": 172.10,
-    "Bernard King": 172.20, "Latrell Sprewell": 172.40, "Ron Harper": 172.70,
-    "Steve Smith": 174.40, "Robert Horry": 176.80, "David West": 178.00,
-    "Kyle Korver": 178.30, "Dennis Johnson": 179.10, "Gus Johnson": 180.20,
-    "Luol Deng": 180.50, "Nicolas Batum": 180.60, "Goran Dragic": 181.30,
-    "Alvan Adams": 181.30, "Jamal Murray": 181.70, "Terrell Brandon": 183.10,
-    "Michael Redd": 183.70, "Wesley Matthews": 183.80, "Billy Cunningham": 184.50,
-    "Sam Perkins": 185.40, "Tyson Chandler": 185.90, "Elton Brand": 190.60,
-    "Gus Williams": 190.70, "Paul Westphal": 191.20, "Antonio McDyess": 192.80,
-    "George Hill": 193.40, "Carmelo Anthony": 195.50, "Amar'e Stoudemire": 196.30,
-    "Ben Wallace": 197.00, "Ivica Zubac": 197.50, "Boris Diaw": 198.60,
-    "John Wall": 199.00, "Dikembe Mutombo": 199.30, "Robert Covington": 199.80,
-    "Dick Van Arsdale": 200.20, "Hal Greer": 201.70, "Bob Pettit": 201.90,
-    "Glen Rice": 205.30, "Trae Young": 206.10, "Bobby Phills": 206.80,
-    "Tony Parker": 206.90, "Jamaal Wilkes": 210.60, "Nate Thurmond": 211.80,
-    "Tyrese Maxey": 213.10, "Josh Howard": 213.90, "Scott Wedman": 214.30,
-    "Josh Smith": 215.20, "Andrew Bogut": 215.30, "Lonzo Ball": 215.80,
-    "Andrew Wiggins": 217.40, "Robert Parish": 218.60, "Kemba Walker": 220.00,
-    "Sam Cassell": 220.90, "Franz Wagner": 220.90, "Clifford Robinson": 221.40,
-    "Sleepy Floyd": 223.00, "Arvydas Sabonis": 223.40, "Jermaine O'Neal": 224.40,
-    "Kirk Hinrich": 224.80, "Kristaps Porzingis": 225.30, "Brad Daugherty": 225.50,
-    "Gerald Wallace": 225.80, "Jarrett Allen": 228.30, "Aaron Gordon": 228.60,
-    "Fat Lever": 228.90, "Maurice Cheeks": 231.20, "Brent Barry": 232.00,
-    "Sam Lacey": 232.80, "Dale Ellis": 233.20, "Detlef Schrempf": 234.20,
-    "Isaiah Thomas": 235.10, "Jason Terry": 236.90, "Jamal Mashburn": 237.80,
-    "Tiny Archibald": 238.40, "Byron Scott": 238.70, "Fred VanVleet": 238.80,
-    "De'Aaron Fox": 244.40, "Dave DeBusschere": 244.40, "Danny Ainge": 247.20,
-    "Rolando Blackman": 247.50, "Brook Lopez": 248.90, "Vlade Divac": 250.40,
-    "Zach LaVine": 250.60, "LaMelo Ball": 251.70, "Alex Caruso": 252.89,
-    "Otto Porter Jr.": 253.00, "Brian Taylor": 255.90, "Toni Kukoc": 256.70,
-    "Yao Ming": 259.70, "Bob Love": 261.30, "Isaiah Hartenstein": 261.90,
-    "Trevor Ariza": 262.10, "Elvin Hayes": 263.10, "Amen Thompson": 266.50,
-    "Brandon Ingram": 266.80, "Steve Francis": 268.10, "Roger Brown": 268.30,
-    "Wes Unseld": 269.40, "Marcus Smart": 270.00, "Wesley Person": 270.80,
-    "Brad Miller": 270.90, "Michael Porter Jr.": 273.20, "Nene Hilario": 273.60,
-    "Caron Butler": 275.60, "Jon McGlocklin": 278.10, "Phil Smith": 278.70,
-    "Fred Brown": 279.00, "Derrick Coleman": 280.10, "Anthony Mason": 280.40,
-    "Dan Roundfield": 281.40, "Gary Harris": 282.70, "Robert Williams": 282.90,
-    "Richard Jefferson": 283.20, "Malcolm Brogdon": 283.70, "PJ Brown": 284.80,
-    "Mookie Blaylock": 285.80, "James Posey": 286.40, "Bill Laimbeer": 288.10,
-    "Phil Chenier": 288.10, "Mike Miller": 288.20, "Mike Bibby": 290.40,
-    "Marcus Camby": 291.00, "Allan Houston": 291.60, "Ralph Sampson": 291.60,
-    "Rod Strickland": 292.00, "Kerry Kittles": 293.00, "Julius Randle": 295.60,
-    "Jerome Kersey": 296.10, "Jason Richardson": 296.10, "Jaden McDaniels": 297.90,
-    "Bo Outlaw": 298.60, "Scottie Barnes": 298.70, "Drazen Petrovic": 298.80,
-    "Larry Johnson": 299.00, "Kenny Anderson": 299.20, "Larry Kenon": 299.20,
-    "Herb Jones": 299.50, "Joe Ingles": 299.90, "Jalen Rose": 300.10,
-    "Greg Ballard": 300.20, "Jerry Sloan": 300.40, "Domantas Sabonis": 301.20,
-    "Tom Chambers": 301.60, "Buck Williams": 302.00, "Ben Simmons": 302.00,
-    "LaMarcus Aldridge": 302.30, "Danilo Gallinari": 302.70, "Randy Smith": 303.00,
-    "Theo Ratliff": 303.70, "Lu Dort": 304.40, "Wally Szczerbiak": 304.50,
-    "DeAndre Jordan": 304.60, "Raja Bell": 304.70, "DeMar DeRozan": 304.70,
-    "Doug Collins": 304.70, "JJ Redick": 304.80, "Lenny Wilkens": 304.80,
-    "Willie Wise": 305.00, "Deandre Ayton": 305.00, "DeMarre Carroll": 305.00,
-    "Carlos Boozer": 305.10, "Micheal Williams": 305.20, "Pete Maravich": 305.30,
-    "CJ McCollum": 305.40, "Myles Turner": 305.40, "Zelmo Beaty": 305.50,
-    "Micheal Ray Richardson": 305.60, "Tom Boerwinkle": 305.70,
-    "Derrick McKey": 305.80, "JoJo White": 305.80, "Sean Elliott": 305.90,
-    "Calvin Natt": 305.90, "Rodney McCray": 306.00, "Chuck Person": 306.00,
-    "Dave Bing": 306.00, "Louie Dampier": 306.10, "Jerry Lucas": 306.10,
-    "Paul Arizin": 306.10, "Nick Anderson": 306.20, "Norman Powell": 306.30,
-    "Andrew Toney": 306.30, "Rudy Tomjanovich": 306.40, "Andrew Bynum": 306.50,
-    "Mickey Johnson": 306.50, "Vin Baker": 306.50, "Mo Williams": 306.60,
-    "Marvin Williams": 306.60, "Kentavious Caldwell-Pope": 306.70,
-    "Maurice Lucas": 306.70, "Larry Hughes": 306.80, "Johnny Moore": 307.00,
-    "Walt Bellamy": 307.00, "John Starks": 307.00, "Jack Twyman": 307.00,
-    "Bobby Simmons": 307.10, "Bob Cousy": 307.10, "Doc Rivers": 307.20,
-    "Kevin Martin": 307.20, "George McGinnis": 307.20, "Ben Gordon": 307.20,
-    "John Collins": 307.30, "Billy Knight": 307.30, "Ty Lawson": 307.30,
-    "Lucius Allen": 307.30, "Otis Birdsong": 307.40, "Glenn Robinson": 307.40,
-    "Earl Monroe": 307.40, "Darrell Armstrong": 307.50, "Gail Goodrich": 307.50,
-    "Jalen Suggs": 307.50, "Brian Winters": 307.50, "Thabo Sefolosha": 307.60,
-    "DeMarcus Cousins": 307.60, "Clint Capela": 307.70, "Cedric Maxwell": 307.70,
-    "Danny Manning": 307.70, "JR Smith": 307.80, "Archie Clark": 307.80,
-    "Mehmet Okur": 307.80, "Tony Allen": 307.90, "Zydrunas Ilgauskas": 307.90,
-    "Adrian Dantley": 307.90, "Rik Smits": 307.90, "Jameer Nelson": 308.00,
-    "Raef LaFrentz": 308.00, "Serge Ibaka": 308.10, "Nikola Vucevic": 308.10,
-    "Xavier McDaniel": 308.10, "Trey Murphy": 308.20, "Mark Aguirre": 308.20,
-    "Dan Issel": 308.20, "Bill Bridges": 308.20, "Arron Afflalo": 308.30,
-    "Mychal Thompson": 308.30, "World B. Free": 308.40, "Rajon Rondo": 308.50,
-    "Kenyon Martin": 308.50, "Dorian Finney-Smith": 308.60,
-    "Nicolas Claxton": 308.60, "Mark Eaton": 308.60, "Jae Crowder": 308.70,
-    "Clifford Ray": 308.70, "Jim Paxson": 308.70, "Don Buse": 308.80,
-    "Terry Cummings": 308.80, "Jay Vincent": 308.80, "Nate McMillan": 308.90,
-    "Bruce Bowen": 308.90, "Darryl Dawkins": 308.90, "Tom Gola": 308.90,
-    "Andre Miller": 309.00, "Norm Van Lier": 309.00, "Zach Randolph": 309.00,
-    "Ricky Pierce": 309.00, "Channing Frye": 309.00, "Bryon Russell": 309.00,
-    "Deni Avdija": 309.00, "Jalen Johnson": 309.00, "Austin Reaves": 309.00,
-    "Charles Oakley": 309.00, "Duncan Robinson": 309.00, "Richie Guerin": 309.00,
-    "Shareef Abdul-Rahim": 309.00, "Kendall Gill": 309.00,
-    "Bill Cartwright": 309.00, "Mel Daniels": 309.00, "Paul Silas": 309.00,
-    "James Silas": 309.00, "Spencer Haywood": 309.00, "Ricky Rubio": 309.00,
-    "Calvin Murphy": 309.00, "Eddie Johnson": 309.00, "Stephon Marbury": 309.00,
-    "Antawn Jamison": 309.00, "Paolo Banchero": 309.00, "Alvin Robertson": 309.00,
-    "Carl Braun": 309.00, "Maurice Stokes": 309.00, "Quinn Buckner": 309.00,
-    "Bill Sharman": 309.00, "Anthony Parker": 309.00,
-}
-
 _MATRIX_PLAYER_ORDER = [
     "Michael Jordan", "LeBron James", "Shaquille O'Neal", "Stephen Curry",
     "Kevin Garnett", "Larry Bird", "Magic Johnson", "Kareem Abdul-Jabbar",
@@ -1902,7 +1747,7 @@ async def cmd_available(ctx, *, position: str):
         return
 
     # Sort by ADP (lower = better)
-    undrafted.sort(key=lambda n: _PLAYER_ADP.get(n, 9999))
+    undrafted.sort(key=lambda n: PLAYER_ADP.get(n, 9999))
 
     # Paginate: 10 players per page
     per_page = 10
@@ -1913,7 +1758,7 @@ async def cmd_available(ctx, *, position: str):
         chunk = undrafted[start:start + per_page]
         lines = []
         for i, name in enumerate(chunk, start=start + 1):
-            adp = _PLAYER_ADP.get(name)
+            adp = PLAYER_ADP.get(name)
             adp_str = f" — ADP {adp}" if adp else ""
             lines.append(f"**{i}.** {name}{adp_str}")
         embed = discord.Embed(
@@ -2140,7 +1985,7 @@ async def cmd_sheethelp(ctx):
     e2.add_field(
         name="Auto-detected position",
         value=(
-            "The bot looks up the player in `player_positions.py` (300+ players).\n"
+            "The bot looks up the player in the shared player list (450+ players, any spelling or nickname).\n"
             "Players can have multiple positions, e.g. LeBron is `PF/SF`."
         ),
         inline=False,
@@ -2161,7 +2006,7 @@ async def cmd_sheethelp(ctx):
             "`Bench PF` at end → force **bench PF slot only**, skip all starters\n"
             "`Bench` alone → force bench for auto-detected position(s)\n\n"
             "If a player's position is unknown, you **must** add a position override, "
-            "or add them to `player_positions.py`."
+            "or add them to `atd_players/positions.py`."
         ),
         inline=False,
     )
@@ -2197,7 +2042,7 @@ async def cmd_sheethelp(ctx):
             "❌ *No team emoji found* — Your message didn't include a custom team emoji.\n"
             "❌ *Unrecognised emoji :X:* — Add it to `emoji_map.py`.\n"
             "❌ *Team not found in sheet* — Team name in `emoji_map.py` doesn't match the sheet.\n"
-            "❌ *Position unknown* — Player not in `player_positions.py`; add a position override.\n"
+            "❌ *Position unknown* — Player not in `atd_players/positions.py`; add a position override.\n"
             "❌ *Already on [team]* — Duplicate pick; player is already on another team.\n"
             "❌ *No open slots* — All matching position slots for this team are filled."
         ),
@@ -2241,7 +2086,7 @@ async def cmd_sheethelp(ctx):
         name="Config files (for admins)",
         value=(
             "`emoji_map.py` — Maps custom emoji names to team names in the sheet.\n"
-            "`player_positions.py` — Stores each player's position(s) in priority order.\n"
+            "`atd_players/positions.py` — Each player's position(s) in priority order (run `python -m atd_players.build` after editing).\n"
             "`.env` — Discord token, channel ID, spreadsheet ID, worksheet name."
         ),
         inline=False,
@@ -25,10 +25,10 @@ Admin:
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
@@ -37,8 +37,11 @@ from discord.ext import commands
 
 from config import (AS_THRESHOLD, ATD_CHAT_CHANNEL_ID, DISCORD_TOKEN,
                     DRAFT_CHANNEL_ID, DRAFT_LIST_BOT_ID, LOTTO_CHANNEL_ID,
-                    PENALTY_PLAYERS, ROUNDS)
-from draft import DraftState, HISTORY_FILE, build_snake_order, state_file, _state_dir
+                    PENALTY_PLAYERS, PICK_BUFFER_SIZE, RECOVERY_HISTORY_LIMIT,
+                    ROUNDS)
+from deadlines import DeadlineScheduler
+from draft import DraftState, HISTORY_DB, HISTORY_FILE, build_snake_order, state_file, _state_dir
+from skip_history import SkipHistory
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 
@@ -107,8 +110,6 @@ class DraftSession:
     def __init__(self, channel_id: int):
         self.channel_id              = channel_id
         self.draft                   = DraftState.load(channel_id)
-        self.timer_task:   asyncio.Task | None = None
-        self.window_task:  asyncio.Task | None = None
         self.active_ping:    discord.Message | None = None
         self.active_warning: discord.Message | None = None
         self.ping_time:          datetime | None = None
@@ -117,6 +118,8 @@ class DraftSession:
         self.processing_picks:   set  = set()
         self.processed_msg_ids:  set  = set()  # prevents duplicate pick processing for same message
         self.pending_timer_start: bool = False
+        self.early_picks: deque[discord.Message] = deque(maxlen=PICK_BUFFER_SIZE)  # picks posted before their turn
+        self.last_seen_id: int | None = None   # newest message seen here — catch-up cursor after reconnects
 
     @property
     def channel(self) -> discord.TextChannel | None:
@@ -148,19 +151,15 @@ def _list_saved_channels() -> list[int]:
 
 # ── Skip history (shared across all drafts) ───────────────────────────────────
 
-def _load_skip_history() -> list[dict]:
-    try:
-        with open(HISTORY_FILE) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+_skip_db: SkipHistory | None = None
 
 
-def _append_skip_history(entry: dict):
-    history = _load_skip_history()
-    history.append(entry)
-    with open(HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=2)
+def _skip_history() -> SkipHistory:
+    """The skip history store, opened (and the old JSON imported) on first use."""
+    global _skip_db
+    if _skip_db is None:
+        _skip_db = SkipHistory(HISTORY_DB, migrate_from=HISTORY_FILE)
+    return _skip_db
 
 
 # ── Regex patterns ────────────────────────────────────────────────────────────
@@ -260,6 +259,136 @@ def _parse_lotto_message(content: str, guild: discord.Guild) -> list[dict] | Non
     return [teams_by_pos[p] for p in sorted(teams_by_pos)]
 
 
+# ── Deadlines ─────────────────────────────────────────────────────────────────
+# Every timed event is an entry in DEADLINES, one scheduler for all channels:
+#   (channel_id, "warning")   5 minutes left on the pick clock
+#   (channel_id, "deadline")  pick clock expired → auto-skip
+#   (channel_id, "repair")    restart a clock that failed to start (watchdog)
+#   ("window",)               next midnight close / 10 AM open, for every draft
+# Anything that moves a draft off the current pick calls _cancel_timers first.
+# The pick deadline is also saved with the draft, so on_ready rebuilds the
+# clocks from the state files after a restart.
+
+_WINDOW_SLACK = 1.0   # window events fire just past the boundary, so _in_window() agrees
+_REPAIR_DELAY = 30
+
+
+def _timer_failed(key, exc: Exception):
+    if isinstance(key[0], int) and key[0] in _sessions:
+        _schedule_repair(_sessions[key[0]])
+
+
+DEADLINES = DeadlineScheduler(on_error=_timer_failed)
+
+
+def _cancel_timers(s: DraftSession):
+    """Stop the pick clock (warning + deadline). The caller saves the draft."""
+    DEADLINES.cancel((s.channel_id, "warning"))
+    DEADLINES.cancel((s.channel_id, "deadline"))
+    s.draft.timer_start = None
+    s.draft.deadline    = None
+
+
+def _arm_timer(s: DraftSession, duration: float):
+    """Start the pick clock for the team now up. The caller saves the draft."""
+    _cancel_timers(s)
+    user_ids = list(s.draft.current_team["user_ids"])
+    now = datetime.now(timezone.utc)
+    s.draft.timer_start = now.isoformat()
+    s.draft.deadline    = (now + timedelta(seconds=duration)).isoformat()
+    if duration > 300:
+        DEADLINES.schedule((s.channel_id, "warning"), duration - 300, lambda: _on_warning(s, user_ids))
+    DEADLINES.schedule((s.channel_id, "deadline"), duration, lambda: _on_deadline(s, user_ids))
+
+
+def _time_left(s: DraftSession) -> float | None:
+    """Seconds left on the pick clock, from the saved deadline. None if no clock is running."""
+    if s.draft.deadline:
+        deadline = datetime.fromisoformat(s.draft.deadline)
+        return max(0.0, (deadline - datetime.now(timezone.utc)).total_seconds())
+    if s.draft.timer_start:   # saved before deadlines were stored
+        elapsed  = (datetime.now(timezone.utc) - datetime.fromisoformat(s.draft.timer_start)).total_seconds()
+        duration = s.draft.effective_timer(s.draft.round_number, s.draft.current_team_idx)
+        return max(0.0, duration - elapsed)
+    return None
+
+
+def _still_their_turn(s: DraftSession, user_ids: list[int]) -> bool:
+    return (
+        s.draft.state == "active"
+        and s.draft.current_team is not None
+        and any(uid in s.draft.current_team["user_ids"] for uid in user_ids)
+    )
+
+
+async def _on_warning(s: DraftSession, user_ids: list[int]):
+    if not _still_their_turn(s, user_ids):
+        return
+    log.info("WARNING | ch=%d | 5 min remaining | Team: %s", s.channel_id, s.draft.current_team["name"])
+    mentions = " ".join(f"<@{uid}>" for uid in user_ids)
+    s.active_warning = await s.channel.send(f"⚠️ {mentions} - **5 minutes remaining**!")
+
+
+async def _on_deadline(s: DraftSession, user_ids: list[int]):
+    if not _still_their_turn(s, user_ids):
+        return
+    log.info("TIMEOUT | ch=%d | Auto-skip | Team: %s", s.channel_id, s.draft.current_team["name"])
+    await _do_skip(s, auto=True)
+
+
+def _schedule_window():
+    if _in_window():
+        DEADLINES.schedule(("window",), _secs_until_close() + _WINDOW_SLACK, _on_window_close)
+    else:
+        DEADLINES.schedule(("window",), _secs_until_open() + _WINDOW_SLACK, _on_window_open)
+
+
+async def _on_window_close():
+    _schedule_window()
+    for s in list(_sessions.values()):
+        remaining = DEADLINES.remaining((s.channel_id, "deadline"))
+        if s.draft.state != "active" or remaining is None or not s.draft.current_team:
+            continue
+        try:
+            await _auto_pause_for_window(s, remaining)
+        except Exception as exc:
+            log.error("Window close failed | ch=%d | %s", s.channel_id, exc, exc_info=True)
+
+
+async def _on_window_open():
+    _schedule_window()
+    for s in list(_sessions.values()):
+        if s.draft.state != "window_paused":
+            continue
+        try:
+            await _resume_after_window(s)
+        except Exception as exc:
+            log.error("Window resume failed | ch=%d | %s", s.channel_id, exc, exc_info=True)
+            _schedule_repair(s)
+
+
+def _schedule_repair(s: DraftSession):
+    DEADLINES.schedule((s.channel_id, "repair"), _REPAIR_DELAY, lambda: _repair(s))
+
+
+async def _repair(s: DraftSession):
+    """Restart the clock of an active draft that has no live ping or deadline."""
+    if not (s.draft.state == "active"
+            and _in_window()
+            and s.draft.current_team
+            and not s.pending_timer_start
+            and ((s.channel_id, "deadline") not in DEADLINES or s.active_ping is None)):
+        return
+    if not s.channel:   # not in the cache yet — try again later
+        _schedule_repair(s)
+        return
+    log.warning(
+        "WATCHDOG | ch=%d | No active ping / dead timer | Pick #%d | Team: %s — restarting",
+        s.channel_id, s.draft.overall_pick, s.draft.current_team["name"],
+    )
+    await _start_timer(s)
+
+
 # ── Timer helpers (all take a DraftSession) ───────────────────────────────────
 
 async def _ping_current(s: DraftSession, remaining: int = None):
@@ -310,10 +439,10 @@ async def _auto_pause_for_window(s: DraftSession, remaining: float, next_up: boo
     if not team:
         return
     remaining = max(0, int(remaining))
+    _cancel_timers(s)
     s.draft.paused_remaining = remaining
-    s.draft.timer_start      = None
     s.draft.state            = "window_paused"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "timer")
 
     channel  = s.channel
     mins, sec = remaining // 60, remaining % 60
@@ -339,11 +468,8 @@ async def _auto_pause_for_window(s: DraftSession, remaining: float, next_up: boo
             f"{_team_mentions(team)} has **{mins}m {sec}s** remaining — resumes at **10:00 AM ET**."
         )
 
-    s.window_task = asyncio.create_task(_window_resume_task(s, _secs_until_open()))
-
 
-async def _window_resume_task(s: DraftSession, sleep_secs: float):
-    await asyncio.sleep(sleep_secs)
+async def _resume_after_window(s: DraftSession):
     if s.draft.state != "window_paused":
         return
     team = s.draft.current_team
@@ -353,9 +479,9 @@ async def _window_resume_task(s: DraftSession, sleep_secs: float):
     remaining = (s.draft.paused_remaining
                  or s.draft.effective_timer(s.draft.round_number, s.draft.current_team_idx))
     s.draft.state            = "active"
-    s.draft.timer_start      = datetime.now(timezone.utc).isoformat()
     s.draft.paused_remaining = None
-    s.draft.save(s.channel_id)
+    _arm_timer(s, remaining)
+    s.draft.save(s.channel_id, "timer")
 
     channel  = s.channel
     mins, sec = remaining // 60, remaining % 60
@@ -377,62 +503,6 @@ async def _window_resume_task(s: DraftSession, sleep_secs: float):
     s.active_ping = await channel.send(
         content=f"☀️ **Draft window open!** {_team_mentions(team)}", embed=embed
     )
-    s.timer_task = asyncio.create_task(_timer_loop(s, remaining, team["user_ids"]))
-
-
-async def _timer_loop(s: DraftSession, duration: int, user_ids: list[int]):
-    channel = s.channel
-    loop    = asyncio.get_event_loop()
-    start   = loop.time()
-
-    def _elapsed() -> float:
-        return loop.time() - start
-
-    def _remaining() -> float:
-        return max(0.0, duration - _elapsed())
-
-    def _still_their_turn() -> bool:
-        return (
-            s.draft.state == "active"
-            and s.draft.current_team is not None
-            and any(uid in s.draft.current_team["user_ids"] for uid in user_ids)
-        )
-
-    async def _checked_sleep(target_elapsed: float) -> bool:
-        while True:
-            rem_sleep = target_elapsed - _elapsed()
-            if rem_sleep <= 0:
-                return True
-            sleep = min(rem_sleep, _secs_until_close(), 60.0)
-            await asyncio.sleep(max(sleep, 0))
-            if not _in_window():
-                return False
-            if _elapsed() >= target_elapsed - 0.5:
-                return True
-
-    mentions = " ".join(f"<@{uid}>" for uid in user_ids)
-
-    if duration > 300:
-        ok = await _checked_sleep(duration - 300)
-        if not ok:
-            if _still_their_turn():
-                await _auto_pause_for_window(s, _remaining())
-            return
-        if _still_their_turn():
-            log.info("WARNING | ch=%d | 5 min remaining | Team: %s",
-                     s.channel_id, s.draft.current_team["name"] if s.draft.current_team else "?")
-            s.active_warning = await channel.send(f"⚠️ {mentions} - **5 minutes remaining**!")
-
-    ok = await _checked_sleep(duration)
-    if not ok:
-        if _still_their_turn():
-            await _auto_pause_for_window(s, _remaining())
-        return
-
-    if _still_their_turn():
-        log.info("TIMEOUT | ch=%d | Auto-skip | Team: %s",
-                 s.channel_id, s.draft.current_team["name"] if s.draft.current_team else "?")
-        await _do_skip(s, auto=True)
 
 
 async def _process_challenge(s: DraftSession, challenger_mention: str, challenger_name: str):
@@ -452,8 +522,7 @@ async def _process_challenge(s: DraftSession, challenger_mention: str, challenge
         await _do_skip(s, auto=True)
         return
 
-    if s.timer_task and not s.timer_task.done():
-        s.timer_task.cancel()
+    _cancel_timers(s)
 
     for msg in (s.active_ping, s.active_warning):
         if msg:
@@ -465,6 +534,8 @@ async def _process_challenge(s: DraftSession, challenger_mention: str, challenge
 
     new_duration = 600
     deadline_ts  = int(datetime.now(timezone.utc).timestamp()) + new_duration
+    _arm_timer(s, new_duration)
+    s.draft.save(s.channel_id, "timer")
 
     embed = discord.Embed(
         title=_pick_title(s),
@@ -479,24 +550,22 @@ async def _process_challenge(s: DraftSession, challenger_mention: str, challenge
     )
     embed.set_footer(text="Use !timerskip to pass." if s.draft.timer_override is not None else "Use !timerskip to pass (costs 10 min on future picks).")
 
-    s.active_ping      = await channel.send(content=_team_mentions(team), embed=embed)
-    s.draft.timer_start = datetime.now(timezone.utc).isoformat()
-    s.draft.save(s.channel_id)
-    s.timer_task = asyncio.create_task(_timer_loop(s, new_duration, team["user_ids"]))
+    s.active_ping = await channel.send(content=_team_mentions(team), embed=embed)
 
 
 async def _start_timer(s: DraftSession):
     s.pending_timer_start = True
     try:
         await _start_timer_inner(s)
+    except Exception:
+        _schedule_repair(s)
+        raise
     finally:
         s.pending_timer_start = False
 
 
 async def _start_timer_inner(s: DraftSession):
-    current = asyncio.current_task()
-    if s.timer_task and not s.timer_task.done() and s.timer_task is not current:
-        s.timer_task.cancel()
+    _cancel_timers(s)
 
     team = s.draft.current_team
     if not team or s.draft.state != "active":
@@ -510,6 +579,8 @@ async def _start_timer_inner(s: DraftSession):
         return
 
     if not _in_window():
+        if await _recover_early_pick(s):
+            return
         duration = s.draft.effective_timer(s.draft.round_number, s.draft.current_team_idx)
         await _auto_pause_for_window(s, duration, next_up=True)
         return
@@ -545,22 +616,22 @@ async def _start_timer_inner(s: DraftSession):
         await _do_skip(s, auto=True)
         return
 
+    if await _recover_early_pick(s):
+        return
+
     log.info(
         "TIMER START | ch=%d | Round %d | Pick %d | Team: %s | Duration: %d sec (%d min)",
         s.channel_id, s.draft.round_number, s.draft.overall_pick,
         team["name"], duration, duration // 60,
     )
-    s.draft.timer_start = datetime.now(timezone.utc).isoformat()
-    s.draft.save(s.channel_id)
+    _arm_timer(s, duration)
+    s.draft.save(s.channel_id, "timer")
 
     await _ping_current(s)
-    s.timer_task = asyncio.create_task(_timer_loop(s, duration, team["user_ids"]))
 
 
 async def _do_skip(s: DraftSession, auto: bool = False):
-    current = asyncio.current_task()
-    if s.timer_task and not s.timer_task.done() and s.timer_task is not current:
-        s.timer_task.cancel()
+    _cancel_timers(s)
 
     team = s.draft.current_team
     if not team:
@@ -577,6 +648,7 @@ async def _do_skip(s: DraftSession, auto: bool = False):
     team["pending_makeup"] = True
     if s.draft.mode == "roundless":
         team["last_pick_number"] = pick_num
+    s.draft.team_changed(team_idx)
 
     s.draft.last_skip = {
         "round":                 s.draft.current_round,
@@ -603,7 +675,7 @@ async def _do_skip(s: DraftSession, auto: bool = False):
         s.channel_id, "auto (timeout)" if auto else "manual", team["name"], skip_count,
     )
 
-    _append_skip_history({
+    _skip_history().add({
         "channel_id":    s.channel_id,
         "draft_label":   s.draft.draft_label or s.draft.draft_started or "Unknown ATD",
         "draft_started": s.draft.draft_started,
@@ -619,8 +691,7 @@ async def _do_skip(s: DraftSession, auto: bool = False):
     await _delete_active_ping(s)
 
     s.draft.advance()
-    s.draft.timer_start = None
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "skip")
 
     channel = s.channel
     await channel.send(
@@ -643,7 +714,8 @@ async def _try_process_roundless_makeup(s: DraftSession, message: discord.Messag
     if pick_num_in_msg > s.draft.overall_pick:
         return
 
-    team = next((t for t in s.draft.teams if message.author.id in t["user_ids"]), None)
+    team_idx, team = next(((i, t) for i, t in enumerate(s.draft.teams)
+                           if message.author.id in t["user_ids"]), (None, None))
     if not team or not team.get("pending_makeup"):
         return
 
@@ -667,7 +739,8 @@ async def _try_process_roundless_makeup(s: DraftSession, message: discord.Messag
     team["last_pick_number"] = pick_num_in_msg
     team["pending_makeup"]   = False
     team["picks"].append(pick_raw)
-    s.draft.save(s.channel_id)
+    s.draft.team_changed(team_idx)
+    s.draft.save(s.channel_id, "pick")
 
     log.info("MAKEUP PICK | ch=%d | Team: %s | Pick #%d | %s",
              s.channel_id, team["name"], pick_num_in_msg, pick_raw)
@@ -702,7 +775,8 @@ async def _try_process_pick(s: DraftSession, message: discord.Message, is_edit:
 
     success = False
     try:
-        team = s.draft.current_team
+        team_idx = s.draft.current_team_idx
+        team     = s.draft.current_team
 
         is_commissioner_pick = (
             bool(DRAFT_LIST_BOT_ID and message.author.id == DRAFT_LIST_BOT_ID)
@@ -734,10 +808,7 @@ async def _try_process_pick(s: DraftSession, message: discord.Message, is_edit:
             s.channel_id, s.draft.overall_pick, s.draft.round_number, s.draft.pick_in_round,
             team["name"], pick_raw,
         )
-        if s.timer_task and not s.timer_task.done():
-            s.timer_task.cancel()
-        if s.window_task and not s.window_task.done():
-            s.window_task.cancel()
+        _cancel_timers(s)
         await _delete_active_ping(s)
         if s.draft.state in ("window_paused", "paused"):
             s.draft.state            = "active"
@@ -756,6 +827,7 @@ async def _try_process_pick(s: DraftSession, message: discord.Message, is_edit:
                 except ValueError:
                     pass
             team["last_pick_number"] = pick_num
+        s.draft.team_changed(team_idx)
 
         penalty_note = ""
         if player_name.lower() in PENALTY_PLAYERS:
@@ -768,7 +840,7 @@ async def _try_process_pick(s: DraftSession, message: discord.Message, is_edit:
                 )
 
         s.draft.advance()
-        s.draft.save(s.channel_id)
+        s.draft.save(s.channel_id, "pick")
         success = True
 
         await message.add_reaction("✅")
@@ -810,6 +882,8 @@ async def _try_process_pick(s: DraftSession, message: discord.Message, is_edit:
 @bot.event
 async def on_ready():
     log.info("Bot online — logged in as %s (id: %s)", bot.user, bot.user.id)
+    DEADLINES.start()
+    _schedule_window()
 
     for ch_id in _list_saved_channels():
         s = _get_session(ch_id)
@@ -819,6 +893,8 @@ async def on_ready():
 
         if not channel:
             log.warning("Channel %d not in cache — will restore timers when first used", ch_id)
+            if s.draft.state == "active":
+                _schedule_repair(s)
             continue
 
         if s.draft.state == "window_paused" and s.draft.current_team:
@@ -829,86 +905,123 @@ async def on_ready():
 
             if _in_window():
                 s.draft.state            = "active"
-                s.draft.timer_start      = datetime.now(timezone.utc).isoformat()
                 s.draft.paused_remaining = None
-                s.draft.save(ch_id)
+                _arm_timer(s, remaining)
+                s.draft.save(ch_id, "timer")
                 await channel.send(
                     f"🔄 Bot restarted - draft window is open. Resuming {_team_mentions(team)}'s turn "
                     f"(**{mins}m {sec}s** remaining)."
                 )
-                s.timer_task = asyncio.create_task(_timer_loop(s, remaining, team["user_ids"]))
                 await _ping_current(s, remaining=remaining)
             else:
                 await channel.send(
                     f"🔄 Bot restarted - draft window is closed. {_team_mentions(team)} has "
                     f"**{mins}m {sec}s** remaining.\nTimer will resume at **10:00 AM ET**."
                 )
-                s.window_task = asyncio.create_task(_window_resume_task(s, _secs_until_open()))
 
-        elif s.draft.state == "active" and s.draft.timer_start and s.draft.current_team:
-            elapsed   = (datetime.now(timezone.utc) - datetime.fromisoformat(s.draft.timer_start)).total_seconds()
-            duration  = s.draft.effective_timer(s.draft.round_number, s.draft.current_team_idx)
-            remaining = duration - elapsed
+        elif s.draft.state == "active" and s.draft.current_team:
+            remaining = _time_left(s)
             team      = s.draft.current_team
 
-            if remaining <= 0:
+            if remaining is None:   # stopped between picks — start the next clock shortly
+                _schedule_repair(s)
+            elif remaining <= 0:
                 await channel.send(
                     f"🔄 Bot restarted - {_team_mentions(team)}'s time had already expired. Auto-skipping…"
                 )
                 await _do_skip(s, auto=True)
+            elif not _in_window():
+                await _auto_pause_for_window(s, remaining)
             else:
-                s.timer_task = asyncio.create_task(_timer_loop(s, int(remaining), team["user_ids"]))
+                _arm_timer(s, int(remaining))
+                s.draft.save(ch_id, "timer")
                 await _ping_current(s, remaining=int(remaining))
 
-    asyncio.create_task(_missed_pick_scanner())
+    for s in list(_sessions.values()):
+        asyncio.create_task(_catch_up(s))
 
 
-async def _missed_pick_scanner():
-    await asyncio.sleep(30)
-    while True:
-        await asyncio.sleep(30)
-        try:
-            for ch_id, s in list(_sessions.items()):
-                if s.draft.state not in ("active", "paused", "window_paused"):
-                    continue
-                channel = s.channel
-                if not channel:
-                    continue
-
-                expected_pick = s.draft.overall_pick
-
-                async for msg in channel.history(limit=30):
-                    if msg.author.bot:
-                        continue
-                    match = _PICK_RE.match(msg.content.strip())
-                    if not match:
-                        continue
-                    if int(match.group(1)) != expected_pick:
-                        continue
-                    already_done = any(r.emoji == "✅" and r.me for r in msg.reactions)
-                    if already_done:
-                        break
-                    log.info(
-                        "MISSED PICK RECOVERED | ch=%d | Overall #%d | Author: %s | Content: %s",
-                        ch_id, expected_pick, msg.author.display_name, msg.content[:80],
-                    )
-                    await _try_process_pick(s, msg)
-                    break
-
-                # Watchdog: active draft but no ping and dead/missing timer
-                if (s.draft.state == "active"
-                        and _in_window()
-                        and s.draft.current_team
-                        and not s.pending_timer_start
-                        and (s.timer_task is None or s.timer_task.done() or s.active_ping is None)):
-                    log.warning(
-                        "WATCHDOG | ch=%d | No active ping / dead timer | Pick #%d | Team: %s — restarting",
-                        ch_id, s.draft.overall_pick, s.draft.current_team["name"],
-                    )
-                    await _start_timer(s)
+@bot.event
+async def on_resumed():
+    log.info("Gateway session resumed — checking draft channels for missed picks")
+    for s in list(_sessions.values()):
+        asyncio.create_task(_catch_up(s))
 
-        except Exception as exc:
-            log.warning("Missed-pick scanner error: %s", exc)
+
+# ── Missed-pick recovery ──────────────────────────────────────────────────────
+# A pick can be posted before its turn comes up (#15 while #14 is still on the
+# clock), or while the bot is disconnected. Instead of polling every channel's
+# history, early picks are kept per channel as they arrive (on_message /
+# on_message_edit) and processed the moment their pick comes up, from
+# _start_timer. Messages sent while the bot was away are fetched once per
+# reconnect (on_ready / on_resumed), starting after the last message the bot
+# saw in that channel, and go through the same path.
+
+_LIVE_STATES = ("active", "paused", "window_paused")
+
+
+def _pick_number(message: discord.Message) -> int | None:
+    if message.author.bot:
+        return None
+    match = _PICK_RE.match(message.content.strip())
+    return int(match.group(1)) if match else None
+
+
+def _remember_early_pick(s: DraftSession, message: discord.Message):
+    """Keep a pick message for the current or a later pick; an edit replaces the old version."""
+    for i, m in enumerate(s.early_picks):
+        if m.id == message.id:
+            del s.early_picks[i]
+            break
+    num = _pick_number(message)
+    if num is not None and num >= s.draft.overall_pick:
+        s.early_picks.append(message)
+
+
+async def _recover_early_pick(s: DraftSession) -> bool:
+    """Process a kept message for the pick now up, newest first. True if the pick was made."""
+    if s.draft.state not in _LIVE_STATES:
+        return False
+    pick = s.draft.overall_pick
+    for message in reversed(list(s.early_picks)):
+        if _pick_number(message) != pick or message.id in s.processed_msg_ids:
+            continue
+        log.info(
+            "EARLY PICK | ch=%d | Overall #%d | Author: %s | Content: %s",
+            s.channel_id, pick, message.author.display_name, message.content[:80],
+        )
+        await _try_process_pick(s, message)
+        if s.draft.overall_pick != pick or s.draft.state not in _LIVE_STATES:
+            return True
+    return False
+
+
+async def _catch_up(s: DraftSession):
+    """Fetch messages missed while disconnected and handle any picks among them."""
+    channel = s.channel
+    if not channel or s.draft.state not in _LIVE_STATES:
+        return
+    if s.last_seen_id is not None:
+        history = channel.history(limit=RECOVERY_HISTORY_LIMIT,
+                                  after=discord.Object(id=s.last_seen_id), oldest_first=True)
+    else:   # first connect since a restart: the most recent messages
+        history = channel.history(limit=RECOVERY_HISTORY_LIMIT)
+    try:
+        missed = sorted([m async for m in history], key=lambda m: m.id)
+    except discord.HTTPException as exc:
+        log.warning("Catch-up failed | ch=%d | %s", s.channel_id, exc)
+        return
+
+    for m in missed:
+        s.last_seen_id = max(s.last_seen_id or 0, m.id)
+        if any(r.emoji == "✅" and r.me for r in m.reactions):
+            s.processed_msg_ids.add(m.id)
+        else:
+            _remember_early_pick(s, m)
+    if missed:
+        log.info("CATCH-UP | ch=%d | %d message(s) fetched", s.channel_id, len(missed))
+    if await _recover_early_pick(s):
+        log.info("MISSED PICK RECOVERED | ch=%d | now at pick #%d", s.channel_id, s.draft.overall_pick)
 
 
 @bot.event
@@ -966,7 +1079,10 @@ async def on_message(message: discord.Message):
         return
 
     s = _sessions[message.channel.id]
+    s.last_seen_id = max(s.last_seen_id or 0, message.id)
     await _try_process_pick(s, message)
+    if s.draft.state in _LIVE_STATES:
+        _remember_early_pick(s, message)
 
     if s.draft.mode == "roundless" and s.draft.state in ("active", "paused", "window_paused"):
         await _try_process_roundless_makeup(s, message)
@@ -996,7 +1112,10 @@ async def on_message_edit(before: discord.Message, after: discord.Message):
         return
     if before.content == after.content:
         return
-    await _try_process_pick(_sessions[after.channel.id], after, is_edit=True)
+    s = _sessions[after.channel.id]
+    await _try_process_pick(s, after, is_edit=True)
+    if s.draft.state in _LIVE_STATES:
+        _remember_early_pick(s, after)
 
 
 @bot.event
@@ -1056,7 +1175,7 @@ async def timerloadlotto(ctx):
     s.draft.pick_order = build_snake_order(len(teams))
     s.draft.state      = "lotto"
     s.draft.timer_override = prev_timer_override
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     log.info("LOTTO LOADED | ch=%d | %d teams | Slots: %s",
              s.channel_id, len(teams), [t["name"] for t in teams])
@@ -1121,7 +1240,7 @@ async def timerlottoupdate(ctx):
             old["user_ids"] = new["user_ids"]
             old["name"]     = new["name"]
 
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
     if changes:
         await ctx.send("✅ **Lotto updated:**\n" + "\n".join(changes))
     else:
@@ -1144,7 +1263,7 @@ async def timersetup(ctx, *_):
         for m in mentions
     ]
     s.draft.state = "setup"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     lines = "\n".join(f"{i+1}. {t['name']}" for i, t in enumerate(s.draft.teams))
     await ctx.send(
@@ -1186,7 +1305,7 @@ async def timergmlotto(ctx, teams_per_gm: int = None, *_):
     s.draft.teams      = slots
     s.draft.pick_order = build_snake_order(len(slots))
     s.draft.state      = "lotto"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     lines = "\n".join(f"**{i+1}.** <@{t['user_ids'][0]}>" for i, t in enumerate(slots))
     embed = discord.Embed(
@@ -1212,7 +1331,7 @@ async def timerlotto(ctx):
     s.draft.teams      = [s.draft.teams[i] for i in indices]
     s.draft.pick_order = build_snake_order(s.draft.num_teams)
     s.draft.state      = "lotto"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     lines = "\n".join(f"**{i+1}.** {_team_mentions(t)}" for i, t in enumerate(s.draft.teams))
     embed = discord.Embed(title="🎰 Lotto Results — Draft Order", description=lines, color=discord.Color.gold())
@@ -1240,7 +1359,7 @@ async def timerorder(ctx, *positions):
     s.draft.teams      = [s.draft.teams[i] for i in idx]
     s.draft.pick_order = build_snake_order(s.draft.num_teams)
     s.draft.state      = "lotto"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     lines = "\n".join(f"**{i+1}.** {_team_mentions(t)}" for i, t in enumerate(s.draft.teams))
     embed = discord.Embed(title="📋 Draft Order Set", description=lines, color=discord.Color.blue())
@@ -1268,7 +1387,7 @@ async def timermode(ctx, mode: str = ""):
         return
 
     s.draft.mode = mode
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     if mode == "roundless":
         await ctx.send(
@@ -1306,7 +1425,7 @@ async def timerstart(ctx, *label_parts):
     s.draft.current_in_round = 0
     s.draft.draft_started    = datetime.now(timezone.utc).isoformat()
     s.draft.draft_label      = " ".join(parts) if parts else None
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     mode_note  = "\n🔄 **Roundless mode** — pick order determined by money spent, picks made, and time since last pick." if s.draft.mode == "roundless" else ""
     label_note = f" (**{s.draft.draft_label}**)" if s.draft.draft_label else ""
@@ -1352,7 +1471,7 @@ async def timerpenalty(ctx, pick_number: int):
         return
 
     s.draft.apply_penalty(team_idx)
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "penalty")
     await ctx.send(
         f"⚠️ Penalty applied — **{team['name']}** (slot {team_idx + 1}, pick #{pick_number}) "
         f"will pick **last** every round from Round 6 onward."
@@ -1368,7 +1487,7 @@ async def timerrebuildorder(ctx):
         await ctx.send("❌ No draft in progress.")
         return
     s.draft.pick_order = build_snake_order(s.draft.num_teams, s.draft.penalty_teams)
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "penalty")
     penalty_names = ", ".join(s.draft.teams[i]["name"] for i in s.draft.penalty_teams) if s.draft.penalty_teams else "none"
     await ctx.send(f"✅ Pick order rebuilt for {s.draft.num_teams} teams. Penalty teams: {penalty_names}")
 
@@ -1398,10 +1517,7 @@ async def timerjumpto(ctx, pick_number: int):
         new_round    = zero_pick // s.draft.num_teams
         new_in_round = zero_pick % s.draft.num_teams
 
-    if s.timer_task and not s.timer_task.done():
-        s.timer_task.cancel()
-    if s.window_task and not s.window_task.done():
-        s.window_task.cancel()
+    _cancel_timers(s)
     await _delete_active_ping(s)
 
     s.draft.current_round    = new_round
@@ -1409,7 +1525,7 @@ async def timerjumpto(ctx, pick_number: int):
     s.draft.paused_remaining = None
     s.draft.timer_start      = None
     s.draft.state            = "active"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "override")
 
     team = s.draft.current_team
     log.info("JUMP | ch=%d | To pick %d | Round %d | In-round %d | Team: %s",
@@ -1458,12 +1574,9 @@ async def timersetpick(ctx, pick_number: int, member: discord.Member):
     s.draft.paused_remaining   = None
     s.draft.timer_start        = None
     s.draft.state              = "active"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "override")
 
-    if s.timer_task and not s.timer_task.done():
-        s.timer_task.cancel()
-    if s.window_task and not s.window_task.done():
-        s.window_task.cancel()
+    _cancel_timers(s)
     await _delete_active_ping(s)
 
     team = s.draft.teams[team_idx]
@@ -1501,7 +1614,7 @@ async def timeraddowner(ctx, slot: int, member: discord.Member):
         (ctx.guild.get_member(uid).display_name if ctx.guild.get_member(uid) else str(uid))
         for uid in team["user_ids"]
     )
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     log.info("ADD OWNER | ch=%d | Slot %d Team: %s | Added: %s (%d)",
              s.channel_id, slot, team["name"], member.display_name, member.id)
@@ -1527,7 +1640,7 @@ async def timerproxy(ctx, member: discord.Member):
         return
 
     team["user_ids"].append(member.id)
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "setup")
 
     log.info("PROXY ADD | ch=%d | Team: %s | Proxy: %s (%d)",
              s.channel_id, team["name"], member.display_name, member.id)
@@ -1550,7 +1663,7 @@ async def timerremoveproxy(ctx, member: discord.Member):
     for team in s.draft.teams:
         if member.id in team["user_ids"]:
             team["user_ids"].remove(member.id)
-            s.draft.save(s.channel_id)
+            s.draft.save(s.channel_id, "setup")
             log.info("PROXY REMOVE | ch=%d | Team: %s | Removed: %s (%d)",
                      s.channel_id, team["name"], member.display_name, member.id)
             await ctx.send(f"✅ Removed {member.mention} as a proxy for **{team['name']}**.")
@@ -1613,10 +1726,7 @@ async def timerunskip(ctx):
         await ctx.send("❌ No active draft.")
         return
 
-    if s.timer_task and not s.timer_task.done():
-        s.timer_task.cancel()
-    if s.window_task and not s.window_task.done():
-        s.window_task.cancel()
+    _cancel_timers(s)
 
     undo = s.draft.last_skip
     s.draft.current_round    = undo["round"]
@@ -1629,9 +1739,10 @@ async def timerunskip(ctx):
     prev_lpn = undo.get("prev_last_pick_number")
     if prev_lpn is not None:
         s.draft.teams[undo["team_idx"]]["last_pick_number"] = prev_lpn
+    s.draft.team_changed(undo["team_idx"])
 
     s.draft.last_skip = None
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "undo")
 
     team = s.draft.current_team
     log.info("UNDO SKIP | ch=%d | Pick #%d | Team: %s | Skip count restored to %d",
@@ -1666,9 +1777,8 @@ async def timerstatus(ctx):
     elif s.draft.state == "window_paused":
         remaining = s.draft.paused_remaining or 0
         time_left = f"🌙 WINDOW PAUSED — {int(remaining // 60)}m {int(remaining % 60)}s remaining (resumes 10am ET)"
-    elif s.draft.timer_start:
-        elapsed   = (datetime.now(timezone.utc) - datetime.fromisoformat(s.draft.timer_start)).total_seconds()
-        remaining = max(0, duration - elapsed)
+    elif s.draft.deadline or s.draft.timer_start:
+        remaining = _time_left(s)
         time_left = f"{int(remaining // 60)}m {int(remaining % 60)}s"
     else:
         time_left = "unknown"
@@ -1684,10 +1794,10 @@ async def timerstatus(ctx):
         embed.add_field(name="Time Left",    value=time_left,                  inline=True)
         embed.add_field(name="Base Timer",   value=f"{duration // 60} min",    inline=True)
 
-        order       = s.draft._roundless_sorted_order()
+        order       = s.draft._roundless_sorted_order(8)
         current_idx = s.draft.current_team_idx
         queue_lines = []
-        for pos, idx in enumerate(order[:8], 1):
+        for pos, idx in enumerate(order, 1):
             t     = s.draft.teams[idx]
             money = t.get("money_spent", 0)
             picks = len(t.get("picks", []))
@@ -1782,30 +1892,19 @@ async def timerskiplist(ctx):
 @bot.command(name="timerskiphistory")
 async def timerskiphistory(ctx, member: discord.Member = None):
     """!timerskiphistory | !timerskiphistory @user"""
-    history = _load_skip_history()
-
-    if not history:
-        await ctx.send("📭 No skip history recorded yet.")
-        return
-
     if member is None:
-        totals: dict[int, dict] = {}
-        for entry in history:
-            for uid in entry["user_ids"]:
-                if uid not in totals:
-                    totals[uid] = {"name": entry["team_name"], "skips": 0, "atds": set()}
-                totals[uid]["skips"] += 1
-                label = entry.get("draft_label") or entry.get("draft_started", "?")
-                totals[uid]["atds"].add(label)
-
-        sorted_totals = sorted(totals.items(), key=lambda x: x[1]["skips"], reverse=True)
+        totals = _skip_history().leaderboard()
+        if not totals:
+            await ctx.send("📭 No skip history recorded yet.")
+            return
+
         lines = []
-        for rank, (uid, data) in enumerate(sorted_totals, 1):
+        for rank, data in enumerate(totals, 1):
+            uid        = data["user_id"]
             member_obj = ctx.guild.get_member(uid)
             name       = member_obj.display_name if member_obj else data["name"]
-            atd_count  = len(data["atds"])
             lines.append(
-                f"**{rank}.** <@{uid}> ({name}) — **{data['skips']} skip(s)** across {atd_count} ATD(s)"
+                f"**{rank}.** <@{uid}> ({name}) — **{data['skips']} skip(s)** across {data['atds']} ATD(s)"
             )
 
         embed = discord.Embed(
@@ -1816,11 +1915,13 @@ async def timerskiphistory(ctx, member: discord.Member = None):
         await ctx.send(embed=embed)
 
     else:
-        uid     = member.id
-        entries = [e for e in history if uid in e["user_ids"]]
+        entries = _skip_history().for_user(member.id)
 
         if not entries:
-            await ctx.send(f"✅ {member.mention} has no skips on record.")
+            if not _skip_history().count():
+                await ctx.send("📭 No skip history recorded yet.")
+            else:
+                await ctx.send(f"✅ {member.mention} has no skips on record.")
             return
 
         by_draft: dict[str, list[dict]] = {}
@@ -1951,12 +2052,12 @@ async def timersettimer(ctx, minutes: int):
 
     if minutes == 0:
         s.draft.timer_override = None
-        s.draft.save(s.channel_id)
+        s.draft.save(s.channel_id, "override")
         await ctx.send("✅ Timer override cleared — back to default round timers.")
         return
 
     s.draft.timer_override = minutes * 60
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "override")
     await ctx.send(f"✅ Timer set to **{minutes} minutes** for all future picks.")
 
     if s.draft.state == "active":
@@ -1984,7 +2085,8 @@ async def timerset(ctx, member: discord.Member, money: int, picks: int, last_pic
         team["picks"] = team["picks"][:picks]
     team["last_pick_number"] = last_pick
     team["pending_makeup"]   = False
-    s.draft.save(s.channel_id)
+    s.draft.team_changed(team_idx)
+    s.draft.save(s.channel_id, "override")
     await ctx.send(
         f"✅ **{team['name']}** — money: **${money}** | picks: **{picks}** | last pick: **#{last_pick}** | pending cleared."
     )
@@ -2000,7 +2102,8 @@ async def timersetmoney(ctx, member: discord.Member, amount: int):
         await ctx.send(f"❌ {member.display_name} is not in the draft.")
         return
     s.draft.teams[team_idx]["money_spent"] = amount
-    s.draft.save(s.channel_id)
+    s.draft.team_changed(team_idx)
+    s.draft.save(s.channel_id, "override")
     await ctx.send(f"✅ **{s.draft.teams[team_idx]['name']}** money spent set to **${amount}**.")
 
 
@@ -2019,7 +2122,8 @@ async def timersetpicks(ctx, member: discord.Member, count: int):
         team.setdefault("picks", []).extend(["[manual]"] * (count - current))
     elif count < current:
         team["picks"] = team["picks"][:count]
-    s.draft.save(s.channel_id)
+    s.draft.team_changed(team_idx)
+    s.draft.save(s.channel_id, "override")
     await ctx.send(f"✅ **{team['name']}** picks made set to **{count}**.")
 
 
@@ -2033,7 +2137,8 @@ async def timersetlastpick(ctx, member: discord.Member, pick_number: int):
         await ctx.send(f"❌ {member.display_name} is not in the draft.")
         return
     s.draft.teams[team_idx]["last_pick_number"] = pick_number
-    s.draft.save(s.channel_id)
+    s.draft.team_changed(team_idx)
+    s.draft.save(s.channel_id, "override")
     await ctx.send(f"✅ **{s.draft.teams[team_idx]['name']}** last pick number set to **#{pick_number}**.")
 
 
@@ -2056,7 +2161,7 @@ async def timeraddskip(ctx, member: discord.Member, count: int = 1):
 
     team = s.draft.teams[team_idx]
     team["skip_count"] = team.get("skip_count", 0) + count
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "override")
     new_total = team["skip_count"]
     penalty   = new_total * 600 // 60
     await ctx.send(
@@ -2085,19 +2190,13 @@ async def timerpause(ctx):
     team     = s.draft.current_team
     duration = s.draft.effective_timer(s.draft.round_number, s.draft.current_team_idx)
 
-    if s.draft.timer_start:
-        elapsed   = (datetime.now(timezone.utc) - datetime.fromisoformat(s.draft.timer_start)).total_seconds()
-        remaining = max(0, int(duration - elapsed))
-    else:
-        remaining = duration
-
-    if s.timer_task and not s.timer_task.done():
-        s.timer_task.cancel()
+    left      = _time_left(s)
+    remaining = duration if left is None else int(left)
 
+    _cancel_timers(s)
     s.draft.paused_remaining = remaining
-    s.draft.timer_start      = None
     s.draft.state            = "paused"
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "timer")
 
     mins = remaining // 60
     secs = remaining % 60
@@ -2123,16 +2222,18 @@ async def timerresume(ctx):
                  or s.draft.effective_timer(s.draft.round_number, s.draft.current_team_idx))
 
     s.draft.state            = "active"
-    s.draft.timer_start      = datetime.now(timezone.utc).isoformat()
     s.draft.paused_remaining = None
-    s.draft.save(s.channel_id)
+    if _in_window():
+        _arm_timer(s, remaining)
+    s.draft.save(s.channel_id, "timer")
 
     mins = remaining // 60
     secs = remaining % 60
     log.info("RESUME | ch=%d | Team: %s | Remaining: %dm %ds",
              s.channel_id, team["name"], mins, secs)
     await ctx.send(f"▶️ **Draft resumed.** {_team_mentions(team)} has **{mins}m {secs}s** to pick.")
-    s.timer_task = asyncio.create_task(_timer_loop(s, remaining, team["user_ids"]))
+    if not _in_window():
+        await _auto_pause_for_window(s, remaining)
 
 
 @bot.command(name="removeskip")
@@ -2165,7 +2266,7 @@ async def removeskip(ctx, member: discord.Member, count: int = 1):
     team_idx, team = max(slots_with_skips, key=lambda x: x[1].get("skip_count", 0))
     removed = min(count, team["skip_count"])
     team["skip_count"] = team["skip_count"] - removed
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "override")
     new_skips = team["skip_count"]
     await ctx.send(
         f"✅ Removed **{removed}** skip(s) from **{team['name']}** (slot {team_idx + 1}). "
@@ -2180,14 +2281,11 @@ async def timereset(ctx):
     """Cancel and wipe the draft for this channel."""
     s = _get_session(ctx.channel.id)
 
-    if s.timer_task and not s.timer_task.done():
-        s.timer_task.cancel()
-    if s.window_task and not s.window_task.done():
-        s.window_task.cancel()
+    _cancel_timers(s)
     await _delete_active_ping(s)
 
     s.draft = DraftState()
-    s.draft.save(s.channel_id)
+    s.draft.save(s.channel_id, "reset")
 
     log.info("RESET | ch=%d", s.channel_id)
     await ctx.send("🗑️ Draft has been reset.")
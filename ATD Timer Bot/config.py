@@ -28,6 +28,18 @@ AS_THRESHOLD = 3
 # Players that trigger the "pick at the end of rounds 6-10" penalty
 PENALTY_PLAYERS = {"lebron james", "michael jordan"}
 
+# Draft state journal: saves append a small entry; every JOURNAL_COMPACT_EVERY
+# entries the state is rewritten as one snapshot. The journal is fsynced at most
+# once per JOURNAL_FSYNC_INTERVAL seconds; an entry appended in between is
+# fsynced when the interval ends.
+JOURNAL_COMPACT_EVERY  = 50
+JOURNAL_FSYNC_INTERVAL = 1.0
+
+# Missed-pick recovery: pick messages kept per channel for picks that aren't up
+# yet, and the most messages fetched per channel after a reconnect.
+PICK_BUFFER_SIZE       = 50
+RECOVERY_HISTORY_LIMIT = 100
+
 # User ID of the ATD Draft List Bot — its picks are trusted (treated like a commissioner pick).
 # Set this as a Fly.io secret: fly secrets set DRAFT_LIST_BOT_ID=<id> --app atd-timer-bot
 DRAFT_LIST_BOT_ID = int(os.getenv("DRAFT_LIST_BOT_ID", 0)) or None
@@ -0,0 +1,104 @@
+"""
+deadlines.py — One scheduler for every timed event in every draft channel.
+Pick deadlines, 5-minute warnings and the draft window opening/closing are
+entries in a single heap, keyed so each one can be replaced or cancelled in
+O(1) (the heap entry is only marked dead and dropped when it reaches the top).
+One task sleeps until the earliest live entry and fires it exactly once.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+log = logging.getLogger("atd-timer")
+
+Callback = Callable[[], Awaitable[None]]
+
+
+class DeadlineScheduler:
+    def __init__(self, on_error: Callable[[Hashable, Exception], None] | None = None):
+        self._heap:    list[list] = []             # [when, seq, key, callback]; callback None = dead
+        self._entries: dict[Hashable, list] = {}   # key → its live heap entry
+        self._seq      = itertools.count()         # ties fire in scheduling order
+        self._dead     = 0
+        self._wake     = asyncio.Event()
+        self._task:    asyncio.Task | None = None
+        self._firing:  set[asyncio.Task] = set()   # callbacks still running (keeps them referenced)
+        self._on_error = on_error
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    # ── Scheduling ────────────────────────────────────────────────────────────
+
+    def schedule(self, key: Hashable, delay: float, callback: Callback):
+        """Run `callback()` in `delay` seconds, replacing anything already scheduled under `key`."""
+        self.cancel(key)
+        entry = [self._now() + max(0.0, delay), next(self._seq), key, callback]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wake.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the event scheduled under `key`. False if there was none."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[3] = None
+        self._dead += 1
+        if self._dead > 64 and self._dead * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if e[3] is not None]
+            heapq.heapify(self._heap)
+            self._dead = 0
+        return True
+
+    def remaining(self, key: Hashable) -> float | None:
+        """Seconds until the event under `key` fires, or None if nothing is scheduled."""
+        entry = self._entries.get(key)
+        return None if entry is None else max(0.0, entry[0] - self._now())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── Running ───────────────────────────────────────────────────────────────
+
+    def start(self):
+        """Start the dispatch task (no-op if it's already running). Needs a running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            heap = self._heap   # cancel() may have compacted it
+            while heap and heap[0][3] is None:
+                heapq.heappop(heap)
+                self._dead -= 1
+            self._wake.clear()
+            delay = heap[0][0] - self._now() if heap else None
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, key, callback = heapq.heappop(heap)
+            del self._entries[key]
+            task = asyncio.create_task(self._fire(key, callback))
+            self._firing.add(task)
+            task.add_done_callback(self._firing.discard)
+
+    async def _fire(self, key: Hashable, callback: Callback):
+        try:
+            await callback()
+        except Exception as exc:
+            log.error("Scheduled event %r failed: %s", key, exc, exc_info=True)
+            if self._on_error:
+                self._on_error(key, exc)
@@ -2,12 +2,28 @@
 draft.py — Draft state machine for ATD Timer Bot.
 Handles snake order, lotto, pick recording, and LeBron/MJ end-of-round penalty.
 Also supports roundless (money-based dynamic pick order) mode.
+
+State is persisted per channel as a snapshot (draft_state_<channel>.json) plus
+an append-only journal (draft_journal_<channel>.jsonl). save() appends one
+line holding only the fields — and, for teams, only the team entries — that
+changed since the last save; every JOURNAL_COMPACT_EVERY entries the state is
+folded into a new snapshot, written atomically, and the journal starts over.
+load() replays the journal tail over the snapshot, stopping at a torn last line.
+Journal appends are fsynced at most once per JOURNAL_FSYNC_INTERVAL; an append
+inside the interval gets a deferred fsync when it ends, so no entry stays
+unsynced for longer than that.
 """
+import asyncio
 import json
+import logging
 import os
+import time
+from bisect import bisect_left, insort
 from datetime import datetime, timezone
 
-from config import ROUNDS
+from config import JOURNAL_COMPACT_EVERY, JOURNAL_FSYNC_INTERVAL, ROUNDS
+
+log = logging.getLogger("atd-timer")
 
 _state_dir = os.environ.get("STATE_DIR", os.path.dirname(__file__))
 
@@ -15,7 +31,12 @@ _state_dir = os.environ.get("STATE_DIR", os.path.dirname(__file__))
 def state_file(channel_id: int) -> str:
     return os.path.join(_state_dir, f"draft_state_{channel_id}.json")
 
-# Skip history is shared across all drafts (entries include channel_id)
+def journal_file(channel_id: int) -> str:
+    return os.path.join(_state_dir, f"draft_journal_{channel_id}.jsonl")
+
+# Skip history is shared across all drafts (entries include channel_id).
+# HISTORY_FILE is the old JSON store, imported into HISTORY_DB on first start.
+HISTORY_DB   = os.path.join(_state_dir, "skip_history.db")
 HISTORY_FILE = os.path.join(_state_dir, "skip_history.json")
 
 # ATD snake direction per round (0-indexed).
@@ -53,14 +74,32 @@ def build_snake_order(num_teams: int, penalty_teams: list[int] = None) -> list[l
     return order
 
 
+def _last_journal_seq(channel_id: int) -> int:
+    """Highest entry number in a channel's journal (0 if there is none)."""
+    last = 0
+    try:
+        with open(journal_file(channel_id)) as f:
+            for line in f:
+                try:
+                    last = max(last, json.loads(line)["seq"])
+                except (json.JSONDecodeError, KeyError):
+                    break
+    except FileNotFoundError:
+        pass
+    return last
+
+
 class DraftState:
     def __init__(self):
+        self._queue:       list[tuple] | None = None  # roundless order, sorted; None → rebuild on next read
+        self._queue_keys:  dict[int, tuple] = {}      # team idx → its entry in _queue
         self.teams:              list[dict] = []   # {user_ids, name, picks, skip_count, money_spent, last_pick_number}
         self.pick_order:         list[list[int]] = []
         self.current_round:      int = 0           # 0-indexed round (snake) or overall pick counter (roundless)
         self.current_in_round:   int = 0           # 0-indexed within round (snake only; always 0 in roundless)
         self.penalty_teams:      list[int] = []    # team indices (LeBron / MJ owners)
         self.timer_start:        str | None = None # ISO-8601 UTC
+        self.deadline:           str | None = None # ISO-8601 UTC when the running pick timer expires
         self.paused_remaining:   int | None = None # seconds left when paused
         self.state:              str = "idle"      # idle | setup | lotto | active | complete | paused | window_paused
         self.draft_label:        str | None = None  # e.g. "ATD 101"
@@ -69,6 +108,13 @@ class DraftState:
         self.mode:               str = "snake"      # "snake" | "roundless"
         self.timer_override:     int | None = None  # override all round timers (seconds); None = use config
         self.next_team_override: int | None = None  # force a specific team idx to be current for one pick
+        # Persistence bookkeeping (not saved): what's on disk, as JSON per field / per team
+        self._disk:        dict[str, str] | None = None   # None → next save writes a snapshot
+        self._disk_teams:  list[str] = []
+        self._seq:         int = 0      # last journal entry written
+        self._entries:     int = 0      # journal entries since the snapshot
+        self._last_fsync:  float = 0.0
+        self._fsync_due:   asyncio.TimerHandle | None = None   # deferred journal fsync
 
     # ── Convenience properties ────────────────────────────────────────────────
 
@@ -76,10 +122,52 @@ class DraftState:
     def num_teams(self) -> int:
         return len(self.teams)
 
+    @property
+    def teams(self) -> list[dict]:
+        return self._teams
+
+    @teams.setter
+    def teams(self, teams: list[dict]):
+        self._teams = teams
+        self._queue = None
+
     PICKS_TO_COMPLETE = 10  # teams with this many picks are done and excluded from the queue
 
-    def _roundless_sorted_order(self) -> list[int]:
-        """Return team indices sorted by roundless pick order.
+    def _queue_entry(self, idx: int) -> tuple:
+        """Sort key for roundless pick order; see _roundless_sorted_order."""
+        t = self.teams[idx]
+        return (
+            1 if t.get("pending_makeup") else 0,
+            t.get("money_spent", 0),
+            len(t.get("picks", [])),
+            t.get("last_pick_number", 0),
+            idx,
+        )
+
+    def _roundless_queue(self) -> list[tuple]:
+        if self._queue is None:
+            self._queue_keys = {i: self._queue_entry(i) for i in range(self.num_teams)
+                                if len(self.teams[i].get("picks", [])) < self.PICKS_TO_COMPLETE}
+            self._queue = sorted(self._queue_keys.values())
+        return self._queue
+
+    def team_changed(self, idx: int):
+        """
+        Re-place a team in the roundless order. Call after changing its
+        money_spent, picks, last_pick_number or pending_makeup.
+        """
+        if self._queue is None:   # not built yet — the next read sorts from scratch
+            return
+        old = self._queue_keys.pop(idx, None)
+        if old is not None:
+            del self._queue[bisect_left(self._queue, old)]
+        if len(self.teams[idx].get("picks", [])) < self.PICKS_TO_COMPLETE:
+            entry = self._queue_entry(idx)
+            self._queue_keys[idx] = entry
+            insort(self._queue, entry)
+
+    def _roundless_sorted_order(self, limit: int | None = None) -> list[int]:
+        """Return team indices sorted by roundless pick order (the first `limit` of them).
 
         Teams with 10+ picks are complete and excluded entirely.
         Teams with pending_makeup=True sort last regardless of stats.
@@ -88,28 +176,19 @@ class DraftState:
           2. picks_made ASC    (fewer picks → picks sooner)
           3. last_pick_number ASC  (earlier last pick → more time has passed → picks sooner)
           4. lotto slot ASC    (lotto position as final tiebreaker)
+
+        The order is kept sorted between calls and only re-sorted for teams
+        passed to team_changed, or in full when `teams` is replaced.
         """
-        def key(idx):
-            t = self.teams[idx]
-            pending = 1 if t.get("pending_makeup") else 0
-            return (
-                pending,
-                t.get("money_spent", 0),
-                len(t.get("picks", [])),
-                t.get("last_pick_number", 0),
-                idx,
-            )
-        active = [i for i in range(self.num_teams)
-                  if len(self.teams[i].get("picks", [])) < self.PICKS_TO_COMPLETE]
-        return sorted(active, key=key)
+        return [entry[-1] for entry in self._roundless_queue()[:limit]]
 
     @property
     def current_team_idx(self) -> int | None:
         if self.next_team_override is not None:
             return self.next_team_override
         if self.mode == "roundless":
-            order = self._roundless_sorted_order()
-            return order[0] if order else None
+            queue = self._roundless_queue()
+            return queue[0][-1] if queue else None
         if (not self.pick_order
                 or self.current_round >= ROUNDS
                 or self.current_round >= len(self.pick_order)):
@@ -179,24 +258,111 @@ class DraftState:
 
     # ── Persistence ───────────────────────────────────────────────────────────
 
-    def save(self, channel_id: int):
-        with open(state_file(channel_id), "w") as f:
-            json.dump({
-                "teams":            self.teams,
-                "pick_order":       self.pick_order,
-                "current_round":    self.current_round,
-                "current_in_round": self.current_in_round,
-                "penalty_teams":    self.penalty_teams,
-                "timer_start":      self.timer_start,
-                "paused_remaining": self.paused_remaining,
-                "state":            self.state,
-                "draft_label":      self.draft_label,
-                "draft_started":    self.draft_started,
-                "last_skip":        self.last_skip,
-                "mode":             self.mode,
-                "timer_override":     self.timer_override,
-                "next_team_override": self.next_team_override,
-            }, f, indent=2)
+    def _doc(self) -> dict:
+        return {
+            "teams":            self.teams,
+            "pick_order":       self.pick_order,
+            "current_round":    self.current_round,
+            "current_in_round": self.current_in_round,
+            "penalty_teams":    self.penalty_teams,
+            "timer_start":      self.timer_start,
+            "deadline":         self.deadline,
+            "paused_remaining": self.paused_remaining,
+            "state":            self.state,
+            "draft_label":      self.draft_label,
+            "draft_started":    self.draft_started,
+            "last_skip":        self.last_skip,
+            "mode":             self.mode,
+            "timer_override":     self.timer_override,
+            "next_team_override": self.next_team_override,
+        }
+
+    def _remember(self, doc: dict):
+        self._disk       = {k: json.dumps(v, sort_keys=True) for k, v in doc.items() if k != "teams"}
+        self._disk_teams = [json.dumps(t, sort_keys=True) for t in doc["teams"]]
+
+    def save(self, channel_id: int, event: str = "update"):
+        """
+        Persist the state. `event` labels the journal entry (pick, skip, undo,
+        penalty, override, timer, setup, …). Appends only what changed; writes a
+        snapshot instead on the first save, after a torn journal, and every
+        JOURNAL_COMPACT_EVERY entries.
+        """
+        doc = self._doc()
+        if self._disk is None or self._entries >= JOURNAL_COMPACT_EVERY:
+            self._write_snapshot(channel_id, doc)
+            return
+
+        changed = {k: v for k, v in doc.items()
+                   if k != "teams" and json.dumps(v, sort_keys=True) != self._disk[k]}
+        teams = [json.dumps(t, sort_keys=True) for t in self.teams]
+        if len(teams) != len(self._disk_teams):
+            changed["teams"] = self.teams
+            team_diff = {}
+        else:
+            team_diff = {str(i): self.teams[i] for i, t in enumerate(teams) if t != self._disk_teams[i]}
+        if not changed and not team_diff:
+            return
+
+        entry = {"seq": self._seq + 1, "event": event, "set": changed}
+        if team_diff:
+            entry["teams"] = team_diff
+        with open(journal_file(channel_id), "a") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            f.flush()
+            # Batched fsync: a crash of the bot loses nothing (the OS has the
+            # write). Within JOURNAL_FSYNC_INTERVAL of the last fsync the entry
+            # is left to a deferred one, so power loss can cost at most the
+            # entries of the last JOURNAL_FSYNC_INTERVAL seconds.
+            wait = JOURNAL_FSYNC_INTERVAL - (time.monotonic() - self._last_fsync)
+            if wait <= 0:
+                os.fsync(f.fileno())
+                self._last_fsync = time.monotonic()
+            elif self._fsync_due is None:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:   # no event loop (scripts): don't defer
+                    os.fsync(f.fileno())
+                    self._last_fsync = time.monotonic()
+                else:
+                    self._fsync_due = loop.call_later(wait, self._fsync_journal, channel_id)
+        self._seq += 1
+        self._entries += 1
+        self._remember(doc)
+
+    def _fsync_journal(self, channel_id: int):
+        """The deferred fsync scheduled by save()."""
+        self._fsync_due = None
+        try:
+            with open(journal_file(channel_id), "a") as f:
+                os.fsync(f.fileno())
+        except OSError as exc:
+            log.error("Journal fsync failed | ch=%d | %s", channel_id, exc)
+            return
+        self._last_fsync = time.monotonic()
+
+    def _write_snapshot(self, channel_id: int, doc: dict):
+        """Atomically replace the snapshot with the full state, then empty the journal."""
+        if self._disk is None:
+            # A fresh or torn state: number past anything left in the old
+            # journal, so a crash before the truncate can't replay it over us.
+            self._seq = max(self._seq, _last_journal_seq(channel_id))
+        path = state_file(channel_id)
+        tmp  = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({**doc, "journal_seq": self._seq}, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        # Entries up to journal_seq are in the snapshot; replay skips them if
+        # we crash before the truncate below.
+        open(journal_file(channel_id), "w").close()
+        if self._fsync_due is not None:   # everything is in the fsynced snapshot
+            self._fsync_due.cancel()
+            self._fsync_due = None
+        self._entries    = 0
+        self._last_fsync = time.monotonic()
+        self._remember(doc)
 
     @classmethod
     def load(cls, channel_id: int) -> "DraftState":
@@ -205,6 +371,26 @@ class DraftState:
             return cls()
         with open(path) as f:
             d = json.load(f)
+        seq  = d.pop("journal_seq", 0)
+        entries, torn = 0, False
+        try:
+            with open(journal_file(channel_id)) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:   # crash mid-append: drop the rest
+                        torn = True
+                        break
+                    if entry["seq"] <= seq:
+                        continue
+                    d.update(entry["set"])
+                    for i, team in entry.get("teams", {}).items():
+                        d["teams"][int(i)] = team
+                    seq = entry["seq"]
+                    entries += 1
+        except FileNotFoundError:
+            pass
+
         ds = cls()
         ds.teams            = d.get("teams", [])
         ds.pick_order       = d.get("pick_order", [])
@@ -212,6 +398,7 @@ class DraftState:
         ds.current_in_round = d.get("current_in_round", 0)
         ds.penalty_teams    = d.get("penalty_teams", [])
         ds.timer_start      = d.get("timer_start")
+        ds.deadline         = d.get("deadline")
         ds.paused_remaining = d.get("paused_remaining")
         ds.state            = d.get("state", "idle")
         ds.draft_label      = d.get("draft_label")
@@ -220,4 +407,7 @@ class DraftState:
         ds.mode             = d.get("mode", "snake")
         ds.timer_override     = d.get("timer_override")
         ds.next_team_override = d.get("next_team_override")
+        ds._seq, ds._entries = seq, entries
+        if not torn:   # a torn journal can't be appended to — the next save snapshots
+            ds._remember(ds._doc())
         return ds
@@ -0,0 +1,113 @@
+"""
+skip_history.py — Skip history shared across all drafts, in SQLite.
+One row per skip in `skips` (indexed by channel and timestamp) and one row per
+GM of the skipping team in `skip_users` (keyed by user), so recording a skip is
+a single insert and !timerskiphistory is answered by indexed queries rather
+than loading every skip ever recorded.
+The old skip_history.json is imported on first open and renamed to
+skip_history.json.migrated.
+"""
+import json
+import os
+import sqlite3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skips (
+    id            INTEGER PRIMARY KEY,
+    channel_id    INTEGER NOT NULL,
+    draft_label   TEXT,
+    draft_started TEXT,
+    team_name     TEXT    NOT NULL,
+    pick_num      INTEGER NOT NULL,
+    round_num     INTEGER,
+    auto          INTEGER NOT NULL,
+    mode          TEXT,
+    timestamp     TEXT    NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skip_users (
+    user_id INTEGER NOT NULL,
+    skip_id INTEGER NOT NULL REFERENCES skips(id),
+    PRIMARY KEY (user_id, skip_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS skips_channel   ON skips(channel_id);
+CREATE INDEX IF NOT EXISTS skips_timestamp ON skips(timestamp);
+"""
+
+_COLUMNS = ("channel_id", "draft_label", "draft_started", "team_name", "pick_num",
+            "round_num", "auto", "mode", "timestamp")
+
+
+class SkipHistory:
+    def __init__(self, path: str, migrate_from: str | None = None):
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+        if migrate_from and os.path.exists(migrate_from):
+            self._migrate(migrate_from)
+
+    def _migrate(self, path: str):
+        if self.db.execute("SELECT 1 FROM skips LIMIT 1").fetchone():
+            return
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except json.JSONDecodeError:
+            entries = []
+        with self.db:
+            for entry in entries:
+                self._insert(entry)
+        os.replace(path, path + ".migrated")
+
+    def _insert(self, entry: dict):
+        row = [entry.get(c) for c in _COLUMNS]
+        row[_COLUMNS.index("auto")] = int(bool(entry.get("auto")))
+        cur = self.db.execute(
+            f"INSERT INTO skips ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})", row
+        )
+        self.db.executemany(
+            "INSERT OR IGNORE INTO skip_users (user_id, skip_id) VALUES (?, ?)",
+            [(uid, cur.lastrowid) for uid in entry["user_ids"]],
+        )
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+
+    def add(self, entry: dict):
+        """Record one skip. `entry` has the keys in _COLUMNS plus `user_ids`."""
+        with self.db:
+            self._insert(entry)
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def leaderboard(self) -> list[dict]:
+        """
+        Every GM with a skip, most skips first: user_id, name (team name on their
+        first skip), skips, atds (distinct drafts they skipped in).
+        """
+        # With a single MIN() aggregate, SQLite takes the bare team_name
+        # column from the row holding that minimum — the GM's first skip.
+        rows = self.db.execute("""
+            SELECT u.user_id,
+                   s.team_name AS name,
+                   COUNT(*) AS skips,
+                   COUNT(DISTINCT COALESCE(s.draft_label, s.draft_started, '?')) AS atds,
+                   MIN(s.id) AS first_id
+            FROM skip_users u JOIN skips s ON s.id = u.skip_id
+            GROUP BY u.user_id
+            ORDER BY skips DESC, first_id
+        """).fetchall()
+        return [{k: r[k] for k in ("user_id", "name", "skips", "atds")} for r in rows]
+
+    def for_user(self, user_id: int) -> list[dict]:
+        """A GM's skips, oldest first, as the dicts they were recorded with (minus user_ids)."""
+        rows = self.db.execute(f"""
+            SELECT {', '.join('s.' + c for c in _COLUMNS)}
+            FROM skip_users u JOIN skips s ON s.id = u.skip_id
+            WHERE u.user_id = ?
+            ORDER BY s.id
+        """, (user_id,)).fetchall()
+        return [{**dict(r), "auto": bool(r["auto"])} for r in rows]
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM skips").fetchone()[0]
@@ -0,0 +1,17 @@
+# atd_players/aliases.py
+# Other names a player goes by → the spelling used in the tables.
+# Spelling variants that only differ in case, accents or punctuation
+# ("Karl Anthony-Towns", "JJ Redick") already match without an entry here.
+
+ALIASES: dict[str, str] = {
+    "Anfernee Hardaway":   "Penny Hardaway",
+    "Tim Hardaway":        "Tim Hardaway Sr.",
+    "Rip Hamilton":        "Richard Hamilton",
+    "Tom Heinsohn":        "Tommy Heinsohn",
+    "Cliff Ray":           "Clifford Ray",
+    "Shareef Abdul-Rahim": "Shareef Abdur-Rahim",
+    "Metta World Peace":   "Ron Artest",
+    "Nene":                "Nene Hilario",
+    "Nic Claxton":         "Nicolas Claxton",
+    "Mo Cheeks":           "Maurice Cheeks",
+}
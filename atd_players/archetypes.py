@@ -0,0 +1,299 @@
+# atd_players/archetypes.py
+# ATD-strategy archetype flags used by the draft AI.
+
+BALL_DOMINANT: set[str] = {
+    "Michael Jordan", "Kobe Bryant", "LeBron James", "Magic Johnson",
+    "Oscar Robertson", "Allen Iverson", "Russell Westbrook", "James Harden",
+    "Carmelo Anthony", "Isiah Thomas", "Pete Maravich",
+    "Damian Lillard", "Trae Young", "Luka Doncic",
+    "Dwyane Wade", "Tiny Archibald", "Ja Morant", "John Wall", "Derrick Rose",
+    "Giannis Antetokounmpo", "Tracy McGrady", "Penny Hardaway",
+    "Gilbert Arenas", "Baron Davis",
+    # Isolation-first wings who need the ball to generate offense
+    "Dominique Wilkins", "Elgin Baylor", "Tracy McGrady",
+    # High-usage guards who dominate the ball — can't easily share with another ball-dominant PG
+    "Darius Garland", "De'Aaron Fox", "Kyrie Irving", "LaMelo Ball",
+    "Tyrese Maxey", "Kemba Walker", "Stephen Curry",
+    "Shai Gilgeous-Alexander", "Cade Cunningham", "Zach LaVine",
+}
+
+# ── Shot creators / go-to scorers ────────────────────────────────────────────
+# Players who can reliably create their own shot and score at a high clip —
+# the "go-to guy" concept. Every team needs at least one.
+# Broader than BALL_DOMINANT: includes prolific wing/big scorers who aren't
+# necessarily full-time ball-handlers (Gervin, Kawhi, Dirk, Carmelo, etc.).
+SHOT_CREATORS: set[str] = {
+    # Elite ball-dominant creators (Tier 1-2)
+    "Michael Jordan", "Kobe Bryant", "LeBron James", "Magic Johnson",
+    "Oscar Robertson", "Allen Iverson", "Russell Westbrook", "James Harden",
+    "Carmelo Anthony", "Isiah Thomas", "Damian Lillard", "Trae Young",
+    "Luka Doncic", "Dwyane Wade", "Ja Morant", "John Wall", "Derrick Rose",
+    "Giannis Antetokounmpo", "Tracy McGrady", "Penny Hardaway",
+    "Gilbert Arenas", "Tiny Archibald",
+    "Kevin Durant", "Kawhi Leonard", "Stephen Curry", "Dirk Nowitzki",
+    "Charles Barkley", "Karl Malone", "Hakeem Olajuwon", "Shaquille O'Neal",
+    "Kareem Abdul-Jabbar", "Wilt Chamberlain",
+    "Julius Erving", "Elgin Baylor", "Rick Barry", "George Gervin",
+    "Dominique Wilkins", "Clyde Drexler", "Paul Pierce", "Vince Carter", "Jerry West",
+    "Shai Gilgeous-Alexander", "Anthony Davis", "Joel Embiid", "Nikola Jokic",
+    "Jayson Tatum", "Anthony Edwards", "Devin Booker", "Donovan Mitchell",
+    "Bradley Beal", "Mitch Richmond", "Kyrie Irving",
+    "Bob McAdoo", "Alex English", "Bernard King", "David Thompson",
+    "Moses Malone", "David Robinson", "Patrick Ewing",
+    "LaMarcus Aldridge", "Kevin Johnson", "Brandon Roy", "Jalen Williams",
+    "Deron Williams", "Shawn Kemp", "Kemba Walker", "Jamal Murray", "Jaylen Brown", "Manu Ginobili",
+    "Paul George", "Jimmy Butler", "Cade Cunningham",
+    "Pascal Siakam", "Brandon Ingram", "Zion Williamson", "James Worthy",
+    "Rashard Lewis", "Joe Johnson", "Jamal Mashburn", "Reggie Lewis", "Reggie Miller", "Ray Allen",
+    # Tier 3+ self-creators — break down defense off the dribble / post
+    "Marques Johnson", "Victor Oladipo", "Jalen Brunson",
+    "Danny Granger", "Chris Webber", "Desmond Bane", "Michael Finley",
+    "Blake Griffin", "Chet Walker", "Kiki VanDeWeghe", "Connie Hawkins",
+    "Walter Davis", "Steve Smith", "Michael Redd", "Billy Cunningham",
+    "Glen Rice", "Tony Parker", "Dale Ellis", "Detlef Schrempf",
+    "Isaiah Thomas", "Jason Terry", "Zach LaVine", "LaMelo Ball",
+    "Hedo Turkoglu",
+}
+
+# ── Three-point / spot-up shooters ──────────────────────────────────────────
+# AI gives a bonus to these when the team lacks spacing.
+SHOOTERS: set[str] = {
+    "Stephen Curry", "Ray Allen", "Reggie Miller", "Klay Thompson",
+    "Jerry West", "Steve Nash", "Mark Price", "Joe Dumars", "Sam Jones",
+    "Tim Hardaway Sr.", "Gilbert Arenas", "Chris Paul", "James Harden",
+    "Kyrie Irving", "John Stockton", "Damian Lillard", "Deron Williams",
+    "Chauncey Billups", "Mitch Richmond", "Devin Booker", "Bradley Beal",
+    "Donovan Mitchell", "Trae Young", "Tyrese Haliburton", "Jalen Brunson",
+    "Mike Conley", "Kyle Lowry", "Fred VanVleet", "Kemba Walker",
+    "Jamal Murray", "Goran Dragic", "Darius Garland", "Isaiah Thomas",
+    "Sleepy Floyd", "Sam Cassell", "Terry Porter", "Scott Wedman",
+    "Byron Scott", "Jeff Hornacek", "Hersey Hawkins", "Rolando Blackman",
+    "Dell Curry", "Steve Smith", "Michael Finley", "Richard Hamilton",
+    "Joe Johnson", "Michael Redd", "Hedo Turkoglu", "Eddie Jones",
+    "Derek Harper", "Doug Christie", "Gary Harris", "Brent Barry",
+    "Kirk Hinrich", "Dick Van Arsdale", "Bobby Phills", "Drazen Petrovic",
+    "Dale Ellis", "Glen Rice", "LaMelo Ball", "Lonzo Ball",
+    "Malcolm Brogdon", "Derrick White", "Desmond Bane", "Jamal Mashburn",
+    "Kiki VanDeWeghe", "Wesley Matthews", "Wesley Person", "George Hill",
+    "Victor Oladipo", "Brandon Roy", "Josh Howard", "Luol Deng",
+    "Larry Bird", "Kevin Durant", "Paul George", "Kawhi Leonard",
+    "Vince Carter", "Manu Ginobili", "Paul Pierce", "John Havlicek",
+    "Carmelo Anthony", "Tracy McGrady", "Penny Hardaway",
+    "Chris Mullin", "Rashard Lewis", "Dan Majerle", "Peja Stojakovic",
+    "Jayson Tatum", "Jaylen Brown", "Andrew Wiggins", "Anthony Edwards",
+    "Zach LaVine", "Toni Kukoc", "Detlef Schrempf", "Robert Horry",
+    "Shane Battier", "Michael Cooper", "Danny Green", "Mikal Bridges",
+    "OG Anunoby", "Danny Granger", "Robert Covington", "Gordon Hayward",
+    "Brandon Ingram", "Michael Porter Jr.", "Herb Jones", "Joe Ingles",
+    "Nicolas Batum", "Rasheed Wallace", "Khris Middleton", "Aaron Gordon",
+    "Jalen Williams", "Sam Perkins",
+    "Dirk Nowitzki", "Luka Doncic", "Joel Embiid", "Bob McAdoo",
+    "Karl-Anthony Towns", "Kevin Love", "Lauri Markkanen", "Al Horford",
+    "Paul Millsap", "Evan Mobley", "Pascal Siakam", "Jaren Jackson Jr.",
+    "Chet Holmgren", "Brook Lopez", "J.J. Redick", "Mike Miller", "Kyle Korver",
+    "Tyrese Haliburton", "LaMelo Ball", "Jalen Williams",
+}
+
+HIGH_PORTABILITY: set[str] = {
+    "Ray Allen", "Reggie Miller", "Klay Thompson", "Scottie Pippen", "Tim Duncan", "Kevin Garnett",
+    "Dirk Nowitzki", "Paul Pierce", "Shaquille O'Neal",
+    "Kawhi Leonard", "Draymond Green", "Jimmy Butler", "Jrue Holiday",
+    "Andre Iguodala", "John Stockton", "Chauncey Billups", "Joe Dumars", "Jason Kidd",
+    "Nikola Jokic", "Pascal Siakam"
+}
+
+# ── Non-scoring / defensive specialists ──────────────────────────────────────
+# Players whose value is primarily defense/rebounding/passing — not scoring.
+# Drafting two of these (regardless of position) leaves the bench without a
+# scoring punch. The AI penalises a second non-scorer on the same team.
+NON_SCORING_BIGS: set[str] = {
+    # Defensive bigs
+    "Draymond Green", "Ben Wallace", "Dennis Rodman", "Dikembe Mutombo",
+    "Rudy Gobert", "Joakim Noah", "Horace Grant", "Bill Walton", "Evan Mobley",
+    "Marc Gasol", "Al Horford", "Robert Parish", "Dave Cowens", "Jaren Jackson Jr.",
+    "Chet Holmgren", "Bobby Jones", "Paul Millsap", "Bam Adebayo", "Artis Gilmore",
+    "Andrew Bogut", "Sam Lacey", "Arvydas Sabonis", "Bo Outlaw", "Brook Lopez",
+    "Robert Williams", "Tyson Chandler", "Andrew Bogut", "Jarrett Allen",
+    # Non-scoring wings/forwards
+    "Shawn Marion",
+    # Defensive wing / guard specialists (non-scorers)
+    "Ron Artest", "Alex Caruso", "Marcus Smart", "Andre Iguodala",
+    "Michael Cooper", "Shane Battier", "Danny Green", "Herb Jones",
+    "Mikal Bridges", "OG Anunoby", "Jaden McDaniels",
+    "Derek Harper", "Jerome Kersey", "Tayshaun Prince", "Bruce Bowen",
+    "Luol Deng", "Tony Allen", "Patrick Beverley", "Alec Burks",
+    "Rodney McCray", "Paul Pressey", "Quinn Buckner", "Maurice Cheeks",
+}
+
+# ── Soft bigs ─────────────────────────────────────────────────────────────────
+# Offensive-first PF/C who lack the defensive anchor ability.
+# Two soft bigs together = no rim protection, no defensive identity in the frontcourt.
+# A soft big next to an immobile center is especially damaging.
+SOFT_BIGS: set[str] = {
+    "Karl-Anthony Towns", "Zion Williamson", "Chris Bosh",
+    "Pau Gasol", "LaMarcus Aldridge", "Amar'e Stoudemire",
+    "Bob McAdoo", "Dan Issel", "Walt Bellamy", "Bob Boozer",
+    "Antawn Jamison", "Chris Webber", "Larry Kenon", "Shaquille O'Neal", "Nikola Jokic",
+    "Moses Malone", "Bob Lanier", "Kevin Love", "Lauri Markkanen", "David West", "Blake Griffin",
+    "Brad Daugherty", "Bob Pettit", "Vlade Divac", "Yao Ming", "Brad Miller", 
+}
+
+# ── Immobile centers ──────────────────────────────────────────────────────────
+# Traditional bigs who dominate in the paint but can't guard the perimeter or
+# cover for a soft PF. Pairing with a soft big = no defensive identity at all.
+IMMOBILE_CENTERS: set[str] = {
+    "Karl-Anthony Towns", "Zion Williamson", "Chris Bosh",
+    "Pau Gasol", "LaMarcus Aldridge", "Amar'e Stoudemire",
+    "Bob McAdoo", "Dan Issel", "Walt Bellamy", "Bob Boozer",
+    "Antawn Jamison", "Chris Webber", "Larry Kenon", "Shaquille O'Neal", "Nikola Jokic",
+    "Moses Malone", "Bob Lanier", "Kevin Love", "Lauri Markkanen", "David West", "Blake Griffin",
+    "Brad Daugherty", "Bob Pettit", "Vlade Divac", "Yao Ming", "Brad Miller", 
+    "Shaquille O'Neal", "Dwight Howard","Artis Gilmore",
+    "Bob Lanier"
+}
+
+# ── Versatile defenders ───────────────────────────────────────────────────────
+# Mobile, multi-positional defenders who can cover for immobile centers and
+# soft bigs — the Larry Nance / Kirilenko / Marion type.
+# The AI actively seeks these out when the frontcourt needs defensive help.
+VERSATILE_DEFENDERS: set[str] = {
+    "Kevin Garnett", "Scottie Pippen", "Kawhi Leonard", "Draymond Green",
+    "Shawn Marion", "Andrei Kirilenko", "Bobby Jones", "Larry Nance Sr.",
+    "Evan Mobley", "Anthony Davis", "Pascal Siakam", 
+    "Paul George", "Jimmy Butler", "Dennis Rodman", "Dave DeBusschere",
+    "Horace Grant", "Andre Iguodala", "Luol Deng",
+    "Ben Wallace", "Victor Wembanyama", "Tim Duncan",
+}
+
+# ── Good-to-elite perimeter defenders ────────────────────────────────────────
+# Guards and wings who can credibly guard the perimeter.
+# Used to detect weak defensive backcourts: if 2+ of the starting PG/SG/SF
+# are NOT on this list, the team needs defensive compensation via the frontcourt
+# and bench.
+PERIMETER_DEFENDERS: set[str] = {
+    # Elite guard defenders
+    "Michael Jordan", "Jerry West", "Kobe Bryant", "Dwyane Wade",
+    "Shai Gilgeous-Alexander", "Chris Paul", "Oscar Robertson",
+    "Walt Frazier", "Manu Ginobili", "Chauncey Billups",
+    "Sidney Moncrief", "Terry Porter", "Kyle Lowry", "Jason Kidd",
+    "Russell Westbrook", "Joe Dumars", "Gary Payton", "Victor Oladipo",
+    "John Stockton", "Mike Conley", "Jrue Holiday", "Michael Cooper",
+    "Derek Harper", "Paul Pressey", "Derrick White", "Baron Davis",
+    "Gus Williams", "Dennis Johnson", "Ron Harper", "Cade Cunningham",
+    "George Hill", "Lonzo Ball", "John Wall", "Maurice Cheeks",
+    "Kirk Hinrich", "Marcus Smart", "Alex Caruso", "Mookie Blaylock",
+    "Nate McMillan", "Brian Taylor", "Phil Smith", "Amen Thompson",
+    # Wing and forward perimeter defenders
+    "Kawhi Leonard", "Paul George", "Jimmy Butler", "Paul Pierce",
+    "John Havlicek", "Vince Carter", "Klay Thompson", "Eddie Jones",
+    "Jaylen Brown", "Andre Iguodala", "Dan Majerle", "Jalen Williams",
+    "Mikal Bridges", "Doug Christie", "Danny Green", "Reggie Lewis",
+    "Nicolas Batum", "Latrell Sprewell", "Wesley Matthews", "Bobby Phills",
+    "Andrew Wiggins", "Josh Howard", "Scott Wedman", "Gary Harris",
+    "Herb Jones", "Jerry Sloan", "Caron Butler", "Dorian Finney-Smith",
+    "Trey Murphy",
+}
+
+# ── Elite rim protectors ──────────────────────────────────────────────────────
+# Shot-blockers and defensive anchors who protect the paint.
+# Every team needs at least one — if none are on the roster by round 5,
+# the AI will actively seek one out.
+ELITE_RIM_PROTECTORS: set[str] = {
+    "Bill Russell", "Hakeem Olajuwon", "Kevin Garnett", "Tim Duncan",
+    "Dikembe Mutombo", "Rudy Gobert", "Anthony Davis", "Victor Wembanyama",
+    "Ben Wallace", "David Robinson", "Alonzo Mourning", "Joel Embiid",
+    "Patrick Ewing", "Nate Thurmond", "Wes Unseld", "Artis Gilmore",
+    "Dwight Howard", "Joakim Noah", "Evan Mobley", "Giannis Antetokounmpo",
+    "Kareem Abdul-Jabbar",
+    "Wilt Chamberlain", "Bill Walton", "Shawn Kemp", "Willis Reed",
+    "Jaren Jackson Jr.", "Chet Holmgren", "Jack Sikma", "Tyson Chandler",
+    "Jarrett Allen", "Andrew Bogut", "Jermaine O'Neal",
+    "Robert Williams", "Serge Ibaka", 
+}
+
+
+# ── Do-Not-Draft list ─────────────────────────────────────────────────────────
+# Players who are rock-bottom priority — the AI should essentially never pick them.
+# A very large ADP penalty is applied in ai_drafter.py for any player in this set.
+DO_NOT_DRAFT: set[str] = {
+    "Duncan Robinson", "Anthony Parker", "Tony Allen", "Gary Payton II",
+    "Bruce Bowen", "Danilo Gallinari", "Myles Turner", "John Collins",
+    "John Salley", "Phil Chenier", "Pete Maravich", "Rodney McCray",
+    "Walt Bellamy", "Paul Silas", "Trey Murphy",
+    "Andrew Bynum", "Larry Johnson", "Kevin Martin", "Joe Harris",
+    "Micheal Ray Richardson", "Ben Simmons", "James Silas", 
+    "Darryl Dawkins", "Greg Ballard", "Kendall Gill", "Jim Paxson",
+    "Bob Cousy", "Derrick Coleman", "Andre Roberson", "Mickey Johnson",
+    "Quinn Buckner", "Tom Chambers", "Nick Anderson", "Lonnie Shelton",
+    "Mo Williams", "Clint Capela", "Jusuf Nurkic", "Cedric Maxwell",
+    "Tom Boerwinkle", "Richie Guerin", "Buddy Hield",
+     "Danny Manning", "Norm Van Lier", "Archie Clark",
+    "Jalen Rose", "Jameer Nelson", "Mark Aguirre", "Jonathan Isaac",
+    "DeMarre Carroll", "Arron Afflalo", "Mark Eaton", "John Starks",
+    "Joe Caldwell", "Billy Knight", "DeAndre Jordan", "Marvin Williams",
+    "Chuck Person", "Derek Anderson", "Zydrunas Ilgauskas", "Glenn Robinson",
+    "Nikola Vucevic", "DeMarcus Cousins", "Charlie Ward", "Hot Rod Williams",
+    "Donyell Marshall", "Ricky Pierce", "Maurice Lucas", "Adrian Dantley",
+    "Antawn Jamison", "Stephon Marbury", "Carlos Boozer", "Dana Barros",
+    "World B. Free", "George McGinnis", "Dolph Schayes", "Sean Elliott",
+    "DeMar DeRozan", "Ryan Anderson", "Avery Bradley", "Zach Randolph",
+    "Andre Miller", "Larry Hughes", "Bill Sharman", "Earl Monroe",
+    "Ty Lawson", "Dan Issel", "Xavier McDaniel", "Ricky Rubio",
+    "Mike Dunleavy", "Raef LaFrentz", "Spencer Haywood", "Channing Frye",
+    "Zelmo Beaty", "Dave Bing", "Shareef Abdur-Rahim", "Ben Gordon",
+    "Calvin Murphy", "Lenny Wilkens", "Maurice Stokes", "Micheal Williams",
+    "Jose Calderon", "Jack Twyman", "Bill Bridges", "Dell Curry",
+    "Wil Jones", "Bobby Simmons", "Mel Daniels", "Terry Mills",
+    "Bill Cartwright", "Eddie Johnson", "Charles Oakley", "KC Jones",
+    "Tom Sanders", "Calvin Natt", "Ray Williams", "Mehmet Okur",
+    "Rik Smits", "Brian Winters", "JoJo White", "Mychal Thompson",
+    "Rudy Tomjanovich", "Jay Vincent", "Vin Baker", "Andrew Toney",
+    "Lucius Allen", "Paul Arizin", "Wally Szczerbiak", "Doug Collins",
+    "Tom Gola", "Thabo Sefolosha",
+}
+
+
+# ── Elite playmakers / floor generals ────────────────────────────────────────
+# Players who elevate the offense and make good offensive players around them better.
+# Some are pass-first (Nash, Stockton, Kidd), others are ball-dominant (LeBron, Magic).
+# The common thread: elite court vision, decision-making, and ability to organise an offense.
+ELITE_PLAYMAKERS: set[str] = {
+    "Magic Johnson", "Chris Paul", "Steve Nash", "John Stockton",
+    "Jason Kidd", "Oscar Robertson", "Isiah Thomas", "LeBron James",
+    "Nikola Jokic",
+}
+
+# ── PnR creators ─────────────────────────────────────────────────────────────
+# Guards and wings who use pick-and-roll as a primary weapon.
+# These players need a C/PF who can screen and finish at the rim or pop for a
+# jumper. Without a scoring big, this part of their offense is neutralised.
+PNR_CREATORS: set[str] = {
+    # Pass-first playmakers — ran deadly PnR systems
+    "Magic Johnson", "Chris Paul", "Steve Nash", "John Stockton",
+    "Jason Kidd", "Oscar Robertson", "Isiah Thomas",
+    "James Harden", "Luka Doncic", "Damian Lillard",
+    "Shai Gilgeous-Alexander", "Russell Westbrook",
+    "Allen Iverson", "Dwyane Wade", "Trae Young", "Ja Morant",
+    "Penny Hardaway", "Gilbert Arenas", "Baron Davis",
+    "Deron Williams", "Gary Payton", "Derrick Rose",
+    "John Wall", "Kemba Walker", "LeBron James", "Giannis Antetokounmpo","Chauncey Billups",
+    "Mark Price", "Tyrese Haliburton", "Jalen Brunson", "Mike Conley", "Kyle Lowry", "Fred VanVleet",
+     "Jamal Murray", "Goran Dragic", "Darius Garland", "Isaiah Thomas", "Sleepy Floyd", "Sam Cassell", "Terry Porter",
+}
+
+# Archetype name, as stored in players.json → the players who have it
+ARCHETYPES: dict[str, set[str]] = {
+    "ball_dominant":       BALL_DOMINANT,
+    "shot_creator":        SHOT_CREATORS,
+    "shooter":             SHOOTERS,
+    "high_portability":    HIGH_PORTABILITY,
+    "non_scoring_big":     NON_SCORING_BIGS,
+    "soft_big":            SOFT_BIGS,
+    "immobile_center":     IMMOBILE_CENTERS,
+    "versatile_defender":  VERSATILE_DEFENDERS,
+    "perimeter_defender":  PERIMETER_DEFENDERS,
+    "elite_rim_protector": ELITE_RIM_PROTECTORS,
+    "elite_playmaker":     ELITE_PLAYMAKERS,
+    "pnr_creator":         PNR_CREATORS,
+    "do_not_draft":        DO_NOT_DRAFT,
+}
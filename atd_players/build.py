@@ -0,0 +1,161 @@
+# atd_players/build.py
+# Compile the tables in this package into players.json and copy it, with the
+# player_meta.py loader, into every bot that uses them.
+#
+#   python -m atd_players.build            rebuild and copy
+#   python -m atd_players.build --check    exit 1 if anything is out of date
+#
+# Run from the repo root. Names in every table are resolved to one canonical
+# player (through ALIASES, then by normalized spelling), so a table may use any
+# spelling — but two entries for the same player with different values in one
+# table are an error, as are unknown positions or archetypes.
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from atd_players.adp import PLAYER_ADP
+from atd_players.aliases import ALIASES
+from atd_players.archetypes import ARCHETYPES
+from atd_players.player_meta import normalize, split_positions
+from atd_players.positions import DRAFT_POSITIONS, PLAYER_POSITIONS
+from atd_players.tiers import PLAYER_TIERS
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ROOT = os.path.dirname(_HERE)
+
+ARTIFACT = "players.json"
+LOADER   = "player_meta.py"
+TARGETS  = ("ATD Draft Bot", "ATD Team Sheet Bot")   # bots that ship a copy
+
+
+class _Resolver:
+    """Canonical spelling for every name, fixed by the first table that lists the player."""
+
+    def __init__(self):
+        self.canonical: dict[str, str] = {}   # normalized → canonical spelling
+        self.aliases = {normalize(a): normalize(n) for a, n in ALIASES.items()}
+
+    def __call__(self, name: str) -> str:
+        key = normalize(name)
+        key = self.aliases.get(key, key)
+        return self.canonical.setdefault(key, ALIASES.get(name, name))
+
+
+def compile_players() -> dict:
+    """Merge every table into the players.json structure. Raises SystemExit on bad data."""
+    problems: list[str] = []
+    resolve = _Resolver()
+    players: dict[str, dict] = {}
+
+    for alias, name in ALIASES.items():
+        if normalize(alias) == normalize(name):
+            problems.append(f"alias {alias!r} only differs from {name!r} in spelling — not needed")
+        if name in ALIASES:
+            problems.append(f"alias {alias!r} points at another alias {name!r}")
+
+    def put(table: str, name: str, field: str, value) -> None:
+        rec = players.setdefault(resolve(name), {})
+        if field in rec and rec[field] != value:
+            problems.append(f"{table}: {name!r} listed twice as {rec[field]!r} and {value!r}")
+        rec[field] = value
+
+    # Table order fixes player order: tiers first, like the AI's tables always were
+    for name, tier in PLAYER_TIERS.items():
+        if not 1 <= tier <= 10:
+            problems.append(f"tiers: {name!r} has tier {tier} (1-10)")
+        put("tiers", name, "tier", tier)
+    for name, pos in PLAYER_POSITIONS.items():
+        parsed = split_positions(pos)
+        if not parsed or len(parsed) != len([t for t in pos.split("/") if t.strip()]):
+            problems.append(f"positions: {name!r} has bad positions {pos!r}")
+        put("positions", name, "pos", "/".join(parsed))
+    for name, pos in DRAFT_POSITIONS.items():
+        rec = players.get(resolve(name))
+        if rec is None or "pos" not in rec:
+            problems.append(f"draft positions: {name!r} is not in PLAYER_POSITIONS")
+            continue
+        parsed = "/".join(split_positions(pos))
+        if parsed == rec["pos"]:
+            problems.append(f"draft positions: {name!r} is the same as PLAYER_POSITIONS — not needed")
+        put("draft positions", name, "draft_pos", parsed)
+    for arch, names in ARCHETYPES.items():
+        for name in sorted(names):   # sets: sort so the output doesn't depend on hash order
+            rec = players.setdefault(resolve(name), {})
+            if arch not in rec.setdefault("arch", []):
+                rec["arch"].append(arch)
+    for name, adp in PLAYER_ADP.items():
+        put("adp", name, "adp", adp)
+    aliases = {a: resolve(n) for a, n in ALIASES.items()}
+    problems += [f"alias {a!r} points at {n!r}, who is in no table" for a, n in aliases.items() if n not in players]
+
+    if problems:
+        raise SystemExit("players.json not built:\n  " + "\n  ".join(problems))
+
+    order = list(ARCHETYPES)
+    for rec in players.values():
+        if "arch" in rec:
+            rec["arch"].sort(key=order.index)
+    digest = hashlib.sha1(json.dumps([players, aliases], sort_keys=True).encode())
+    return {"version": digest.hexdigest()[:12], "archetypes": order,
+            "aliases": aliases, "players": players}
+
+
+def render(data: dict) -> str:
+    """players.json text: one player per line, so changes diff cleanly."""
+    compact = lambda v: json.dumps(v, ensure_ascii=False, separators=(",", ":"))
+    rows = ",\n".join(f"  {compact(name)}:{compact(rec)}" for name, rec in data["players"].items())
+    return (
+        "{\n"
+        f'"version":{compact(data["version"])},\n'
+        f'"archetypes":{compact(data["archetypes"])},\n'
+        f'"aliases":{compact(data["aliases"])},\n'
+        f'"players":{{\n{rows}\n}}\n'
+        "}\n"
+    )
+
+
+def _outputs(text: str) -> dict[str, str]:
+    """Every file the build owns → its expected contents."""
+    with open(os.path.join(_HERE, LOADER), encoding="utf-8") as f:
+        loader = f.read()
+    out = {os.path.join(_HERE, ARTIFACT): text}
+    for target in TARGETS:
+        out[os.path.join(_ROOT, target, ARTIFACT)] = text
+        out[os.path.join(_ROOT, target, LOADER)] = loader
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile players.json and copy it into the bots.")
+    parser.add_argument("--check", action="store_true", help="report stale files instead of writing them")
+    args = parser.parse_args()
+
+    data = compile_players()
+    stale = []
+    for path, text in _outputs(render(data)).items():
+        try:
+            with open(path, encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current == text:
+            continue
+        stale.append(os.path.relpath(path, _ROOT))
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+    if args.check:
+        if stale:
+            sys.exit("Out of date — run `python -m atd_players.build`:\n  " + "\n  ".join(stale))
+        print(f"players.json {data['version']} is up to date ({len(data['players'])} players)")
+    else:
+        print(f"players.json {data['version']}: {len(data['players'])} players, "
+              f"{len(data['aliases'])} aliases — wrote {len(stale)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# player_meta.py
+# Shared player metadata: positions, tiers, archetypes, ADP and aliases.
+#
+# The master copy of this file and its players.json live in atd_players/ at the
+# repo root. `python -m atd_players.build` compiles players.json from the tables
+# there and copies both files into every bot that uses them — edit them there,
+# not in a bot's copy.
+#
+# load() reads players.json once, in a few milliseconds, into a PlayerDB. Every
+# lookup goes through one normalized index (lowercase, accents and punctuation
+# stripped), so "Shaquille O'Neal", "shaquille oneal" and "Karl Anthony-Towns"
+# all resolve, and aliases ("Rip Hamilton") map to the canonical player.
+
+import json
+import os
+import re
+import unicodedata
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+POSITIONS = ("PG", "SG", "SF", "PF", "C")
+
+_DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "players.json")
+
+
+def normalize(name: str) -> str:
+    """Lowercase, drop accents and punctuation, collapse whitespace."""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(c for c in name if not unicodedata.combining(c)).lower()
+    name = re.sub(r"['’.]", "", name)
+    name = re.sub(r"[^a-z0-9]+", " ", name)
+    return name.strip()
+
+
+def split_positions(pos: str) -> tuple[str, ...]:
+    """"PG/sg/" → ('PG', 'SG'): listed order, unknown tokens dropped."""
+    return tuple(p for p in (t.strip().upper() for t in pos.split("/")) if p in POSITIONS)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerMeta:
+    name:            str                 # canonical spelling
+    positions:       tuple[str, ...]     # every position they can be listed at, preferred first
+    draft_positions: tuple[str, ...]     # where the draft AI slots them (often narrower)
+    tier:            int | None          # 1-10 (1 = best); None if unrated
+    archetypes:      frozenset[str]      # e.g. {"ball_dominant", "shooter"}
+    adp:             float | None        # reference ADP; None if unranked
+
+
+class PlayerDB:
+    def __init__(self, data: dict):
+        self.version: str = data["version"]
+        self.archetypes: tuple[str, ...] = tuple(data["archetypes"])
+        self.aliases: dict[str, str] = data["aliases"]
+        self.players: dict[str, PlayerMeta] = {}   # canonical name → meta, in table order
+        self._index: dict[str, PlayerMeta] = {}    # normalized name or alias → meta
+        for name, rec in data["players"].items():
+            pos = split_positions(rec.get("pos", ""))
+            meta = PlayerMeta(
+                name=name,
+                positions=pos,
+                draft_positions=split_positions(rec["draft_pos"]) if "draft_pos" in rec else pos,
+                tier=rec.get("tier"),
+                archetypes=frozenset(rec.get("arch", ())),
+                adp=rec.get("adp"),
+            )
+            self.players[name] = meta
+            self._index[normalize(name)] = meta
+        for alias, name in self.aliases.items():
+            self._index[normalize(alias)] = self.players[name]
+
+    def get(self, name: str) -> PlayerMeta | None:
+        """The player a name (any spelling or alias) refers to, or None if unknown."""
+        return self._index.get(normalize(name))
+
+    def index(self) -> dict[str, PlayerMeta]:
+        """Normalized name → player, aliases included. Read-only."""
+        return self._index
+
+    def __iter__(self) -> Iterator[PlayerMeta]:
+        return iter(self.players.values())
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and normalize(name) in self._index
+
+    def __repr__(self) -> str:
+        return f"PlayerDB({len(self.players)} players, version={self.version})"
+
+
+def load(path: str = _DEFAULT_PATH) -> PlayerDB:
+    """Read a compiled players.json (by default the one next to this file)."""
+    with open(path, encoding="utf-8") as f:
+        return PlayerDB(json.load(f))
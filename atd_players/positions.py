@@ -1,8 +1,11 @@
-PLAYER_POSITIONS = {
+# atd_players/positions.py
+# Every position each player can be listed at on a team sheet (e.g. "PG/SG"),
+# in order of preference.
+
+PLAYER_POSITIONS: dict[str, str] = {
     # ── Point Guards 
     "Magic Johnson":             "PG/SF/PF",
     "Tony Parker":               "PG",
-    "Tim Hardaway":              "PG",
     "Stephen Curry":             "PG/SG",
     "Chris Paul":                "PG",
     "Steve Nash":                "PG",
@@ -96,7 +99,6 @@ PLAYER_POSITIONS = {
     "James Harden":              "PG/SG",
     "Tracy McGrady":             "SG/SF/PG",
     "Richard Hamilton":          "SG/SF",
-    "Rip Hamilton":              "SG/SF",
     "Danny Green":               "SG/SF",
     "Clyde Drexler":             "SG/SF",
     "Reggie Miller":             "SG",
@@ -283,7 +285,7 @@ PLAYER_POSITIONS = {
     "Joakim Noah":               "C",
     "Derrick Coleman":           "PF/C",
     "Anthony Mason":             "PF/SF",
-    "Shareef Abdul-Rahim":       "PF/SF",
+    "Shareef Abdur-Rahim":       "PF/SF",
     "Antawn Jamison":            "PF/SF",
     "Tom Chambers":              "PF/SF",
     "Andrei Kirilenko":          "PF/SF",
@@ -364,7 +366,7 @@ PLAYER_POSITIONS = {
     "Maurice Lucas":             "PF/C",
     "Spencer Haywood":           "PF/C",
     "Paul Silas":                "PF/C",
-    "Tom Heinsohn":              "PF/SF",
+    "Tommy Heinsohn":            "PF/SF",
     "Jack Sikma":                "C/PF",
     "Bill Bridges":              "PF/C",
     "Mel Daniels":               "C",
@@ -379,7 +381,6 @@ PLAYER_POSITIONS = {
     "Alperen Sengun":            "C",
     "Shaquille O'Neal":          "C",
     "Kareem Abdul-Jabbar":       "C",
-    "Kareem Abdul Jabbar":       "C",
     "Hakeem Olajuwon":           "C",
     "Wilt Chamberlain":          "C",
     "Bill Russell":              "C",
@@ -434,7 +435,6 @@ PLAYER_POSITIONS = {
     "Marcus Camby":              "C/PF",
     "Theo Ratliff":              "C",
     "Darryl Dawkins":            "C",
-    "Cliff Ray":                 "C",
     "Zelmo Beaty":               "C",
     "Tom Boerwinkle":            "C",
     "Jerry Lucas":               "C/PF",
@@ -455,9 +455,6 @@ PLAYER_POSITIONS = {
     "Anfernee Simons":           "SG/PG",
     "Jusuf Nurkic":              "C",
     "Jerami Grant":              "PF/SF",
-    "Anfernee Hardaway":         "PG/SG",
-    "Karl Anthony Towns":        "C/PF",
-    "Karl Anthony-Towns":        "C/PF",
     "Paolo Banchero":            "PF/SF",
     "Danny Manning":             "PF/SF",
     "Paul Pressey":              "PG/SG",
@@ -468,4 +465,106 @@ PLAYER_POSITIONS = {
     "Dylan Harper":              "PG/SG",
     "Ausar Thompson":            "SF",
     "Stephon Castle":            "PG",
-}
\ No newline at end of file
+    "Dan Issel":                 "PF/C",
+    "Adrian Dantley":            "SF",
+    "John Collins":              "PF",
+}
+
+# The draft AI slots some players more narrowly than they can be listed
+# (e.g. Magic Johnson only at PG), or not at all (""). Players not listed here
+# draft at their PLAYER_POSITIONS.
+DRAFT_POSITIONS: dict[str, str] = {
+    "Magic Johnson":            "PG",
+    "Chauncey Billups":         "PG",
+    "Penny Hardaway":           "PG/SF",
+    "Terry Porter":             "PG",
+    "Brandon Roy":              "SG",
+    "Fat Lever":                "PG",
+    "Tracy McGrady":            "SG/SF",
+    "Manu Ginobili":            "SG",
+    "Klay Thompson":            "SG",
+    "Anthony Edwards":          "SG",
+    "Devin Booker":             "SG",
+    "Zach LaVine":              "SG",
+    "Luka Doncic":              "PG/SG",
+    "Cade Cunningham":          "PG",
+    "CJ McCollum":              "SG/PG",
+    "Jalen Williams":           "SF/SG",
+    "Joe Dumars":               "SG",
+    "Rick Barry":               "SF",
+    "Michael Cooper":           "SG",
+    "Sam Jones":                "SG",
+    "Peja Stojakovic":          "SF/PF",
+    "Victor Oladipo":           "SG",
+    "Brent Barry":              "SG",
+    "Marques Johnson":          "SF",
+    "Danny Ainge":              "SG",
+    "Bobby Phills":             "SG/SF",
+    "Kentavious Caldwell-Pope": "SG",
+    "Phil Smith":               "SG",
+    "Fred Brown":               "SG",
+    "Michael Redd":             "SG/SF",
+    "Drazen Petrovic":          "SG/PG",
+    "LeBron James":             "PF/SF",
+    "Ron Artest":               "SF",
+    "Larry Bird":               "SF/PF",
+    "Jayson Tatum":             "SF/PF",
+    "Grant Hill":               "SF/PG",
+    "Luol Deng":                "SF",
+    "Nicolas Batum":            "SF/SG",
+    "James Worthy":             "SF",
+    "Elgin Baylor":             "SF",
+    "Connie Hawkins":           "PF",
+    "Hedo Turkoglu":            "SF/PF",
+    "Lamar Odom":               "PF",
+    "Michael Porter Jr.":       "SF",
+    "Amen Thompson":            "SF",
+    "Roger Brown":              "SF",
+    "Clifford Robinson":        "SF/PF",
+    "Toni Kukoc":               "SF/PF",
+    "Jamaal Wilkes":            "SF",
+    "Jalen Rose":               "SF/PF",
+    "Derrick Coleman":          "PF",
+    "Anthony Mason":            "PF",
+    "Andrei Kirilenko":         "PF",
+    "Bobby Jones":              "PF",
+    "Josh Smith":               "PF",
+    "Bob McAdoo":               "PF/C",
+    "Bernard King":             "SF",
+    "James Posey":              "SF",
+    "Dan Roundfield":           "PF",
+    "Lauri Markkanen":          "SF/PF",
+    "Karl Malone":              "PF",
+    "Dirk Nowitzki":            "PF",
+    "Charles Barkley":          "PF",
+    "Draymond Green":           "PF",
+    "Chris Webber":             "PF",
+    "Kevin Love":               "PF",
+    "Blake Griffin":            "PF",
+    "Bob Pettit":               "PF",
+    "Sam Perkins":              "PF",
+    "Antonio McDyess":          "PF",
+    "Evan Mobley":              "PF",
+    "Jack Sikma":               "C",
+    "Nene Hilario":             "C",
+    "Al Horford":               "C",
+    "Domantas Sabonis":         "C",
+    "Ralph Sampson":            "C",
+    "Bill Laimbeer":            "C",
+    "Marcus Camby":             "C",
+    "Ben Wallace":              "C",
+    "Marcus Smart":             "SG",
+    "Paul Pressey":             "SG/PG",
+    # No draft positions: these were never in the Draft Bot's position table,
+    # so the AI has always drafted them as position-less. Kept that way so its
+    # picks don't change; delete an entry to have the AI slot that player at
+    # their PLAYER_POSITIONS.
+    "Alperen Sengun":           "",
+    "Cooper Flagg":             "",
+    "Dylan Harper":             "",
+    "Jalen Duren":              "",
+    "Kon Knueppel":             "",
+    "Stephon Castle":           "",
+    "Ausar Thompson":           "",
+    "Tommy Heinsohn":           "",
+}
@@ -0,0 +1,318 @@
+# atd_players/tiers.py
+# Player tier ratings used by the draft AI.
+
+# ── Tier Ratings ────────────────────────────────────────────────────────────
+# Lower number = better. Unlisted players default to tier 11.
+# Every AI team should have at least 1 player from each tier 1-10.
+PLAYER_TIERS: dict[str, int] = {
+    # ── Tier 1 ───────────────────────────────────────────────────────────────
+    "Michael Jordan":           1,
+    "LeBron James":             1,
+    "Shaquille O'Neal":         1,
+    "Stephen Curry":            1,
+    "Kevin Garnett":            1,
+    "Larry Bird":               1,
+    "Magic Johnson":            1,
+    "Kareem Abdul-Jabbar":      1,
+    "Hakeem Olajuwon":          1,
+    "Kevin Durant":             1,
+    "Kobe Bryant":              1,
+    "Jerry West":               1,
+    "Tim Duncan":               1,
+    "Nikola Jokic":             1,
+    "Kawhi Leonard":            1,
+    "Shai Gilgeous-Alexander":  1,
+    "Dwyane Wade":              1,
+    "David Robinson":           1,
+    "Steve Nash":               1,
+    "Chris Paul":               1,
+    "Tracy McGrady":            1,
+    "Oscar Robertson":          1,
+    "Bill Walton":              1,
+    "Giannis Antetokounmpo":    1,
+    "Wilt Chamberlain":         1,
+    "Anthony Davis":            1,
+    "Joel Embiid":              1,
+    "Julius Erving":            1,
+    "Bill Russell":             1,
+    "James Harden":             1,
+    # ── Tier 2 ───────────────────────────────────────────────────────────────
+    "Karl Malone":              2,
+    "Dirk Nowitzki":            2,
+    "Grant Hill":               2,
+    "Jayson Tatum":             2,
+    "Luka Doncic":              2,
+    "Scottie Pippen":           2,
+    "Reggie Miller":            2,
+    "Draymond Green":           2,
+    "Penny Hardaway":           2,
+    "Charles Barkley":          2,
+    "Paul George":              2,
+    "Manu Ginobili":            2,
+    "Walt Frazier":             2,
+    "Clyde Drexler":            2,
+    "Bob McAdoo":               2,
+    "Jimmy Butler":             2,
+    "Victor Wembanyama":        2,
+    "Ray Allen":                2,
+    "Paul Pierce":              2,
+    "Dwight Howard":            2,
+    "Damian Lillard":           2,
+    "Mark Price":               2,
+    "John Havlicek":            2,
+    "Rick Barry":               2,
+    "Chris Mullin":             2,
+    "Sidney Moncrief":          2,
+    "Vince Carter":             2,
+    "Moses Malone":             2,
+    "Willis Reed":              2,
+    "Chauncey Billups":         2,
+    # ── Tier 3 ───────────────────────────────────────────────────────────────
+    "Patrick Ewing":            3,
+    "Jason Kidd":               3,
+    "Anthony Edwards":          3,
+    "Shawn Kemp":               3,
+    "Russell Westbrook":        3,
+    "Klay Thompson":            3,
+    "Terry Porter":             3,
+    "Marques Johnson":          3,
+    "Rasheed Wallace":          3,
+    "Brandon Roy":              3,
+    "Devin Booker":             3,
+    "Rashard Lewis":            3,
+    "Eddie Jones":              3,
+    "Tyrese Haliburton":        3,
+    "Deron Williams":           3,
+    "Kyle Lowry":               3,
+    "Larry Nance Sr.":          3,
+    "John Stockton":            3,
+    "Evan Mobley":              3,
+    "Gary Payton":              3,
+    "Peja Stojakovic":          3,
+    "George Gervin":            3,
+    "Shawn Marion":             3,
+    "Andrei Kirilenko":         3,
+    "Bobby Jones":              3,
+    "Marc Gasol":               3,
+    "Kevin Johnson":            3,
+    "Joe Dumars":               3,
+    "Alonzo Mourning":          3,
+    "Dave Cowens":              3,
+    # ── Tier 4 ───────────────────────────────────────────────────────────────
+    "Pau Gasol":                4,
+    "Victor Oladipo":           4,
+    "James Worthy":             4,
+    "Isiah Thomas":             4,
+    "Jalen Williams":           4,
+    "Jaylen Brown":             4,
+    "Kyrie Irving":             4,
+    "Mitch Richmond":           4,
+    "Andre Iguodala":           4,
+    "Khris Middleton":          4,
+    "Mike Conley":              4,
+    "Bob Lanier":               4,
+    "Dan Majerle":              4,
+    "Al Horford":               4,
+    "Chris Bosh":               4,
+    "Pascal Siakam":            4,
+    "Jrue Holiday":             4,
+    "Alex English":             4,
+    "Bam Adebayo":              4,
+    "Chet Holmgren":            4,
+    "Rudy Gobert":              4,
+    "Derrick Rose":             4,
+    "Jaren Jackson Jr.":        4,
+    "Derek Harper":             4,
+    "Bradley Beal":             4,
+    "Paul Millsap":             4,
+    "Michael Cooper":           4,
+    "Donovan Mitchell":         4,
+    "Allen Iverson":            4,
+    "Karl-Anthony Towns":       4,
+    # ── Tier 5 ───────────────────────────────────────────────────────────────
+    "Jalen Brunson":            5,
+    "Mikal Bridges":            5,
+    "Elgin Baylor":             5,
+    "Shane Battier":            5,
+    "Doug Christie":            5,
+    "Jeff Hornacek":            5,
+    "Derrick White":            5,
+    "Zion Williamson":          5,
+    "Danny Granger":            5,
+    "Horace Grant":             5,
+    "Bob Dandridge":            5,
+    "Danny Green":              5,
+    "Jack Sikma":               5,
+    "Paul Pressey":             5,
+    "Gordon Hayward":           5,
+    "Lauri Markkanen":          5,
+    "Lamar Odom":               5,
+    "Chris Webber":             5,
+    "Hersey Hawkins":           5,
+    "Sam Jones":                5,
+    "Lou Hudson":               5,
+    "Desmond Bane":             5,
+    "Kevin Love":               5,
+    "David Thompson":           5,
+    "Artis Gilmore":            5,
+    "Michael Finley":           5,
+    "Blake Griffin":            5,
+    "Dennis Rodman":            5,
+    "Baron Davis":              5,
+    "Gilbert Arenas":           5,
+    # ── Tier 6 ───────────────────────────────────────────────────────────────
+    "Kevin McHale":             6,
+    "Chet Walker":              6,
+    "Joe Johnson":              6,
+    "Kiki VanDeWeghe":          6,
+    "OG Anunoby":               6,
+    "Tim Hardaway Sr.":         6,
+    "Dominique Wilkins":        6,
+    "Cade Cunningham":          6,
+    "Ron Artest":               6,
+    "Darius Garland":           6,
+    "Richard Hamilton":         6,
+    "Connie Hawkins":           6,
+    "Walter Davis":             6,
+    "Ja Morant":                6,
+    "Hedo Turkoglu":            6,
+    "Joakim Noah":              6,
+    "Tayshaun Prince":          6,
+    "Reggie Lewis":             6,
+    "Bernard King":             6,
+    "Latrell Sprewell":         6,
+    "Ron Harper":               6,
+    "Steve Smith":              6,
+    "Robert Horry":             6,
+    "David West":               6,
+    "Kyle Korver":              6,
+    "Dennis Johnson":           6,
+    "Gus Johnson":              6,
+    "Luol Deng":                6,
+    "Nicolas Batum":            6,
+    "Goran Dragic":             6,
+    # ── Tier 7 ───────────────────────────────────────────────────────────────
+    "Alvan Adams":              7,
+    "Jamal Murray":             7,
+    "Terrell Brandon":          7,
+    "Michael Redd":             7,
+    "Wesley Matthews":          7,
+    "Billy Cunningham":         7,
+    "Sam Perkins":              7,
+    "Tyson Chandler":           7,
+    "Elton Brand":              7,
+    "Gus Williams":             7,
+    "Paul Westphal":            7,
+    "Antonio McDyess":          7,
+    "George Hill":              7,
+    "Carmelo Anthony":          7,
+    "Amar'e Stoudemire":        7,
+    "Ben Wallace":              7,
+    "Ivica Zubac":              7,
+    "Boris Diaw":               7,
+    "John Wall":                7,
+    "Dikembe Mutombo":          7,
+    "Robert Covington":         7,
+    "Dick Van Arsdale":         7,
+    "Hal Greer":                7,
+    "Bob Pettit":               7,
+    "Glen Rice":                7,
+    "Trae Young":               7,
+    "Bobby Phills":             7,
+    "Tony Parker":              7,
+    "Jamaal Wilkes":            7,
+    "Nate Thurmond":            7,
+    # ── Tier 8 ───────────────────────────────────────────────────────────────
+    "Tyrese Maxey":             8,
+    "Josh Howard":              8,
+    "Scott Wedman":             8,
+    "Josh Smith":               8,
+    "Andrew Bogut":             8,
+    "Lonzo Ball":               8,
+    "Andrew Wiggins":           8,
+    "Robert Parish":            8,
+    "Kemba Walker":             8,
+    "Sam Cassell":              8,
+    "Franz Wagner":             8,
+    "Clifford Robinson":        8,
+    "Sleepy Floyd":             8,
+    "Arvydas Sabonis":          8,
+    "Jermaine O'Neal":          8,
+    "Kirk Hinrich":             8,
+    "Kristaps Porzingis":       8,
+    "Brad Daugherty":           8,
+    "Gerald Wallace":           8,
+    "Jarrett Allen":            8,
+    "Aaron Gordon":             8,
+    "Fat Lever":                8,
+    "Maurice Cheeks":           8,
+    "Brent Barry":              8,
+    "Sam Lacey":                8,
+    "Dale Ellis":               8,
+    "Detlef Schrempf":          8,
+    "Isaiah Thomas":            8,
+    "Jason Terry":              8,
+    "Jamal Mashburn":           8,
+    # ── Tier 9 ───────────────────────────────────────────────────────────────
+    "Tiny Archibald":           9,
+    "Byron Scott":              9,
+    "Fred VanVleet":            9,
+    "De'Aaron Fox":             9,
+    "Dave DeBusschere":         9,
+    "Danny Ainge":              9,
+    "Rolando Blackman":         9,
+    "Brook Lopez":              9,
+    "Vlade Divac":              9,
+    "Zach LaVine":              9,
+    "LaMelo Ball":              9,
+    "Alex Caruso":              9,
+    "Otto Porter Jr.":          9,
+    "Brian Taylor":             9,
+    "Toni Kukoc":               9,
+    "Yao Ming":                 9,
+    "Bob Love":                 9,
+    "Isaiah Hartenstein":       9,
+    "Trevor Ariza":             9,
+    "Elvin Hayes":              9,
+    "Amen Thompson":            9,
+    "Brandon Ingram":           9,
+    "Steve Francis":            9,
+    "Roger Brown":              9,
+    "Wes Unseld":               9,
+    "Marcus Smart":             9,
+    "Wesley Person":            9,
+    "Brad Miller":              9,
+    "Michael Porter Jr.":       9,
+    "Nene Hilario":             9,
+    # ── Tier 10 ──────────────────────────────────────────────────────────────
+    "Caron Butler":             10,
+    "Jon McGlocklin":           10,
+    "Phil Smith":               10,
+    "Fred Brown":               10,
+    "Derrick Coleman":          10,
+    "Anthony Mason":            10,
+    "Dan Roundfield":           10,
+    "Gary Harris":              10,
+    "Robert Williams":          10,
+    "Richard Jefferson":        10,
+    "Malcolm Brogdon":          10,
+    "PJ Brown":                 10,
+    "Mookie Blaylock":          10,
+    "James Posey":              10,
+    "Bill Laimbeer":            10,
+    "Phil Chenier":             10,
+    "Mike Miller":              10,
+    "Mike Bibby":               10,
+    "Marcus Camby":             10,
+    "Allan Houston":            10,
+    "Ralph Sampson":            10,
+    "Rod Strickland":           10,
+    "Kerry Kittles":            10,
+    "Julius Randle":            10,
+    "Jerome Kersey":            10,
+    "Jason Richardson":         10,
+    "Jaden McDaniels":          10,
+    "Bo Outlaw":                10,
+    "Scottie Barnes":           10,
+    "Drazen Petrovic":          10,
+}